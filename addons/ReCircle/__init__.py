@@ -14,7 +14,11 @@ just park the 3D cursor there.
 
 It is all one operator, `mesh.recircle`, driven from its redo panel (F9) — and
 on the panel's defaults it does nothing at all, so you can run it, read what it
-found, and then decide.
+found, and then decide. Its companion, `mesh.recircle_detect`, scans the whole
+mesh for edge loops that are already (nearly) circles and selects or rounds
+them, for cleaning up imported CAD and scan meshes. And `mesh.recircle_preview`
+draws where a rebuild would put the verts while you scrub the count, offset and
+radius in the viewport, making the rebuild only once you confirm.
 
 This is a Blender extension (4.2+): metadata lives in blender_manifest.toml,
 so no bl_info dict is required here.
@@ -27,15 +31,42 @@ so no bl_info dict is required here.
 # add-on with Blender open is the normal case here, so it's worth the six lines.
 if "bpy" in locals():
     import importlib
-    for _name in ("geometry", "topology", "operators"):
+    for _name in ("lofting", "geometry", "topology", "cache", "profiling",
+                  "parallel", "bulk", "runs", "preview", "operators"):
         if _name in locals():
             importlib.reload(locals()[_name])
 
 import bpy
+from bpy.props import BoolProperty, StringProperty
+
+from . import (  # noqa: F401  (all imported so the reload guard above sees them)
+    lofting, geometry, topology, cache, profiling, parallel, bulk, runs,
+    preview, operators,
+)
+
+
+class RECIRCLE_AP_preferences(bpy.types.AddonPreferences):
+    bl_idname = __package__
+
+    profile: BoolProperty(
+        name="Profile Stages",
+        description="Time every stage of Re-circle and list the timings in its "
+                    "redo panel (also on with the RECIRCLE_PROFILE environment "
+                    "variable)",
+        default=False,
+    )
+    profile_path: StringProperty(
+        name="Trace File",
+        description="Also write each run's timings here as JSON (optional)",
+        subtype='FILE_PATH',
+    )
 
-from . import geometry, topology, operators   # noqa: F401  (geometry/topology
-                                              # are imported so the reload guard
-                                              # above can see them)
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "profile")
+        row = layout.row()
+        row.active = self.profile
+        row.prop(self, "profile_path")
 
 
 # The "Tim" header menu is shared across Tim's addons. Whichever addon loads
@@ -64,12 +95,19 @@ def _draw_editor_menu(self, context):
 
 
 def _menu_func(self, context):
-    # One entry, one operator: everything else lives in its redo panel (F9).
+    # Re-circle does everything from its redo panel (F9); the preview scrubs
+    # its main settings live first. Detect Circles finds the loops to feed it
+    # across the whole mesh.
     self.layout.operator(operators.MESH_OT_recircle.bl_idname, text="Re-circle")
+    self.layout.operator(operators.MESH_OT_recircle_preview.bl_idname,
+                         text="Re-circle Preview")
+    self.layout.operator(operators.MESH_OT_recircle_detect.bl_idname,
+                         text="Detect Circles")
 
 
 def register():
     global _owns_tim_menu
+    bpy.utils.register_class(RECIRCLE_AP_preferences)
     # Looked up through the module (not imported by name) so a stale reload can
     # never half-import the operator classes.
     for cls in operators.classes:
@@ -97,3 +135,5 @@ def unregister():
 
     for cls in reversed(operators.classes):
         bpy.utils.unregister_class(cls)
+    bpy.utils.unregister_class(RECIRCLE_AP_preferences)
+    cache.fits.clear()
@@ -0,0 +1,194 @@
+"""Batched creation of new geometry for Re-circle's rebuilds.
+
+Rebuilding a few hundred loops means tens of thousands of new verts, ring edges
+and bridge faces. Made one `bm.verts.new` / `bm.edges.new` / `bm.faces.new` at a
+time that's a Python-to-C round trip (plus a try/except and a duplicate check)
+per element. `GeometryBuilder` collects it all instead — new verts by position,
+faces as lists of new-vert ids and existing BMVerts — and `commit` makes it in
+one go:
+
+  * the faces are cleaned up as arrays first: any with a repeated vert are
+    dropped, and of faces over the same verts only the first is kept (the
+    "face already exists" case of `faces.new`);
+  * a big batch is written into a temporary mesh with `from_pydata`, appended
+    to the bmesh with `BMesh.from_mesh`, and the copies it needed of existing
+    verts are welded back onto the originals with `bmesh.ops.weld_verts`;
+  * a small batch, a mesh with shape keys (which `from_mesh` would have to
+    merge), or a big mesh getting comparatively little new geometry goes
+    through the plain per-element calls, where they're cheaper.
+
+Either way the result is the same geometry, with the flat shading and default
+attributes `faces.new` gives.
+"""
+
+import bmesh
+import bpy
+import numpy as np
+
+# Fewer new verts than this and the per-element calls win.
+BULK_MIN_VERTS = 2048
+# The bulk path finds its new verts again with one pass over the whole mesh;
+# past this many existing verts per new one that pass costs more than it saves.
+BULK_SCAN_RATIO = 8
+LAYER = "~recircle_build"
+
+
+def stored_coords(positions):
+    """What `coords_of` will read back once `positions` are vertex coordinates.
+
+    Blender keeps coordinates in single precision, so planning against the
+    rounded values gives the same answer as planning against the new verts.
+    """
+    return np.asarray(positions, dtype=np.float32).astype(np.float64)
+
+
+class GeometryBuilder:
+    """New verts, edges and faces for one bmesh, made together by `commit`.
+
+    New verts are referred to by the int ids `add_verts` hands out; anywhere a
+    vert is expected, an existing BMVert works too.
+    """
+    __slots__ = ("bm", "_chunks", "_co", "_count", "_edges", "_faces")
+
+    def __init__(self, bm):
+        self.bm = bm
+        self._chunks = []
+        self._co = None
+        self._count = 0
+        self._edges = []
+        self._faces = []
+
+    def add_verts(self, positions):
+        """Queue new verts at `positions` ((k, 3)); returns their ids."""
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        ids = list(range(self._count, self._count + len(positions)))
+        self._chunks.append(positions)
+        self._co = None
+        self._count += len(positions)
+        return ids
+
+    def add_ring(self, positions):
+        """Queue a closed ring of new verts and its edges; returns the ids."""
+        ids = self.add_verts(positions)
+        n = len(ids)
+        if n > 1:
+            self._edges += [(ids[i], ids[(i + 1) % n]) for i in range(n)]
+        return ids
+
+    def add_face(self, verts):
+        """Queue a face over `verts` (new-vert ids and/or BMVerts)."""
+        self._faces.append(verts)
+
+    def coords(self, verts):
+        """(N, 3) coordinates of `verts` as they will read once made."""
+        if self._co is None:
+            self._co = stored_coords(np.concatenate(self._chunks)
+                                     if self._chunks else np.zeros((0, 3)))
+        return np.array([self._co[v] if isinstance(v, int) else v.co[:]
+                         for v in verts], dtype=np.float64).reshape(-1, 3)
+
+    # ---------------------------------------------------------------- commit
+
+    def commit(self, index):
+        """Make everything queued. Returns (verts by id, new faces).
+
+        `index` (a topology.EdgeIndex) learns the ring edges on the
+        per-element path and is reset after a bulk commit, which makes edges
+        without telling it.
+        """
+        existing, faces = self._clean_faces()
+        bm = self.bm
+        bulk = (self._count >= BULK_MIN_VERTS
+                and len(bm.verts) <= BULK_SCAN_RATIO * self._count
+                and not bm.verts.layers.shape)
+        if bulk:
+            return self._commit_bulk(existing, faces, index)
+        return self._commit_each(existing, faces, index)
+
+    def _clean_faces(self):
+        """(existing verts referenced, faces as lists of batch indices).
+
+        In a face's list, new verts keep their ids and the i-th distinct
+        existing vert is `count + i`. Faces with a repeated vert, and repeats of
+        a face over the same set of verts, are dropped.
+        """
+        existing = {}
+        rows = []
+        for verts in self._faces:
+            row = []
+            for v in verts:
+                if not isinstance(v, int):
+                    v = existing.setdefault(v, self._count + len(existing))
+                row.append(v)
+            rows.append(row)
+
+        keep = np.zeros(len(rows), dtype=bool)
+        by_size = {}
+        for i, row in enumerate(rows):
+            by_size.setdefault(len(row), []).append(i)
+        for size, which in by_size.items():
+            if size < 3:
+                continue
+            which = np.asarray(which)
+            block = np.sort(np.array([rows[i] for i in which]), axis=1)
+            ok = np.all(block[:, 1:] != block[:, :-1], axis=1)
+            _, first = np.unique(block[ok], axis=0, return_index=True)
+            keep[which[np.flatnonzero(ok)[first]]] = True
+        return list(existing), [rows[i] for i in np.flatnonzero(keep)]
+
+    def _commit_each(self, existing, faces, index):
+        bm = self.bm
+        co = (np.concatenate(self._chunks) if self._chunks
+              else np.zeros((0, 3)))
+        made = [bm.verts.new(p) for p in co.tolist()]
+        for a, b in self._edges:
+            index.ensure(bm, made[a], made[b])
+        lookup = made + existing
+        new_faces = []
+        for row in faces:
+            try:
+                new_faces.append(bm.faces.new([lookup[i] for i in row]))
+            except ValueError:
+                pass  # face already exists
+        return made, new_faces
+
+    def _commit_bulk(self, existing, faces, index):
+        bm = self.bm
+        co = np.concatenate(self._chunks)
+        if existing:
+            co = np.concatenate([co, np.array([v.co[:] for v in existing],
+                                              dtype=np.float64)])
+        # Tag every vert with where it came from: new vert id + 1, or minus
+        # (1 + which existing vert it copies).
+        ids = np.zeros(len(co), dtype=np.int32)
+        ids[:self._count] = np.arange(1, self._count + 1)
+        ids[self._count:] = -np.arange(1, len(existing) + 1)
+
+        mesh = bpy.data.meshes.new(LAYER)
+        try:
+            # shade_flat: `faces.new` makes flat faces too.
+            mesh.from_pydata(co.tolist(), self._edges, faces, shade_flat=True)
+            mesh.attributes.new(LAYER, 'INT', 'POINT').data.foreach_set(
+                "value", ids)
+            # `from_mesh` only fills the layers the bmesh already has.
+            layer = bm.verts.layers.int.new(LAYER)
+            bm.from_mesh(mesh)
+        finally:
+            bpy.data.meshes.remove(mesh)
+
+        # The new verts can land in any free slot of the vertex pool, so they
+        # are found again by their tags.
+        made = [None] * self._count
+        copies = [None] * len(existing)
+        for v in bm.verts:
+            tag = v[layer]
+            if tag > 0:
+                made[tag - 1] = v
+            elif tag < 0:
+                copies[-tag - 1] = v
+        bm.verts.layers.int.remove(layer)
+        if existing:
+            bmesh.ops.weld_verts(bm, targetmap=dict(zip(copies, existing)))
+        index.reset()
+        new_faces = list(dict.fromkeys(f for v in made for f in v.link_faces))
+        return made, new_faces
@@ -0,0 +1,60 @@
+"""Redo-panel cache for Re-circle.
+
+Every tweak in the redo panel (F9) undoes and re-runs the operator from
+scratch, on a mesh that undo has put back exactly as it was. Discovering the
+selection's runs and fitting their circles is the same work every time, so it
+is kept here between runs, keyed on a hash of what it was computed from: the
+selected edges' vertex indices, those vertices' coordinates and the mesh's
+element counts. Any change to the mesh changes the key, so stale entries are
+simply never hit again and age out of the LRU.
+
+Nothing in here may hold bmesh elements — they die with the undo step. Runs
+are stored as vertex indices and fits as arrays.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+
+class LRUCache:
+    """A small least-recently-used mapping."""
+    __slots__ = ("_items", "maxsize")
+
+    def __init__(self, maxsize=8):
+        self._items = OrderedDict()
+        self.maxsize = maxsize
+
+    def get(self, key):
+        value = self._items.get(key)
+        if value is not None:
+            self._items.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
+
+
+def content_key(*arrays, extra=()):
+    """A digest of some arrays' bytes (and shapes) plus a few plain values."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(tuple(extra)).encode())
+    for a in arrays:
+        a = np.ascontiguousarray(a)
+        h.update(repr((a.dtype.str, a.shape)).encode())
+        h.update(a.tobytes())
+    return h.digest()
+
+
+# Selection runs and fits, see operators.fit_selection.
+fits = LRUCache(maxsize=8)
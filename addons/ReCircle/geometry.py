@@ -1,8 +1,9 @@
 """Pure geometry helpers for the Re-circle add-on.
 
 Nothing here touches bmesh; everything works on plain sequences of
-`mathutils.Vector` (or 3-tuples) so it can be reasoned about (and tested) on
-its own. The bmesh/topology walking lives in topology.py and operators.py.
+`mathutils.Vector` (or 3-tuples, or (N, 3) NumPy arrays) so it can be
+reasoned about (and tested) on its own. The bmesh/topology walking lives in
+topology.py and operators.py.
 """
 
 import math
@@ -10,6 +11,11 @@ import math
 import numpy as np
 from mathutils import Vector
 
+from .lofting import (  # noqa: F401  (re-exported for the rest of the add-on)
+    align_ring, bridge_chain_face_indices, bridge_face_indices, plan_bridge,
+    plan_bridges,
+)
+
 EPS = 1e-9
 
 
@@ -97,30 +103,802 @@ def fit_circle(points):
     return Vector(centroid) + float(cx) * u + float(cy) * v, n, float(radius)
 
 
+# ----------------------------------------------------------- batched fitting
+#
+# The same fit as above, for many runs at once. Runs are ragged, so rather than
+# padding them out they're concatenated into one (P, 3) array and every per-run
+# quantity is a segment sum (`np.bincount` with weights) — memory stays linear in
+# the number of points however uneven the runs are.
+
+def pack_runs(points_list):
+    """Concatenate ragged point runs into (points, starts, counts).
+
+    `points` is (P, 3) float64; run i is points[starts[i]:starts[i] + counts[i]].
+    """
+    counts = np.fromiter((len(p) for p in points_list), dtype=np.int64,
+                         count=len(points_list))
+    starts = np.zeros(len(counts), dtype=np.int64)
+    if len(counts) > 1:
+        np.cumsum(counts[:-1], out=starts[1:])
+    chunks = [np.asarray(p, dtype=np.float64).reshape(-1, 3)
+              for p in points_list if len(p)]
+    pts = np.concatenate(chunks) if chunks else np.zeros((0, 3))
+    return pts, starts, counts
+
+
+def run_ids(counts):
+    """Run index of every packed point: [0, 0, 0, 1, 1, 2, ...]."""
+    return np.repeat(np.arange(len(counts)), counts)
+
+
+def _segment_sum(seg, values, n):
+    """Per-run sums of `values` ((P,) or (P, k)) grouped by run index `seg`."""
+    if values.ndim == 1:
+        return np.bincount(seg, weights=values, minlength=n)
+    return np.stack([np.bincount(seg, weights=values[:, k], minlength=n)
+                     for k in range(values.shape[1])], axis=1)
+
+
+def plane_bases(normals):
+    """Row-wise `plane_basis`: (u, v) arrays for an (N, 3) array of normals."""
+    n = np.asarray(normals, dtype=np.float64)
+    length = np.linalg.norm(n, axis=1, keepdims=True)
+    n = n / np.where(length < EPS, 1.0, length)
+    ref = np.where((np.abs(n[:, 2]) < 0.9)[:, None],
+                   np.array([0.0, 0.0, 1.0]), np.array([1.0, 0.0, 0.0]))
+    u = ref - np.sum(ref * n, axis=1, keepdims=True) * n
+    weak = np.linalg.norm(u, axis=1) < EPS
+    if np.any(weak):
+        ref_y = np.array([0.0, 1.0, 0.0])
+        u[weak] = ref_y - (n[weak] @ ref_y)[:, None] * n[weak]
+    u /= np.maximum(np.linalg.norm(u, axis=1, keepdims=True), EPS)
+    v = np.cross(n, u)
+    v /= np.maximum(np.linalg.norm(v, axis=1, keepdims=True), EPS)
+    return u, v
+
+
+FIT_METHODS = ("algebraic", "geometric", "robust")
+
+
+def fit_circles_packed(pts, starts, counts, method="algebraic", tolerance=0.02):
+    """`fit_circle` for every run of a packed array (see `pack_runs`) at once.
+
+    Returns a dict of arrays, one row per run:
+      center, normal, u, v, centroid — (N, 3); radius — (N,);
+      ok — (N,) bool, False exactly where `fit_circle` would return
+      (None, None, 0.0) (fewer than three points, or no plane).
+
+    The plane comes from the smallest-eigenvalue eigenvector of each run's
+    3x3 scatter matrix (the same direction the SVD in `fit_plane` picks), and
+    the Kasa fit is solved through its 3x3 normal equations, all as stacked
+    `np.linalg` calls. In-plane coordinates are scaled by each run's spread
+    first, which keeps those normal equations well conditioned. Rows that fail
+    the Kasa checks get the same centroid + mean radius fallback.
+
+    `method` "geometric" polishes every fit with `refine_circles_packed`;
+    "robust" hands over to `fit_circles_robust` (with `tolerance`), whose
+    result also carries an "inliers" mask.
+    """
+    if method not in FIT_METHODS:
+        raise ValueError(f"unknown circle fit method {method!r}")
+    if method == "robust":
+        return fit_circles_robust(pts, starts, counts, tolerance=tolerance)
+    pts = np.asarray(pts, dtype=np.float64).reshape(-1, 3)
+    counts = np.asarray(counts, dtype=np.int64)
+    n_runs = len(counts)
+    seg = run_ids(counts)
+    ok = counts >= 3
+
+    centroid = _segment_sum(seg, pts, n_runs) / np.maximum(counts, 1)[:, None]
+    d = pts - centroid[seg]
+
+    # Scatter matrices, (N, 3, 3); rows we won't use get the identity so the
+    # stacked eigensolve stays finite.
+    outer = (d[:, :, None] * d[:, None, :]).reshape(-1, 9)
+    scatter = _segment_sum(seg, outer, n_runs).reshape(n_runs, 3, 3)
+    scatter[~ok] = np.eye(3)
+    _, vecs = np.linalg.eigh(scatter)
+    normal = vecs[:, :, 0]
+    ok &= np.all(np.isfinite(normal), axis=1)
+    u, v = plane_bases(normal)
+
+    x = np.sum(d * u[seg], axis=1)
+    y = np.sum(d * v[seg], axis=1)
+    dist = np.hypot(x, y)
+    spread = np.zeros(n_runs)
+    np.maximum.at(spread, seg, dist)
+    mean_r = _segment_sum(seg, dist, n_runs) / np.maximum(counts, 1)
+
+    # Kasa:  A*x + B*y + C = x^2 + y^2, on spread-normalised coordinates.
+    scale = np.maximum(spread, EPS)
+    xs, ys = x / scale[seg], y / scale[seg]
+    zs = xs * xs + ys * ys
+    ones = np.ones_like(xs)
+    cols = np.stack([xs, ys, ones], axis=1)
+    gram = _segment_sum(seg, (cols[:, :, None] * cols[:, None, :]).reshape(-1, 9),
+                        n_runs).reshape(n_runs, 3, 3)
+    rhs = _segment_sum(seg, cols * zs[:, None], n_runs)
+    gram[~ok] = np.eye(3)
+    sol = _solve_rows(gram, rhs)
+
+    cx, cy = sol[:, 0] / 2.0, sol[:, 1] / 2.0
+    with np.errstate(invalid='ignore', over='ignore'):
+        r_sq = sol[:, 2] + cx * cx + cy * cy
+        radius = np.sqrt(np.where(r_sq > 0.0, r_sq, 0.0)) * scale
+        good = (np.isfinite(r_sq) & (r_sq > 0.0) & np.isfinite(radius)
+                & (radius <= 1.0e4 * scale))
+    good &= ok
+
+    shift = np.where(good[:, None], (cx * scale)[:, None] * u
+                     + (cy * scale)[:, None] * v, 0.0)
+    center = centroid + shift
+    radius = np.where(good, radius, mean_r)
+
+    zero = ~ok
+    center[zero] = 0.0
+    normal = np.where(zero[:, None], 0.0, normal)
+    radius[zero] = 0.0
+    fits = {"center": center, "normal": normal, "u": u, "v": v,
+            "centroid": centroid, "radius": radius, "ok": ok}
+    if method == "geometric":
+        fits = refine_circles_packed(pts, counts, fits, spread=spread)
+    return fits
+
+
+def refine_circles_packed(pts, counts, fits, iterations=25, tol=1e-8,
+                          spread=None):
+    """Geometric (orthogonal-distance) refinement of packed circle fits.
+
+    The Kasa fit minimises an algebraic error that weights points by their
+    squared radius, which pulls it towards smaller circles on short, noisy
+    arcs. This polishes each row of `fits` (as returned by
+    `fit_circles_packed`) by Levenberg-Marquardt on the true distances from the
+    points to the circle, within the row's own fitted plane — the out-of-plane
+    part of a point's distance doesn't depend on the centre or radius.
+
+    All runs step together: every iteration is one pass of segment sums and one
+    stacked 3x3 solve, with a per-run damping factor. A run drops out once its
+    step is below `tol` of its radius or its error stops improving by more than
+    `tol` of itself (or its damping has blown up), and
+    the loop stops early when none are left or after `iterations` steps.
+    `spread` is each run's largest in-plane distance from its centroid, if the
+    caller already has it; steps that would push the radius past the same bound
+    the Kasa checks use are rejected. Returns a new dict; rows that aren't `ok`
+    are left alone.
+    """
+    pts = np.asarray(pts, dtype=np.float64).reshape(-1, 3)
+    counts = np.asarray(counts, dtype=np.int64)
+    n_runs = len(counts)
+    seg = run_ids(counts)
+    out = dict(fits)
+    centroid, u, v = fits["centroid"], fits["u"], fits["v"]
+
+    d = pts - centroid[seg]
+    x = np.sum(d * u[seg], axis=1)
+    y = np.sum(d * v[seg], axis=1)
+    if spread is None:
+        spread = np.zeros(n_runs)
+        np.maximum.at(spread, seg, np.hypot(x, y))
+    limit = 1.0e4 * np.maximum(spread, EPS)
+
+    off = fits["center"] - centroid
+    params = np.stack([np.sum(off * u, axis=1), np.sum(off * v, axis=1),
+                       fits["radius"]], axis=1)
+
+    def residuals(p):
+        dx, dy = x - p[seg, 0], y - p[seg, 1]
+        dist = np.hypot(dx, dy)
+        return dx, dy, dist, dist - p[seg, 2]
+
+    dx, dy, dist, res = residuals(params)
+    cost = _segment_sum(seg, res * res, n_runs)
+    damping = np.full(n_runs, 1.0e-3)
+    active = fits["ok"] & (counts >= 3) & (fits["radius"] > EPS)
+    eye = np.eye(3)
+
+    for _ in range(iterations):
+        if not np.any(active):
+            break
+        safe = np.maximum(dist, EPS)
+        jac = np.stack([-dx / safe, -dy / safe, -np.ones_like(dist)], axis=1)
+        jtj = _segment_sum(seg, (jac[:, :, None] * jac[:, None, :])
+                           .reshape(-1, 9), n_runs).reshape(n_runs, 3, 3)
+        grad = _segment_sum(seg, jac * res[:, None], n_runs)
+        diag = jtj[:, [0, 1, 2], [0, 1, 2]]
+        system = jtj + damping[:, None, None] * diag[:, :, None] * eye
+        system[~active] = eye
+        grad[~active] = 0.0
+        step = -_solve_rows(system, grad)
+        step[~np.all(np.isfinite(step), axis=1)] = 0.0
+
+        trial = params + step
+        t_dx, t_dy, t_dist, t_res = residuals(trial)
+        t_cost = _segment_sum(seg, t_res * t_res, n_runs)
+        better = (active & (t_cost < cost) & (trial[:, 2] > EPS)
+                  & (trial[:, 2] <= limit))
+
+        gain = cost - t_cost
+        params[better] = trial[better]
+        cost = np.where(better, t_cost, cost)
+        take = better[seg]
+        dx = np.where(take, t_dx, dx)
+        dy = np.where(take, t_dy, dy)
+        dist = np.where(take, t_dist, dist)
+        res = np.where(take, t_res, res)
+        damping = np.where(better, damping * 0.1, damping * 10.0)
+
+        size = np.linalg.norm(step, axis=1)
+        done = ((better & ((size <= tol * np.maximum(params[:, 2], EPS))
+                           | (gain <= tol * cost)))
+                | (damping > 1.0e10))
+        active &= ~done
+
+    rows = fits["ok"] & (fits["radius"] > EPS)
+    out["center"] = np.where(rows[:, None], centroid + params[:, :1] * u
+                             + params[:, 1:2] * v, fits["center"])
+    out["radius"] = np.where(rows, params[:, 2], fits["radius"])
+    return out
+
+
+# Fixed, so the same selection always gets the same robust fit (and a redo-panel
+# tweak never makes the circle jump about).
+RANSAC_SEED = 0x5EED
+
+# Cap on (candidates x points) evaluated per NumPy pass in the robust fit.
+_RANSAC_CELLS = 1 << 22
+
+
+def fit_circles_robust(pts, starts, counts, tolerance=0.02, confidence=0.99,
+                       max_samples=256, block=16, seed=RANSAC_SEED):
+    """Outlier-proof `fit_circles_packed`: RANSAC, then a refit on the inliers.
+
+    For every run at once, candidate circles through three of its points are
+    drawn `block` at a time and scored against all of the run's points (one
+    NumPy pass per batch of candidates); a point is an inlier of a candidate
+    when its 3-D distance from it is within `tolerance` of the radius. Each
+    run keeps its best candidate and stops drawing once the usual RANSAC bound
+    says `confidence` is reached for its inlier ratio so far — a clean loop is
+    done after the first batch — or at `max_samples`. The winners are then
+    refitted (geometric fit) on their inliers alone and the inliers re-read
+    against that refit.
+
+    The k-th triple a run draws depends only on `seed`, k and the run's point
+    count — never on which other runs share the batch — so a run fitted alone
+    gets the same circle as it does in the whole selection.
+
+    Returns the `fit_circles_packed` dict plus "inliers", a (P,) bool mask over
+    the packed points. A run where no three points make a circle falls back to
+    the ordinary fit with every point an inlier.
+    """
+    pts = np.asarray(pts, dtype=np.float64).reshape(-1, 3)
+    counts = np.asarray(counts, dtype=np.int64)
+    starts = np.asarray(starts, dtype=np.int64)
+    n_runs = len(counts)
+    seg = run_ids(counts)
+    # One shared stream of draws: sample k of every run reads column k.
+    draws = np.random.default_rng(seed).random((3, max_samples + block))
+    # Rows per NumPy pass, so (candidates x points) stays under the cap.
+    budget = max(_RANSAC_CELLS // block, 1)
+
+    best_score = np.zeros(n_runs, dtype=np.int64)
+    best_center = np.zeros((n_runs, 3))
+    best_normal = np.zeros((n_runs, 3))
+    best_radius = np.zeros(n_runs)
+    drawn = 0
+    live = counts >= 3
+    slot = np.full(n_runs, -1, dtype=np.int64)
+
+    while np.any(live):
+        alive = np.flatnonzero(live)
+        part = (np.cumsum(counts[alive]) - counts[alive]) // budget
+        for rows in np.split(alive, np.flatnonzero(np.diff(part)) + 1):
+            slot[rows] = np.arange(len(rows))
+            size = counts[rows]
+            members = (np.repeat(starts[rows] - (np.cumsum(size) - size), size)
+                       + np.arange(size.sum()))
+            owner = slot[seg[members]]
+
+            tri = (_sample_triples(draws[:, drawn:drawn + block], counts[rows])
+                   + starts[rows])
+            center, normal, radius, good = _circumcircles(
+                pts[tri[0]], pts[tri[1]], pts[tri[2]])
+            dist = _circle_distances(pts[members][None], center[:, owner],
+                                     normal[:, owner], radius[:, owner])
+            hit = dist <= tolerance * radius[:, owner]
+            flat = (np.arange(block)[:, None] * len(rows) + owner[None]).ravel()
+            score = np.bincount(flat, weights=hit.ravel(),
+                                minlength=block * len(rows)).reshape(block, -1)
+            score = np.where(good, score, -1).astype(np.int64)
+
+            pick = np.argmax(score, axis=0)
+            cols = np.arange(len(rows))
+            better = score[pick, cols] > best_score[rows]
+            win, pick = rows[better], pick[better]
+            best_score[win] = score[pick, cols[better]]
+            best_center[win] = center[pick, cols[better]]
+            best_normal[win] = normal[pick, cols[better]]
+            best_radius[win] = radius[pick, cols[better]]
+
+        drawn += block
+        ratio = best_score[alive] / counts[alive]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            needed = np.ceil(np.log(1.0 - confidence)
+                             / np.log(1.0 - ratio ** 3))
+        needed = np.where(ratio >= 1.0, 0, np.where(ratio > 0.0, needed,
+                                                    max_samples))
+        live[alive] = drawn < np.minimum(needed, max_samples)
+
+    found = best_score >= 3
+    inliers = np.ones(len(pts), dtype=bool)
+    rs = found[seg]
+    inliers[rs] = (_circle_distances(pts[rs], best_center[seg[rs]],
+                                     best_normal[seg[rs]],
+                                     best_radius[seg[rs]])
+                   <= tolerance * best_radius[seg[rs]])
+
+    sub_counts = np.bincount(seg[inliers], minlength=n_runs)
+    sub_starts = np.zeros(n_runs, dtype=np.int64)
+    np.cumsum(sub_counts[:-1], out=sub_starts[1:])
+    fits = fit_circles_packed(pts[inliers], sub_starts, sub_counts,
+                              method="geometric")
+
+    # Re-read the inliers against the refit; keep the RANSAC set for a run the
+    # refit would leave with too few.
+    rs &= fits["ok"][seg]
+    again = (_circle_distances(pts[rs], fits["center"][seg[rs]],
+                               fits["normal"][seg[rs]],
+                               fits["radius"][seg[rs]])
+             <= tolerance * fits["radius"][seg[rs]])
+    enough = np.bincount(seg[rs], weights=again, minlength=n_runs) >= 3
+    take = np.flatnonzero(rs)[enough[seg[rs]]]
+    inliers[take] = again[enough[seg[rs]]]
+    fits["inliers"] = inliers
+    return fits
+
+
+def _sample_triples(draw, counts):
+    """(3, size, N) distinct in-run offsets from `draw`, (3, size) uniforms.
+
+    Every run turns the same uniforms into offsets within its own count.
+    """
+    n = np.asarray(counts, dtype=np.int64)[None, :]
+    draw = draw[:, :, None]
+    i0 = (draw[0] * n).astype(np.int64)
+    i1 = (draw[1] * (n - 1)).astype(np.int64)
+    i1 += i1 >= i0
+    lo, hi = np.minimum(i0, i1), np.maximum(i0, i1)
+    i2 = (draw[2] * (n - 2)).astype(np.int64)
+    i2 += i2 >= lo
+    i2 += i2 >= hi
+    return np.stack([i0, i1, i2])
+
+
+def _circumcircles(p0, p1, p2):
+    """(center, normal, radius, ok) of the circles through three point arrays.
+
+    `ok` is False where the three points are (nearly) collinear.
+    """
+    a, b = p1 - p0, p2 - p0
+    axb = np.cross(a, b)
+    aa, bb = np.sum(a * a, axis=-1), np.sum(b * b, axis=-1)
+    den = 2.0 * np.sum(axb * axb, axis=-1)
+    ok = den > 1.0e-12 * np.maximum(aa, bb) ** 2
+    safe = np.where(ok, den, 1.0)[..., None]
+    off = np.cross(aa[..., None] * b - bb[..., None] * a, axb) / safe
+    normal = axb / np.sqrt(safe / 2.0)
+    return p0 + off, normal, np.linalg.norm(off, axis=-1), ok
+
+
+def _circle_distances(pts, center, normal, radius):
+    """3-D distance of each point from its circle (broadcasting rows)."""
+    d = pts - center
+    h = np.sum(d * normal, axis=-1)
+    rho = np.sqrt(np.maximum(np.sum(d * d, axis=-1) - h * h, 0.0))
+    return np.hypot(h, rho - radius)
+
+
+def _solve_rows(mats, rhs):
+    """Stacked `np.linalg.solve`; a singular row comes back as NaNs."""
+    try:
+        return np.linalg.solve(mats, rhs[:, :, None])[:, :, 0]
+    except np.linalg.LinAlgError:
+        pass
+    out = np.full(rhs.shape, np.nan)
+    for i in range(len(mats)):
+        try:
+            out[i] = np.linalg.solve(mats[i], rhs[i])
+        except np.linalg.LinAlgError:
+            continue
+    return out
+
+
+def fit_circles_batched(points_list):
+    """`fit_circle` for a list of point runs, solved as one batch.
+
+    A convenience over `pack_runs` + `fit_circles_packed`; see the latter for
+    the returned dict of arrays.
+    """
+    return fit_circles_packed(*pack_runs(points_list))
+
+
+def _circle_coords(pts, counts, fits):
+    """(run ids, in-plane x, y, height) of packed points in their circles' frames."""
+    seg = run_ids(counts)
+    d = np.asarray(pts, dtype=np.float64).reshape(-1, 3) - fits["center"][seg]
+    return (seg, np.sum(d * fits["u"][seg], axis=1),
+            np.sum(d * fits["v"][seg], axis=1),
+            np.sum(d * fits["normal"][seg], axis=1))
+
+
+def _deviation(seg, rad, h, counts, radius):
+    """`circle_deviation_packed` from in-plane radii and heights."""
+    n_runs = len(counts)
+    per = np.maximum(counts, 1)
+    sq = h * h + (rad - radius[seg]) ** 2
+    rms = np.sqrt(_segment_sum(seg, sq, n_runs) / per)
+    mean = _segment_sum(seg, rad, n_runs) / per
+    var = np.maximum(_segment_sum(seg, rad * rad, n_runs) / per - mean * mean,
+                     0.0)
+    scale = np.maximum(radius, EPS)
+    return rms / scale, np.sqrt(var) / scale
+
+
+def circle_deviation_packed(pts, counts, fits):
+    """How far each packed run strays from its fitted circle.
+
+    Returns (residual, radius_spread), both (N,) and relative to the fitted
+    radius: the RMS 3-D distance of the run's points from the circle (in-plane
+    radial error and out-of-plane height together), and the standard deviation
+    of their in-plane radii — the spread of `point_radii`.
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    seg, x, y, h = _circle_coords(pts, counts, fits)
+    return _deviation(seg, np.hypot(x, y), h, counts, fits["radius"])
+
+
+def run_stats_packed(pts, counts, fits, closed=None):
+    """Per-run measures of packed runs against their circles, in one pass.
+
+    `fits` needs center, normal, u, v and radius rows. Returns a dict of (N,)
+    arrays:
+
+      * count — the run's points;
+      * start — the first point's angle in the circle's (u, v) frame;
+      * sweep — the signed angle walked from the first point to the last, as
+        `unwrap_angles` gives it, or ±2π (by winding) for runs `closed` marks;
+      * residual, spread — `circle_deviation_packed`'s two measures.
+
+    A run with no points gets zeros.
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    n_runs = len(counts)
+    seg, x, y, h = _circle_coords(pts, counts, fits)
+    residual, spread = _deviation(seg, np.hypot(x, y), h, counts,
+                                  fits["radius"])
+    ang = np.arctan2(y, x)
+    starts = np.cumsum(counts) - counts
+    has = counts > 0
+    start = np.zeros(n_runs)
+    start[has] = ang[starts[has]]
+
+    # Wrapped step from every point to the next one of its run; the last point
+    # of a run steps back to its first, which only a closed run counts.
+    last = starts + counts - 1
+    nxt = np.arange(len(ang)) + 1
+    nxt[last[has]] = starts[has]
+    step = (ang[nxt] - ang + math.pi) % (2.0 * math.pi) - math.pi
+    turn = _segment_sum(seg, step, n_runs)
+    step[last[has]] = 0.0
+    sweep = _segment_sum(seg, step, n_runs)
+    if closed is not None:
+        winding = np.where(turn >= 0.0, 1.0, -1.0)
+        sweep = np.where(closed, winding * 2.0 * math.pi, sweep)
+    return {"count": counts, "start": start, "sweep": sweep,
+            "residual": residual, "spread": spread}
+
+
+def circular_runs(pts, starts, counts, tolerance, min_count=3):
+    """Fit every packed run and pick out the ones that are circles.
+
+    A run passes when it has at least `min_count` points, fits, and both of
+    `circle_deviation_packed`'s measures are within `tolerance` (a fraction of
+    the radius). Returns (fits, passed (N,) bool, residual (N,)).
+    """
+    fits = fit_circles_packed(pts, starts, counts)
+    residual, spread = circle_deviation_packed(pts, counts, fits)
+    passed = (fits["ok"] & (np.asarray(counts) >= max(min_count, 3))
+              & (fits["radius"] > EPS)
+              & (residual <= tolerance) & (spread <= tolerance))
+    return fits, passed, residual
+
+
+def resample_rings_packed(pts, starts, counts, fits, radius=None, offset=0.0,
+                          count=None, phase=None):
+    """`resample_ring` at each closed run's own count, for every run at once.
+
+    Each run keeps its vertex count, winding and the angle of its first vert
+    (plus `offset`), and is spread evenly round its fitted circle — at
+    `radius` (an (N,) array) or, by default, the mean in-plane distance of its
+    points, as `resample_ring` does. Returns the new (P, 3) positions.
+
+    `count` resamples every run to that many verts instead (the result is then
+    (N * count, 3)); `phase`, an (N,) array, stands in for each run's first
+    vert angle — except where it is NaN — with `offset` still turned the way
+    the run winds.
+    """
+    pts = np.asarray(pts, dtype=np.float64).reshape(-1, 3)
+    counts = np.asarray(counts, dtype=np.int64)
+    starts = np.asarray(starts, dtype=np.int64)
+    n_runs = len(counts)
+    seg = run_ids(counts)
+    center, u, v = fits["center"][seg], fits["u"][seg], fits["v"][seg]
+    d = pts - center
+    x, y = np.sum(d * u, axis=1), np.sum(d * v, axis=1)
+    ang = np.arctan2(y, x)
+
+    if radius is None:
+        radius = (_segment_sum(seg, np.hypot(x, y), n_runs)
+                  / np.maximum(counts, 1))
+
+    nxt = np.arange(len(pts)) + 1
+    nxt[starts + counts - 1] = starts
+    step = (ang[nxt] - ang + math.pi) % (2.0 * math.pi) - math.pi
+    winding = np.where(_segment_sum(seg, step, n_runs) >= 0.0, 1.0, -1.0)
+
+    first = np.asarray(ang[starts])
+    if phase is not None:
+        phase = np.asarray(phase, dtype=np.float64)
+        first = np.where(np.isnan(phase), first, phase)
+    first = first + winding * offset
+    if count is not None:
+        counts = np.full(n_runs, count, dtype=np.int64)
+        seg = run_ids(counts)
+        starts = np.cumsum(counts) - counts
+    k = np.arange(len(seg)) - starts[seg]
+    a = first[seg] + winding[seg] * 2.0 * math.pi * k / counts[seg]
+    r = np.asarray(radius, dtype=np.float64)[seg]
+    center, u, v = fits["center"][seg], fits["u"][seg], fits["v"][seg]
+    return center + r[:, None] * (np.cos(a)[:, None] * u
+                                  + np.sin(a)[:, None] * v)
+
+
+def _coaxial_pairs(center, normal, radius, i, j, tolerance):
+    """(K,) bool: are circles i[k] and j[k] coaxial? (see `coaxial_groups`)"""
+    d = center[j] - center[i]
+    n_i, n_j = normal[i], normal[j]
+    off_i = np.linalg.norm(d - np.sum(d * n_i, axis=1, keepdims=True) * n_i,
+                           axis=1)
+    off_j = np.linalg.norm(d - np.sum(d * n_j, axis=1, keepdims=True) * n_j,
+                           axis=1)
+    limit = tolerance * np.minimum(radius[i], radius[j])
+    return ((np.abs(np.sum(n_i * n_j, axis=1)) >= math.cos(tolerance))
+            & (off_i <= limit) & (off_j <= limit))
+
+
+# Grid shifts (in cells) of the passes that merge groups a cell edge split.
+MERGE_SHIFTS = (0.5, 0.25, 0.75)
+
+
+def _seed_buckets(key, todo, coaxial):
+    """For each circle of `todo`, the seed it groups with (see below).
+
+    Circles are bucketed by equal rows of `key`; each bucket's first circle is
+    its seed, and every other one stays with it if `coaxial(i, seed)` says so.
+    Those that don't are bucketed again among themselves.
+    """
+    seed_of = todo.copy()
+    where = np.arange(len(todo))
+    while len(todo):
+        _, bucket = np.unique(key[todo], axis=0, return_inverse=True)
+        bucket = bucket.reshape(-1)
+        first = np.full(bucket.max() + 1, len(todo))
+        np.minimum.at(first, bucket, np.arange(len(todo)))
+        seed = todo[first[bucket]]
+        ok = (seed == todo) | coaxial(todo, seed)
+        seed_of[where[ok]] = seed[ok]
+        todo, where = todo[~ok], where[~ok]
+    return seed_of
+
+
+def coaxial_groups(center, normal, radius, tolerance=0.05):
+    """Label circles that share an axis: (N,) ints, one label per group.
+
+    Two circles count as coaxial when their normals are parallel (either way
+    round) to within `tolerance` radians and each centre lies within
+    `tolerance` times the smaller radius of the other's axis. A group is a
+    seed circle and circles coaxial with it.
+
+    Grouping sorts rather than compares all pairs: circles are bucketed on
+    their quantised axis — direction (either way round) and the foot of the
+    perpendicular from the selection's mean centre — and checked against their
+    bucket's seed in one array pass, failures bucketing again among
+    themselves. The seeds are then bucketed the same way on grids shifted by
+    fractions of a cell (`MERGE_SHIFTS`), merging groups a cell edge had
+    split; a circle not coaxial with its merged seed keeps its group. A group
+    split along edges of every grid can still come out as two.
+    """
+    center = np.asarray(center, dtype=np.float64).reshape(-1, 3)
+    normal = np.asarray(normal, dtype=np.float64).reshape(-1, 3)
+    normal = normal / np.maximum(np.linalg.norm(normal, axis=1,
+                                                keepdims=True), EPS)
+    radius = np.asarray(radius, dtype=np.float64)
+    n = len(center)
+    if not n:
+        return np.zeros(0, dtype=np.int64)
+
+    # The axis, whichever way its normal points: the direction as n n^T (the
+    # same for -n) and the point on it nearest the mean centre — both in cells
+    # a few tolerances wide.
+    rows, cols = np.triu_indices(3)
+    spin = normal[:, rows] * normal[:, cols]
+    rel = center - center.mean(axis=0)
+    along = np.sum(rel * normal, axis=1, keepdims=True)
+    foot = rel - along * normal
+    # A normal tilted by the tolerance moves the foot by up to that much of
+    # the distance along the axis, as well as the centre's own slack.
+    length = max(float(np.median(radius)), float(np.abs(along).max()), EPS)
+    cells = np.concatenate([spin, foot / length], axis=1) / (4.0 * tolerance)
+
+    def coaxial(i, j):
+        return _coaxial_pairs(center, normal, radius, i, j, tolerance)
+
+    seed = _seed_buckets(np.floor(cells).astype(np.int64), np.arange(n),
+                         coaxial)
+    for shift in MERGE_SHIFTS:
+        seeds = np.unique(seed)
+        merged = np.arange(n)
+        merged[seeds] = _seed_buckets(np.floor(cells + shift).astype(np.int64),
+                                      seeds, coaxial)
+        moved = merged[seed] != seed
+        moved[moved] = coaxial(np.flatnonzero(moved), merged[seed][moved])
+        seed = np.where(moved, merged[seed], seed)
+    return np.unique(seed, return_inverse=True)[1].reshape(-1)
+
+
+def shared_axes(center, normal, labels):
+    """One axis per group of `coaxial_groups`: (point (K, 3), direction (K, 3)).
+
+    The direction is the principal axis of the group's normals (flipped to
+    agree with each other first), all groups solved in one batched `eigh`;
+    the point is the mean of the group's centres.
+    """
+    center = np.asarray(center, dtype=np.float64).reshape(-1, 3)
+    normal = np.asarray(normal, dtype=np.float64).reshape(-1, 3)
+    labels = np.asarray(labels, dtype=np.int64)
+    n_groups = int(labels.max()) + 1 if len(labels) else 0
+    seed = np.zeros((n_groups, 3))
+    first = np.unique(labels, return_index=True)[1]
+    seed[labels[first]] = normal[first]
+    flip = np.where(np.sum(normal * seed[labels], axis=1) < 0.0, -1.0, 1.0)
+    n = normal * flip[:, None]
+    scatter = np.stack([_segment_sum(labels, n * n[:, k:k + 1], n_groups)
+                        for k in range(3)], axis=1)
+    _, vecs = np.linalg.eigh(scatter)
+    direction = vecs[:, :, 2]
+    direction *= np.where(np.sum(direction * seed, axis=1) < 0.0,
+                          -1.0, 1.0)[:, None]
+    size = np.maximum(np.bincount(labels, minlength=n_groups), 1)
+    point = _segment_sum(labels, center, n_groups) / size[:, None]
+    return point, direction
+
+
 def circle_frame(center, normal):
     """(center: Vector, u, v) — the in-plane basis used to place points."""
     u, v = plane_basis(normal)
     return Vector(center), u, v
 
 
+# ------------------------------------------------------- array-in/array-out
+#
+# The `*_array` helpers below take points as an (N, 3) float64 array (anything
+# `np.asarray` accepts will do) and return arrays, so a 256-vertex loop costs a
+# handful of NumPy calls instead of 256 `Vector`s. The Vector-flavoured
+# functions further down are thin wrappers over them.
+
+def _as_points(points):
+    return np.asarray(points, dtype=np.float64).reshape(-1, 3)
+
+
+def _in_plane(center, u, v, points):
+    """(x, y) coordinates of `points` in the (u, v) frame around `center`."""
+    d = _as_points(points) - np.asarray(center, dtype=np.float64)
+    return d @ np.asarray(u, dtype=np.float64), d @ np.asarray(v, dtype=np.float64)
+
+
+def point_angles_array(center, u, v, points):
+    """`point_angles` as an (N,) array."""
+    x, y = _in_plane(center, u, v, points)
+    return np.arctan2(y, x)
+
+
+def point_radii_array(center, u, v, points):
+    """`point_radii` as an (N,) array."""
+    x, y = _in_plane(center, u, v, points)
+    return np.hypot(x, y)
+
+
+def unwrap_angles_array(angles):
+    """`unwrap_angles` as an (N,) array (same wrap rule, so same result)."""
+    a = np.asarray(angles, dtype=np.float64)
+    if len(a) < 2:
+        return a.copy()
+    d = (np.diff(a) + math.pi) % (2.0 * math.pi) - math.pi
+    return np.concatenate(([a[0]], a[0] + np.cumsum(d)))
+
+
+def points_at_angles(center, u, v, radius, angles):
+    """(N, 3) points on the circle (center, u, v, radius) at each of `angles`."""
+    a = np.asarray(angles, dtype=np.float64)[:, None]
+    return (np.asarray(center, dtype=np.float64)
+            + radius * (np.cos(a) * np.asarray(u, dtype=np.float64)
+                        + np.sin(a) * np.asarray(v, dtype=np.float64)))
+
+
+def _winding_sign_array(angles):
+    """`_winding_sign` for an angle array."""
+    a = np.asarray(angles, dtype=np.float64)
+    d = (np.roll(a, -1) - a + math.pi) % (2.0 * math.pi) - math.pi
+    return 1.0 if float(np.sum(d)) >= 0.0 else -1.0
+
+
+def resample_ring_array(centroid, normal, ordered_points, count,
+                        radius=0.0, offset=0.0, center=None):
+    """`resample_ring` on arrays: returns ((count, 3) positions, radius)."""
+    u, v = plane_basis(normal)
+    c = np.asarray(center if center is not None else centroid,
+                   dtype=np.float64)
+    x, y = _in_plane(c, u, v, ordered_points)
+
+    if radius <= 0.0:
+        radius = float(np.mean(np.hypot(x, y))) if len(x) else 0.0
+
+    angles = np.arctan2(y, x)
+    winding = _winding_sign_array(angles) if len(angles) >= 3 else 1.0
+    start = (float(angles[0]) if len(angles) else 0.0) + winding * offset
+
+    steps = np.arange(count, dtype=np.float64) * (2.0 * math.pi / count)
+    return points_at_angles(c, u, v, radius, start + winding * steps), radius
+
+
+def resample_arc_array(center, normal, ordered_points, count, radius=0.0):
+    """`resample_arc` on arrays: returns ((count, 3) positions, radius).
+
+    The positions array is empty (0, 3) when there's nothing to resample.
+    """
+    c, u, v = circle_frame(center, normal)
+    pts = _as_points(ordered_points)
+    if count < 2 or len(pts) < 2:
+        return np.zeros((0, 3)), radius
+
+    x, y = _in_plane(c, u, v, pts)
+    if radius <= 0.0:
+        radius = float(np.mean(np.hypot(x, y)))
+
+    ang = unwrap_angles_array(np.arctan2(y, x))
+    a0, a1 = ang[0], ang[-1]
+    t = np.arange(count, dtype=np.float64) / (count - 1)
+    return points_at_angles(c, u, v, radius, a0 + (a1 - a0) * t), radius
+
+
+def circle_positions_array(center, normal, count, start_angle=0.0, radius=1.0,
+                           winding=1.0):
+    """`circle_positions` as a (count, 3) array."""
+    c, u, v = circle_frame(center, normal)
+    step = winding * 2.0 * math.pi / count
+    return points_at_angles(c, u, v, radius,
+                            start_angle + step * np.arange(count))
+
+
+# ---------------------------------------------------------- Vector flavour
+
 def point_angles(center, u, v, points):
     """Angles (radians, in the (u, v) frame) of `points` around `center`."""
-    c = Vector(center)
-    out = []
-    for p in points:
-        d = Vector(p) - c
-        out.append(math.atan2(d.dot(v), d.dot(u)))
-    return out
+    return point_angles_array(center, u, v, points).tolist()
 
 
 def point_radii(center, u, v, points):
     """In-plane distances of `points` from `center`."""
-    c = Vector(center)
-    out = []
-    for p in points:
-        d = Vector(p) - c
-        out.append(math.hypot(d.dot(u), d.dot(v)))
-    return out
+    return point_radii_array(center, u, v, points).tolist()
 
 
 def unwrap_angles(angles):
@@ -175,24 +953,10 @@ def resample_ring(centroid, normal, ordered_points, count,
     the same way as `ordered_points`, so a bridge between old and new won't
     twist.
     """
-    u, v = plane_basis(normal)
-    c = Vector(center) if center is not None else Vector(centroid)
-
-    radii = point_radii(c, u, v, ordered_points)
-    angles = point_angles(c, u, v, ordered_points)
-
-    if radius <= 0.0:
-        radius = sum(radii) / len(radii) if radii else 0.0
-
-    winding = _winding_sign(angles) if len(angles) >= 3 else 1.0
-    start = (angles[0] if angles else 0.0) + winding * offset
-
-    positions = []
-    step = 2.0 * math.pi / count
-    for k in range(count):
-        a = start + winding * step * k
-        positions.append(c + radius * (math.cos(a) * u + math.sin(a) * v))
-    return positions, radius
+    positions, radius = resample_ring_array(centroid, normal, ordered_points,
+                                            count, radius=radius,
+                                            offset=offset, center=center)
+    return [Vector(p) for p in positions.tolist()], radius
 
 
 def resample_arc(center, normal, ordered_points, count, radius=0.0):
@@ -204,22 +968,9 @@ def resample_arc(center, normal, ordered_points, count, radius=0.0):
 
     Returns (positions: list[Vector], radius: float).
     """
-    c, u, v = circle_frame(center, normal)
-    if count < 2 or len(ordered_points) < 2:
-        return [], radius
-
-    radii = point_radii(c, u, v, ordered_points)
-    if radius <= 0.0:
-        radius = sum(radii) / len(radii) if radii else 0.0
-
-    ang = unwrap_angles(point_angles(c, u, v, ordered_points))
-    a0, a1 = ang[0], ang[-1]
-
-    positions = [
-        point_at_angle(c, u, v, radius, a0 + (a1 - a0) * k / (count - 1))
-        for k in range(count)
-    ]
-    return positions, radius
+    positions, radius = resample_arc_array(center, normal, ordered_points,
+                                           count, radius=radius)
+    return [Vector(p) for p in positions.tolist()], radius
 
 
 def arc_gap_angles(ordered_angles, extra_count=0):
@@ -236,11 +987,15 @@ def arc_gap_angles(ordered_angles, extra_count=0):
     if len(ordered_angles) < 2:
         return []
     a0, a1 = ordered_angles[0], ordered_angles[-1]
-    sweep = a1 - a0
-    if abs(sweep) < EPS:
+    return gap_angles(a0, a1 - a0, len(ordered_angles), extra_count)
+
+
+def gap_angles(start, sweep, count, extra_count=0):
+    """`arc_gap_angles` for a `count`-point arc known by its start and sweep."""
+    if count < 2 or abs(sweep) < EPS:
         return []
     direction = 1.0 if sweep > 0.0 else -1.0
-    step = sweep / (len(ordered_angles) - 1)
+    step = sweep / (count - 1)
     gap = direction * 2.0 * math.pi - sweep      # what's left of the full turn
 
     if extra_count > 0:
@@ -251,131 +1006,14 @@ def arc_gap_angles(ordered_angles, extra_count=0):
         return []
 
     gap_step = gap / (n_new + 1)
-    return [a1 + gap_step * (k + 1) for k in range(n_new)]
-
-
-def bridge_chain_face_indices(pos_a, pos_b):
-    """Loft two ordered, *open* polylines into a face list.
-
-    The closed-ring version wraps around; this one stops at the ends, which is
-    what an arc needs — its two end vertices stay welded to whatever the run was
-    attached to. Same greedy shortest-diagonal walk, so unequal counts come out
-    as a clean triangle transition; equal counts come out as quads.
-
-    Returns faces as lists of ('a'|'b', index) tags, like `bridge_face_indices`.
-    """
-    a, b = len(pos_a), len(pos_b)
-    if a < 2 or b < 2:
-        return []
-
-    if a == b:
-        return [[('a', i), ('a', i + 1), ('b', i + 1), ('b', i)]
-                for i in range(a - 1)]
-
-    faces = []
-    i = j = 0
-    while i < a - 1 or j < b - 1:
-        if j >= b - 1:
-            advance_a = True
-        elif i >= a - 1:
-            advance_a = False
-        else:
-            diag_a = (pos_a[i + 1] - pos_b[j]).length
-            diag_b = (pos_b[j + 1] - pos_a[i]).length
-            advance_a = diag_a <= diag_b
-
-        if advance_a:
-            faces.append([('a', i), ('a', i + 1), ('b', j)])
-            i += 1
-        else:
-            faces.append([('a', i), ('b', j + 1), ('b', j)])
-            j += 1
-    return faces
+    end = start + sweep
+    return [end + gap_step * (k + 1) for k in range(n_new)]
 
 
 def circle_positions(center, normal, count, start_angle=0.0, radius=1.0,
                      winding=1.0):
     """`count` evenly spaced points around a full circle, from `start_angle`."""
-    c, u, v = circle_frame(center, normal)
-    step = winding * 2.0 * math.pi / count
-    return [point_at_angle(c, u, v, radius, start_angle + step * k)
-            for k in range(count)]
-
-
-def align_ring(positions_ref, positions_move):
-    """Roll/flip `positions_move` so it best lines up with `positions_ref`.
-
-    Both are ordered rings of Vectors (not necessarily equal length). Returns
-    the index order (list of ints into `positions_move`) that, read in
-    sequence, starts nearest `positions_ref[0]` and runs the same way round.
-
-    Used to phase-match a neighbour loop to the freshly built circle before
-    bridging, so the transition faces don't spiral.
-    """
-    m = len(positions_move)
-    if m == 0:
-        return []
-    ref0 = Vector(positions_ref[0])
-
-    # Nearest neighbour vert to our start.
-    best_i = min(range(m), key=lambda i: (Vector(positions_move[i]) - ref0).length_squared)
-
-    # Decide direction: compare the forward vs backward next vert against
-    # positions_ref[1] (the direction we want to travel).
-    if len(positions_ref) > 1 and m > 2:
-        ref1 = Vector(positions_ref[1])
-        fwd = Vector(positions_move[(best_i + 1) % m])
-        bwd = Vector(positions_move[(best_i - 1) % m])
-        forward = (fwd - ref1).length_squared <= (bwd - ref1).length_squared
-    else:
-        forward = True
-
-    if forward:
-        return [(best_i + k) % m for k in range(m)]
-    return [(best_i - k) % m for k in range(m)]
-
-
-def bridge_face_indices(pos_a, pos_b):
-    """Loft two ordered, phase-aligned closed rings into a face list.
-
-    `pos_a` / `pos_b` are lists of Vectors (the two rings, already rolled so
-    index 0 corresponds and both run the same direction). Returns a list of
-    faces, each a list of ('a'|'b', index) tags.
-
-    Equal-length rings become clean quads. Unequal rings are lofted with a
-    greedy two-pointer walk that, at each step, adds the triangle with the
-    shorter new diagonal — the standard way to bridge polylines of differing
-    vertex counts.
-    """
-    a, b = len(pos_a), len(pos_b)
-    if a < 2 or b < 2:
-        return []
-
-    if a == b:
-        return [[('a', i), ('a', (i + 1) % a),
-                 ('b', (i + 1) % b), ('b', i)] for i in range(a)]
-
-    faces = []
-    i = j = 0
-    # We must lay down exactly `a` steps along ring a and `b` along ring b.
-    while i < a or j < b:
-        ni = (i + 1) % a
-        nj = (j + 1) % b
-        if j >= b:                         # only ring-a edges remain
-            advance_a = True
-        elif i >= a:                       # only ring-b edges remain
-            advance_a = False
-        else:
-            # Triangle A: consume an a-edge -> diagonal (a[ni] .. b[j]).
-            # Triangle B: consume a b-edge -> diagonal (b[nj] .. a[i]).
-            diag_a = (pos_a[ni] - pos_b[j % b]).length
-            diag_b = (pos_b[nj] - pos_a[i % a]).length
-            advance_a = diag_a <= diag_b
-
-        if advance_a:
-            faces.append([('a', i % a), ('a', ni), ('b', j % b)])
-            i += 1
-        else:
-            faces.append([('a', i % a), ('b', nj), ('b', j % b)])
-            j += 1
-    return faces
+    return [Vector(p) for p in
+            circle_positions_array(center, normal, count,
+                                   start_angle=start_angle, radius=radius,
+                                   winding=winding).tolist()]
@@ -0,0 +1,293 @@
+"""Lofting two rings or chains of points into faces, for Re-circle's bridges.
+
+Plain NumPy on coordinate arrays, and nothing else: no `mathutils`, no bmesh,
+no imports from the rest of the add-on. That's so parallel.py can run
+`plan_bridges` in spawned worker processes, which load this file on its own
+without the add-on package (or Blender) around it. geometry.py re-exports
+everything public here.
+"""
+
+import math
+
+import numpy as np
+
+EPS = 1e-9      # as geometry.EPS
+
+
+def _as_points(points):
+    return np.asarray(points, dtype=np.float64).reshape(-1, 3)
+
+
+def bridge_chain_face_indices(pos_a, pos_b, method='greedy'):
+    """Loft two ordered, *open* polylines into a face list.
+
+    The closed-ring version wraps around; this one stops at the ends, which is
+    what an arc needs — its two end vertices stay welded to whatever the run was
+    attached to. Same lofting (`method` as for `bridge_face_indices`), so
+    unequal counts come out as a clean triangle transition; equal counts come
+    out as quads.
+
+    Returns faces as lists of ('a'|'b', index) tags, like `bridge_face_indices`.
+    """
+    a, b = len(pos_a), len(pos_b)
+    if a < 2 or b < 2:
+        return []
+
+    if a == b:
+        return [[('a', i), ('a', i + 1), ('b', i + 1), ('b', i)]
+                for i in range(a - 1)]
+
+    pa, pb = _as_points(pos_a), _as_points(pos_b)
+    if method == 'optimal':
+        steps, _ = _loft_optimal(pa, pb, closed=False)
+    else:
+        steps = _loft_greedy(pa, pb, closed=False)
+    return _loft_faces(steps, a, b)
+
+
+def align_ring(positions_ref, positions_move):
+    """Roll/flip `positions_move` so it best lines up with `positions_ref`.
+
+    Both are ordered rings of points (not necessarily equal length). Returns
+    the index order (list of ints into `positions_move`) that, read in
+    sequence, lines up with `positions_ref` starting at its vert 0 and running
+    the same way round.
+
+    Every rotation in both directions is scored at once: `positions_ref` is
+    resampled (by arc fraction) to the length of `positions_move`, and the
+    summed squared distance between matched verts comes out of one circular
+    cross-correlation (forward) and one convolution (reversed), both via FFT —
+    O(m log m) for the lot. The winner is the alignment with the least total
+    mismatch, which is far steadier on noisy neighbour loops than anchoring on
+    the single nearest vertex.
+
+    Used to phase-match a neighbour loop to the freshly built circle before
+    bridging, so the transition faces don't spiral.
+    """
+    move = np.asarray(positions_move, dtype=np.float64).reshape(-1, 3)
+    m = len(move)
+    if m == 0:
+        return []
+    ref = _resample_closed(np.asarray(positions_ref, dtype=np.float64)
+                           .reshape(-1, 3), m)
+
+    # |r - m|^2 summed = const - 2 * (r . m); maximise the dot-product term.
+    f_ref = np.fft.rfft(ref, axis=0)
+    f_move = np.fft.rfft(move, axis=0)
+    fwd = np.fft.irfft(np.conj(f_ref) * f_move, n=m, axis=0).sum(axis=1)
+    best_fwd = int(np.argmax(fwd))
+    if m > 2:
+        bwd = np.fft.irfft(f_ref * f_move, n=m, axis=0).sum(axis=1)
+        best_bwd = int(np.argmax(bwd))
+        if bwd[best_bwd] > fwd[best_fwd] + EPS * max(abs(fwd[best_fwd]), 1.0):
+            return [(best_bwd - k) % m for k in range(m)]
+    return [(best_fwd + k) % m for k in range(m)]
+
+
+def _resample_closed(points, count):
+    """`count` points spaced by index fraction around the closed ring `points`.
+
+    Linear interpolation between neighbouring verts; a ring already `count`
+    long comes back unchanged.
+    """
+    n = len(points)
+    if n == count or n == 0:
+        return points
+    t = np.arange(count, dtype=np.float64) * (n / count)
+    i0 = np.floor(t).astype(np.int64) % n
+    frac = (t - np.floor(t))[:, None]
+    return points[i0] * (1.0 - frac) + points[(i0 + 1) % n] * frac
+
+
+def bridge_face_indices(pos_a, pos_b, method='greedy'):
+    """Loft two ordered, phase-aligned closed rings into a face list.
+
+    `pos_a` / `pos_b` are the two rings (Vectors or an (N, 3) array), already
+    rolled so index 0 corresponds and both run the same direction. Returns a
+    list of faces, each a list of ('a'|'b', index) tags.
+
+    Equal-length rings become clean quads. Unequal rings are lofted one of two
+    ways:
+
+      * 'greedy' — a two-pointer walk that, at each step, adds the triangle
+        with the shorter new diagonal; the standard way to bridge polylines of
+        differing vertex counts, and cheap.
+      * 'optimal' — the triangulation with the least *total* diagonal length,
+        found by dynamic programming over the whole (a x b) grid of diagonals.
+        It doesn't commit to a locally short diagonal that forces long slivers
+        further round, which is what greedy does on big count differences
+        (512 -> 24, say). The seam is tried at a few positions around b's vert
+        0 and the cheapest kept.
+    """
+    a, b = len(pos_a), len(pos_b)
+    if a < 2 or b < 2:
+        return []
+
+    if a == b:
+        return [[('a', i), ('a', (i + 1) % a),
+                 ('b', (i + 1) % b), ('b', i)] for i in range(a)]
+
+    pa, pb = _as_points(pos_a), _as_points(pos_b)
+    if method != 'optimal':
+        return _loft_faces(_loft_greedy(pa, pb, closed=True), a, b)
+
+    best = None
+    span = -(-b // a)                     # b-verts per a-step, rounded up
+    shifts = {0, 1, b - 1}
+    shifts.update(int(round(k * span / 2.0)) % b for k in (-2, -1, 1, 2))
+    for shift in sorted(shifts):
+        steps, cost = _loft_optimal(pa, np.roll(pb, -shift, axis=0),
+                                    closed=True)
+        if best is None or cost < best[0] - EPS:
+            best = (cost, steps, shift)
+    _, steps, shift = best
+    return _loft_faces(steps, a, b, shift=shift)
+
+
+# ------------------------------------------------------------------ lofting
+#
+# A loft between runs of a and b verts is a monotone path through an (i, j)
+# grid: each step either consumes an a-edge (triangle a[i], a[i+1], b[j]) or a
+# b-edge (triangle a[i], b[j+1], b[j]), and the new diagonal it draws is
+# a[i+1]-b[j] or b[j+1]-a[i]. Closed rings take a steps and b steps (indices
+# wrap); open chains take a-1 and b-1. Steps are recorded as booleans, True for
+# "advance along a".
+
+# Above this many (a x b) cells the greedy walk measures diagonals as it goes
+# rather than precomputing the whole distance table.
+_DENSE_LOFT_CELLS = 1 << 22
+
+
+def _distance_table(pa, pb):
+    """(a, b) array of |pa[i] - pb[j]|."""
+    sq = (np.sum(pa * pa, axis=1)[:, None] + np.sum(pb * pb, axis=1)[None, :]
+          - 2.0 * (pa @ pb.T))
+    return np.sqrt(np.maximum(sq, 0.0))
+
+
+def _loft_greedy(pa, pb, closed):
+    """The shortest-next-diagonal walk, reading from a precomputed table."""
+    a, b = len(pa), len(pb)
+    na, nb = (a, b) if closed else (a - 1, b - 1)
+    if a * b <= _DENSE_LOFT_CELLS:
+        table = _distance_table(pa, pb).tolist()
+
+        def dist(i, j):
+            return table[i][j]
+    else:
+        la, lb = pa.tolist(), pb.tolist()
+
+        def dist(i, j):
+            return math.dist(la[i], lb[j])
+
+    steps = []
+    i = j = 0
+    while i < na or j < nb:
+        if j >= nb:                        # only ring-a edges remain
+            advance_a = True
+        elif i >= na:                      # only ring-b edges remain
+            advance_a = False
+        else:
+            # Triangle A draws a[i+1]..b[j]; triangle B draws b[j+1]..a[i].
+            advance_a = (dist((i + 1) % a, j % b)
+                         <= dist(i % a, (j + 1) % b))
+        steps.append(advance_a)
+        if advance_a:
+            i += 1
+        else:
+            j += 1
+    return steps
+
+
+def _loft_optimal(pa, pb, closed):
+    """Minimum-total-diagonal loft: (steps, total diagonal length).
+
+    Row i of the cost grid depends on row i-1 through the a-steps and on itself
+    through the b-steps; the latter is a running minimum, so each row is a few
+    whole-array NumPy calls (`np.minimum.accumulate`) and the DP costs
+    O(a*b) work in O(min(a, b)) Python iterations.
+    """
+    a, b = len(pa), len(pb)
+    na, nb = (a, b) if closed else (a - 1, b - 1)
+    table = _distance_table(pa, pb)
+    ia, ib = np.arange(na + 1), np.arange(nb + 1)
+    # cost_a[i, j]: step (i, j) -> (i+1, j); cost_b[i, j]: (i, j) -> (i, j+1).
+    cost_a = table[np.ix_((ia[:-1] + 1) % a, ib % b)]
+    cost_b = table[np.ix_(ia % a, (ib[:-1] + 1) % b)]
+
+    if na > nb:                            # iterate over the shorter side
+        steps, total = _grid_path(cost_b.T, cost_a.T)
+        return [not s for s in steps], total
+    return _grid_path(cost_a, cost_b)
+
+
+def _grid_path(cost_a, cost_b):
+    """Cheapest monotone path from (0, 0) to the far corner of the grid.
+
+    `cost_a` is (rows-1, cols) — moving down a row; `cost_b` is (rows,
+    cols-1) — moving along a row. Returns (steps, total), steps True for
+    "down".
+    """
+    rows, cols = cost_b.shape[0], cost_a.shape[1]
+    from_up = np.zeros((rows, cols), dtype=bool)
+    along = np.concatenate(([0.0], np.cumsum(cost_b[0])))
+    cur = along
+    for i in range(1, rows):
+        along = np.concatenate(([0.0], np.cumsum(cost_b[i])))
+        reach = cur + cost_a[i - 1] - along
+        best = np.minimum.accumulate(reach)
+        from_up[i] = reach <= best
+        cur = along + best
+
+    steps = []
+    i, j = rows - 1, cols - 1
+    while i > 0 or j > 0:
+        if i > 0 and from_up[i, j]:
+            steps.append(True)
+            i -= 1
+        else:
+            steps.append(False)
+            j -= 1
+    steps.reverse()
+    return steps, float(cur[-1])
+
+
+def _loft_faces(steps, a, b, shift=0):
+    """Face tags for a step sequence; b indices are rolled back by `shift`."""
+    faces = []
+    i = j = 0
+    for advance_a in steps:
+        if advance_a:
+            faces.append([('a', i % a), ('a', (i + 1) % a),
+                          ('b', (j + shift) % b)])
+            i += 1
+        else:
+            faces.append([('a', i % a), ('b', (j + 1 + shift) % b),
+                          ('b', (j + shift) % b)])
+            j += 1
+    return faces
+
+
+# ----------------------------------------------------------- rebuild planning
+#
+# Whole bridges as plain functions of coordinate arrays: the operator calls
+# them directly, or fans them out over a process pool (see parallel.py) for big
+# selections. Either way the same code runs on the same inputs, one pair at a
+# time, so the answers are identical.
+
+def plan_bridge(pos_a, pos_b, method="greedy"):
+    """(order, faces) to loft closed ring `pos_a` to closed ring `pos_b`.
+
+    `order` rolls (and possibly reverses) ring b to line up with ring a, as
+    `align_ring` returns it; `faces` is `bridge_face_indices` on the aligned
+    pair.
+    """
+    pos_a = np.asarray(pos_a, dtype=np.float64).reshape(-1, 3)
+    pos_b = np.asarray(pos_b, dtype=np.float64).reshape(-1, 3)
+    order = align_ring(pos_a, pos_b)
+    return order, bridge_face_indices(pos_a, pos_b[order], method=method)
+
+
+def plan_bridges(pairs, method="greedy"):
+    """`plan_bridge` for each (pos_a, pos_b) of `pairs`."""
+    return [plan_bridge(pos_a, pos_b, method) for pos_a, pos_b in pairs]
@@ -28,56 +28,162 @@ perpendicular edge *ring* of rungs.
 """
 
 import math
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 import bmesh
 import bpy
+import numpy as np
 from bpy.types import Operator
 from bpy.props import (
     BoolProperty, EnumProperty, FloatProperty, IntProperty, StringProperty,
 )
-from mathutils import Matrix
+from mathutils import Matrix, Vector
 
+from . import cache, parallel, profiling
+from .bulk import GeometryBuilder, stored_coords
 from .geometry import (
-    EPS, align_ring, arc_gap_angles, bridge_chain_face_indices,
-    bridge_face_indices, circle_frame, circle_positions, fit_circle, fit_plane,
-    point_angles, point_at_angle, resample_arc, resample_ring, unwrap_angles,
+    EPS, bridge_chain_face_indices, circle_positions_array, circular_runs,
+    coaxial_groups, fit_circles_packed, gap_angles, pack_runs, plan_bridge,
+    plan_bridges, plane_bases, point_at_angle, resample_arc_array,
+    resample_rings_packed, run_ids, shared_axes,
 )
+from .preview import RunPreview
+from .runs import SWEEP_BINS, RunSet
 from .topology import (
-    boundary_chains, boundary_cycles, chain_edges, curve_edges, cycle_edges,
-    edge_between, orient_new_faces, selected_curves,
+    EdgeIndex, boundary_chains, boundary_cycles, chain_edges, curve_edges,
+    cycle_edges, edge_loops_indexed, mesh_arrays, ordered_components_indexed,
+    orient_new_faces, selected_curves, selected_edge_indices, vertex_coords,
 )
 
 
 # ------------------------------------------------------------ shared helpers
 
-def gather_curves(bm):
+# From this many edges up, syncing the mesh once and reading the selection with
+# `foreach_get` beats an index pass over `bm.edges` in Python.
+MESH_SYNC_EDGES = 100_000
+
+
+def gather_curves(bm, mesh=None):
     """Selected edges as ordered runs: [{'verts': [...], 'closed': bool}, ...].
 
-    Returns (curves, n_bad); closed loops come first.
+    Returns (curves, n_bad); closed loops come first. `mesh` is the synced mesh
+    data to read the selection from, see `selected_curves`.
     """
-    cycles, chains, n_bad = selected_curves(bm)
+    cycles, chains, n_bad = selected_curves(bm, mesh)
     curves = [{"verts": c, "closed": True} for c in cycles]
     curves += [{"verts": c, "closed": False} for c in chains]
     return curves, n_bad
 
 
-def circle_of(verts, radius_override=0.0):
+def coords_of(verts):
+    """Vertex coordinates as an (N, 3) float64 array, for the `*_array` helpers."""
+    return np.array([v.co[:] for v in verts], dtype=np.float64).reshape(-1, 3)
+
+
+def fit_selection(bm, mesh=None, name="", timer=None, method="algebraic",
+                  tolerance=0.02):
+    """The selection's runs and their fits, from the redo cache when possible.
+
+    Returns (runs, n_bad, fits): `runs` is a list of (vertex indices, closed)
+    for every run of three or more verts with a usable fit, closed loops
+    first; `fits` is the matching dict of arrays from `fit_circles_packed`.
+    Between redo-panel steps the selection and coordinates come back identical,
+    so after the first run this is just the cost of reading them and hashing
+    (see cache.py). The result is shared with the cache — don't modify it.
+
+    `timer` (a profiling.StageTimer) gets "select", "order" and "fit" stages;
+    `method` and `tolerance` are passed on to `fit_circles_packed`. A robust
+    fit's inlier mask comes back split per run, as `fits["inliers"]`.
+    """
+    timer = timer or profiling.StageTimer()
+    with timer.stage("select") as rec:
+        edges = selected_edge_indices(bm, mesh)
+        ids = np.unique(edges)
+        co = vertex_coords(bm, ids, mesh)
+        # Only a robust fit reads `tolerance`; the others keep their cache
+        # entry while it changes.
+        key = cache.content_key(
+            edges, co, extra=(name, method,
+                              tolerance if method == "robust" else None,
+                              len(bm.verts), len(bm.edges), len(bm.faces)))
+        rec["count"] = len(edges)
+    hit = cache.fits.get(key)
+    if hit is not None:
+        with timer.stage("cached", len(hit[0])):
+            pass
+        return hit
+
+    with timer.stage("order") as rec:
+        cycles, chains, n_bad = ordered_components_indexed(edges)
+        runs = [(c, True) for c in cycles if len(c) >= 3]
+        runs += [(c, False) for c in chains if len(c) >= 3]
+        rec["count"] = len(runs)
+    with timer.stage("fit") as rec:
+        counts = np.array([len(r) for r, _ in runs], dtype=np.int64)
+        starts = np.zeros_like(counts)
+        np.cumsum(counts[:-1], out=starts[1:])
+        flat = (np.concatenate([r for r, _ in runs]) if runs
+                else np.zeros(0, dtype=np.int64))
+        fits = fit_circles_packed(co[np.searchsorted(ids, flat)], starts,
+                                  counts, method=method, tolerance=tolerance)
+        if "inliers" in fits:
+            per_run = np.empty(len(runs), dtype=object)
+            for i, (s, n) in enumerate(zip(starts.tolist(), counts.tolist())):
+                per_run[i] = fits["inliers"][s:s + n]
+            fits["inliers"] = per_run
+        rec["count"] = len(flat)
+
+    keep = np.flatnonzero(fits["ok"])
+    value = ([runs[i] for i in keep], n_bad,
+             {k: a[keep] for k, a in fits.items()})
+    cache.fits.put(key, value)
+    return value
+
+
+def fit_dicts(fits, radius_override=0.0):
+    """Per-run fit dicts (see `circle_of`) from a dict of fit arrays.
+
+    None where the row's `ok` flag is off. A robust fit's per-run inlier mask
+    (see `fit_selection`) is passed through as "inliers".
+    """
+    out = []
+    for i in range(len(fits["ok"])):
+        if not fits["ok"][i]:
+            out.append(None)
+            continue
+        radius = float(fits["radius"][i])
+        out.append({
+            "center": Vector(fits["center"][i]),
+            "normal": Vector(fits["normal"][i]),
+            "u": Vector(fits["u"][i]), "v": Vector(fits["v"][i]),
+            "centroid": Vector(fits["centroid"][i]),
+            "radius": radius_override if radius_override > 0.0 else radius,
+            "fit_radius": radius,
+            "inliers": fits["inliers"][i] if "inliers" in fits else None,
+        })
+    return out
+
+
+def circles_of(runs, radius_override=0.0, method="algebraic"):
+    """Best-fit circles for many vertex runs, fitted as one batch.
+
+    Returns one dict per run (see `circle_of`), or None where the run is
+    degenerate — the same answer `circle_of` gives run by run.
+    """
+    fits = fit_circles_packed(*pack_runs([coords_of(verts) for verts in runs]),
+                              method=method)
+    return fit_dicts(fits, radius_override)
+
+
+def circle_of(verts, radius_override=0.0, method="algebraic"):
     """Best-fit circle through `verts` as a dict, or None if degenerate.
 
-    Keys: center, normal, radius, u, v (the in-plane basis) — plus `fit_radius`,
-    the radius before any override.
+    Keys: center, normal, radius, u, v (the in-plane basis), centroid (of the
+    fitted plane) — plus `fit_radius`, the radius before any override, and
+    `inliers` (None unless the fit is robust). `method` is one of
+    geometry.FIT_METHODS.
     """
-    pts = [v.co.copy() for v in verts]
-    center, normal, radius = fit_circle(pts)
-    if center is None or normal is None or normal.length < EPS:
-        return None
-    c, u, v = circle_frame(center, normal)
-    return {
-        "center": c, "normal": normal, "u": u, "v": v,
-        "radius": radius_override if radius_override > 0.0 else radius,
-        "fit_radius": radius,
-    }
+    return circles_of([verts], radius_override, method)[0]
 
 
 def no_selection_message(n_bad):
@@ -88,21 +194,21 @@ def no_selection_message(n_bad):
             "(Alt-click the loop that runs around the object).")
 
 
-def is_wire_run(verts, closed):
+def is_wire_run(verts, closed, index=None):
     """True when no edge of this run carries a face."""
-    for e in curve_edges(verts, closed):
+    for e in curve_edges(verts, closed, index):
         if e.link_faces:
             return False
     return True
 
 
-def is_free_run(verts, closed):
+def is_free_run(verts, closed, index=None):
     """True when the run is wire *and* nothing else hangs off it.
 
     Such a run can be thrown away and rebuilt from scratch — nothing outside it
     references its vertices.
     """
-    edges = set(curve_edges(verts, closed))
+    edges = set(curve_edges(verts, closed, index))
     for v in verts:
         if v.link_faces:
             return False
@@ -122,33 +228,38 @@ def select_only(bm, verts):
     bm.select_flush(True)
 
 
-def sweep_of(fit, verts):
-    """Signed angular sweep (radians) covered by an ordered run."""
-    ang = unwrap_angles(point_angles(fit["center"], fit["u"], fit["v"],
-                                    [v.co for v in verts]))
-    return ang[-1] - ang[0], ang
-
-
-def describe(entries, n_bad):
-    """The read-out shown at the top of the redo panel."""
-    if not entries:
+def describe(runs, n_bad):
+    """The read-out shown at the top of the redo panel, for a `RunSet`."""
+    if not len(runs):
         return ""
-    loops = [e for e in entries if e["closed"]]
-    arcs = [e for e in entries if not e["closed"]]
-    first = entries[0]
+    info = runs.summary()
     bits = []
-    if len(entries) == 1:
-        kind = "Loop" if first["closed"] else "Arc"
-        bits.append(f"{kind} · {len(first['verts'])} verts")
-        if not first["closed"]:
-            sweep, _ = sweep_of(first["fit"], first["verts"])
-            bits.append(f"{abs(math.degrees(sweep)):.0f}°")
+    if info["runs"] == 1:
+        closed = bool(runs.closed[0])
+        kind = "Loop" if closed else "Arc"
+        bits.append(f"{kind} · {int(runs.counts[0])} verts")
+        if not closed:
+            bits.append(f"{abs(math.degrees(runs.stats()['sweep'][0])):.0f}°")
+        bits.append(f"r {info['radius_mean']:.4f}")
     else:
-        if loops:
-            bits.append(f"{len(loops)} loop(s)")
-        if arcs:
-            bits.append(f"{len(arcs)} arc(s)")
-    bits.append(f"r {first['fit']['fit_radius']:.4f}")
+        if info["loops"]:
+            bits.append(f"{info['loops']} loop(s)")
+        if info["arcs"]:
+            bits.append(f"{info['arcs']} arc(s)")
+        if info["radius_max"] - info["radius_min"] > EPS:
+            bits.append(f"r {info['radius_min']:.4f}–{info['radius_max']:.4f} "
+                        f"(mean {info['radius_mean']:.4f})")
+        else:
+            bits.append(f"r {info['radius_mean']:.4f}")
+        sweeps = [f"≤{edge:.0f}°×{n}" for edge, n in
+                  zip(SWEEP_BINS[1:], info["sweep_hist"].tolist()) if n]
+        if sweeps:
+            bits.append("arcs " + " ".join(sweeps))
+    bits.append(f"dev {100.0 * info['residual_mean']:.2g}%"
+                + (f" (max {100.0 * info['residual_max']:.2g}%)"
+                   if info["runs"] > 1 else ""))
+    if info["outliers"]:
+        bits.append(f"{info['outliers']} outlier(s)")
     if n_bad:
         bits.append(f"{n_bad} skipped")
     return " · ".join(bits)
@@ -178,32 +289,63 @@ def _face_run_split(cycle, runset):
     return part, rest
 
 
-def _split_edge(edge, start, cuts):
-    """Cut `edge` `cuts` times, returning the new verts ordered from `start`.
+def bisect_pairs(bm, pairs, cuts, index):
+    """Cut the edge between each (a, b) of `pairs` `cuts` times, in one op.
 
-    Each split hands back the vertex it created, and the next split continues on
-    the far side of it, so the list comes out in walk order without any topology
-    searching. `bmesh.utils.edge_split` keeps the adjacent faces valid and — the
-    reason it's used over `bmesh.ops.subdivide_edges` — never invalidates the
-    other elements we're still holding references to. Positions are placeholders;
-    the caller moves them onto the circle.
+    Returns {(a, b): new verts in order from a to b} — and the same chain
+    reversed under (b, a) — for every pair that had an edge. One
+    `bmesh.ops.bisect_edges` call does all the cutting: unlike
+    `subdivide_edges` it only inserts verts along the edges (the faces keep
+    their shape, gaining the new verts as corners) and it never invalidates the
+    verts we're still holding. The order comes from walking each chain of new
+    verts from the old vert at one end to the one at the other. Positions are
+    placeholders; the caller moves them onto the circle. Every edge `index`
+    knew about may have been split, so it's reset.
     """
-    made = []
-    cur_edge, cur_vert = edge, start
-    for _ in range(max(int(cuts), 0)):
-        if cur_edge is None or not cur_edge.is_valid:
-            break
-        _, new_vert = bmesh.utils.edge_split(cur_edge, cur_vert, 0.5)
-        made.append(new_vert)
-        onward = [e for e in new_vert.link_edges if cur_vert not in e.verts]
-        if not onward:
-            break
-        cur_edge, cur_vert = onward[0], new_vert
-    return made
+    edges = [e for e in (index.get(a, b) for a, b in pairs) if e is not None]
+    if not edges or cuts < 1:
+        return {}
+    made = bmesh.ops.bisect_edges(bm, edges=edges, cuts=cuts)["geom_split"]
+    index.reset()
+    new = {ele for ele in made if isinstance(ele, bmesh.types.BMVert)}
+
+    chains = {}
+    walked = set()                     # (old end vert, first new vert)
+    for first in new:
+        for e in first.link_edges:
+            start = e.other_vert(first)
+            if start in new or (start, first) in walked:
+                continue
+            chain, prev, cur = [], start, first
+            while cur in new:
+                chain.append(cur)
+                onward = [g.other_vert(cur) for g in cur.link_edges]
+                onward = [w for w in onward if w != prev]
+                if len(onward) != 1:
+                    break
+                prev, cur = cur, onward[0]
+            if cur in new:
+                continue               # not a clean chain; leave it be
+            walked.add((cur, chain[-1]))
+            chains[(start, cur)] = chain
+            chains[(cur, start)] = chain[::-1]
+    return chains
 
 
 # --------------------------------------------------------------- the operator
 
+FIT_METHOD_ITEMS = [
+    ('ALGEBRAIC', "Algebraic", "One-shot least-squares (Kasa) fit — fastest, "
+                               "but reads short noisy arcs a little small"),
+    ('GEOMETRIC', "Geometric", "Refine the algebraic fit against the true "
+                               "point-to-circle distances — the right radius "
+                               "on partial arcs"),
+    ('ROBUST', "Robust", "Fit only the verts that agree on a circle, ignoring "
+                         "a bevel or notch in the run; Round to Circle leaves "
+                         "the outliers where they are"),
+]
+
+
 class MESH_OT_recircle(Operator):
     """Rebuild the selected edge loop(s) or arc(s) as clean circles.
 
@@ -265,11 +407,49 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
                     "tracks the roundest circle rather than the average point",
         default=True,
     )
+    fit_method: EnumProperty(
+        name="Fit",
+        description="How the circle is fitted to the selected verts",
+        items=FIT_METHOD_ITEMS,
+        default='ALGEBRAIC',
+    )
+    outlier_tolerance: FloatProperty(
+        name="Outlier Tolerance",
+        description="Robust fit: how far a vert may sit off the circle, as a "
+                    "fraction of the radius, and still count towards it",
+        default=0.02, min=0.0001, soft_max=0.2, precision=3,
+    )
+    coaxial: BoolProperty(
+        name="Shared Axis",
+        description="Put loops stacked on one axis — a pipe's or a bolt's "
+                    "rings — on a single axis fitted across all of them, and "
+                    "line their vertices up along it",
+        default=False,
+    )
+    coaxial_tolerance: FloatProperty(
+        name="Axis Tolerance",
+        description="Shared Axis: how far a loop's centre may sit off the axis, "
+                    "as a fraction of its radius, and how far its normal may "
+                    "tilt from it, in radians",
+        default=0.05, min=0.0001, soft_max=0.3, precision=3,
+    )
     fill_caps: BoolProperty(
         name="Rebuild Caps",
         description="Re-create a single n-gon cap where a loop bounded one",
         default=True,
     )
+    bridge_method: EnumProperty(
+        name="Bridging",
+        description="How a rebuilt run is lofted to a neighbour with a "
+                    "different vertex count",
+        items=[
+            ('GREEDY', "Greedy", "Shortest next diagonal at every step — fast"),
+            ('OPTIMAL', "Optimal", "Least total diagonal length over the whole "
+                                   "strip — avoids long slivers on big count "
+                                   "changes"),
+        ],
+        default='GREEDY',
+    )
 
     # --- extras ------------------------------------------------------------
     add_center_vertex: BoolProperty(
@@ -323,6 +503,7 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
     )
 
     _info_text = ""
+    _profile_lines = ()
 
     @classmethod
     def poll(cls, context):
@@ -342,6 +523,10 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
             row = layout.row()
             row.alignment = 'CENTER'
             row.label(text=self._info_text, icon='MESH_CIRCLE')
+        if self._profile_lines:
+            col = layout.box().column(align=True)
+            for line in self._profile_lines:
+                col.label(text=line, icon='TIME')
 
         col = layout.column(align=True)
         col.prop(self, "use_subdivide")
@@ -356,9 +541,16 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
         col.prop(self, "radius")
         col.prop(self, "offset")
         col.prop(self, "use_fit_center")
+        col.prop(self, "fit_method")
+        if self.fit_method == 'ROBUST':
+            col.prop(self, "outlier_tolerance")
+        col.prop(self, "coaxial")
+        if self.coaxial:
+            col.prop(self, "coaxial_tolerance")
         sub = col.column()
         sub.active = not self.use_subdivide and self.vertex_count > 0
         sub.prop(self, "fill_caps")
+        sub.prop(self, "bridge_method")
 
         layout.separator()
         col = layout.column(align=True)
@@ -386,41 +578,58 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
     def execute(self, context):
         obj = context.edit_object
         bm = bmesh.from_edit_mesh(obj.data)
-
-        curves, n_bad = gather_curves(bm)
-        entries = []
-        for curve in curves:
-            if len(curve["verts"]) < 3:
-                continue
-            fit = circle_of(curve["verts"], self.radius)
-            if fit is None:
-                continue
-            entries.append({"verts": curve["verts"], "closed": curve["closed"],
-                            "fit": fit})
-        if not entries:
+        # Edge lookups for this run only; every stage that makes or removes
+        # edges keeps it honest (see EdgeIndex).
+        self._edges = EdgeIndex()
+        profile, trace_path = profiling.settings(context, __package__)
+        timer = self._timer = profiling.StageTimer(profile)
+
+        mesh = None
+        if len(bm.edges) >= MESH_SYNC_EDGES:
+            with timer.stage("sync", len(bm.edges)):
+                obj.update_from_editmode()
+            mesh = obj.data
+        runs, n_bad, fits = fit_selection(bm, mesh, obj.data.name, timer,
+                                          method=self.fit_method.lower(),
+                                          tolerance=self.outlier_tolerance)
+        bm.verts.ensure_lookup_table()
+        runs = RunSet.from_indices(bm.verts, runs, fits, self.radius)
+        if not len(runs):
             type(self)._info_text = ""
+            type(self)._profile_lines = ()
             self.report({'ERROR'}, no_selection_message(n_bad))
             return {'CANCELLED'}
 
         # Snapshot for the panel read-out before anything moves.
-        type(self)._info_text = describe(entries, n_bad)
+        with timer.stage("describe", len(runs)):
+            type(self)._info_text = describe(runs, n_bad)
 
         actions = []
         notes = []
-        to_select = []
 
-        self._run_density(bm, entries, actions, notes)
-        self._run_round(entries, actions)
-        self._run_complete(bm, entries, actions)
+        if self.coaxial:
+            with timer.stage("axes", len(runs)):
+                self._lock_axes(runs, actions)
 
-        for entry in entries:
-            to_select += [v for v in entry["verts"] if v.is_valid]
+        n_verts = len(runs.verts)
+        with timer.stage("density", n_verts):
+            self._run_density(bm, runs, actions, notes)
+        with timer.stage("round", n_verts if self.round_to_circle else 0):
+            self._run_round(runs, actions)
+        with timer.stage("complete", len(runs) if self.complete else 0):
+            self._run_complete(bm, runs, actions)
 
-        to_select += self._run_extras(context, obj, bm, entries, actions)
+        to_select = [v for v in runs.all_verts() if v.is_valid]
 
-        if to_select:
-            select_only(bm, to_select)
-        bmesh.update_edit_mesh(obj.data)
+        with timer.stage("extras", len(runs)):
+            to_select += self._run_extras(context, obj, bm, runs, actions)
+
+        with timer.stage("update", len(to_select)):
+            if to_select:
+                select_only(bm, to_select)
+            bmesh.update_edit_mesh(obj.data)
+
+        self._finish_profile(obj, runs, trace_path)
 
         extra = f" ({n_bad} skipped)" if n_bad else ""
         tail = (" — " + "; ".join(notes)) if notes else ""
@@ -435,9 +644,72 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
                         f"Set a Vertex Count or tick an option (F9){extra}.")
         return {'FINISHED'}
 
+    def _finish_profile(self, obj, runs, trace_path):
+        """Publish the stage timings to the panel and, if asked, a JSON trace."""
+        timer = self._timer
+        type(self)._profile_lines = tuple(timer.lines()) if timer.enabled else ()
+        if not (timer.enabled and trace_path):
+            return
+        settings = {name: getattr(self, name) for name in (
+            "use_subdivide", "vertex_count", "cuts", "round_to_circle",
+            "complete", "radius", "use_fit_center", "fit_method", "outlier_tolerance",
+            "coaxial", "coaxial_tolerance", "bridge_method")}
+        if not timer.dump(bpy.path.abspath(trace_path),
+                          operator=self.bl_idname, mesh=obj.data.name,
+                          runs=len(runs), settings=settings):
+            self.report({'WARNING'}, f"Re-circle: couldn't write the profile "
+                                     f"trace to {trace_path}")
+
+    # ---------------------------------------------------------- shared axis
+
+    def _lock_axes(self, runs, actions):
+        """Move coaxial closed loops onto one shared axis per group.
+
+        Groups come from `coaxial_groups` and their axes from one batched
+        `shared_axes` solve. Every loop of a group gets the axis as its normal,
+        its centres (fitted and centroid) projected onto the axis, the group's
+        in-plane basis, and a phase — the angle of the group's first loop's
+        first vert — that resampling lays its first new vert at (turned by the
+        offset the way the loop winds), so the rebuilt rings line up instead of
+        each wobbling about its own fit.
+        """
+        rows = np.flatnonzero(runs.closed)
+        if len(rows) < 2:
+            return
+        labels = coaxial_groups(runs.center[rows], runs.normal[rows],
+                                runs.fit_radius[rows], self.coaxial_tolerance)
+        point, direction = shared_axes(runs.center[rows], runs.normal[rows],
+                                       labels)
+        shared = np.bincount(labels)[labels] >= 2
+        rows, labels = rows[shared], labels[shared]
+        if not len(rows):
+            return
+
+        d, p = direction[labels], point[labels]
+        for name in ("center", "centroid"):
+            c = getattr(runs, name)
+            c[rows] = p + np.sum((c[rows] - p) * d, axis=1, keepdims=True) * d
+        runs.normal[rows] = d
+        u, v = plane_bases(direction)
+        runs.u[rows], runs.v[rows] = u[labels], v[labels]
+        runs.touch(rows)
+
+        firsts = coords_of([runs.table[k] for k in
+                            runs.verts[runs.offsets[rows]].tolist()])
+        rel = firsts - runs.center[rows]
+        ang = np.arctan2(np.sum(rel * runs.v[rows], axis=1),
+                         np.sum(rel * runs.u[rows], axis=1))
+        groups, lead = np.unique(labels, return_index=True)
+        lead_angle = np.zeros(int(labels.max()) + 1)
+        lead_angle[groups] = ang[lead]
+        runs.phase = np.full(len(runs), np.nan)
+        runs.phase[rows] = lead_angle[labels]
+        actions.append(f"{len(groups)} shared axis/axes for {len(rows)} "
+                       f"loop(s)")
+
     # ------------------------------------------------------- stage: density
 
-    def _run_density(self, bm, entries, actions, notes):
+    def _run_density(self, bm, runs, actions, notes):
         """Resample or subdivide every run.
 
         A run whose topology we can't safely rebuild is left exactly as it was
@@ -445,13 +717,9 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
         so a partial failure never leaves half-rebuilt geometry behind.
         """
         if self.use_subdivide:
-            total = 0
-            for entry in entries:
-                merged, added = self._subdivide_run(bm, entry)
-                entry["verts"] = merged
-                total += added
+            total = self._subdivide_runs(bm, runs)
             if total:
-                actions.append(f"subdivided {len(entries)} run(s), "
+                actions.append(f"subdivided {len(runs)} run(s), "
                                f"+{total} vert(s)")
             return
 
@@ -459,29 +727,24 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
             return
 
         target = max(self.vertex_count, 3)
-        loops = [e for e in entries if e["closed"]]
-        arcs = [e for e in entries if not e["closed"]]
+        loops = np.flatnonzero(runs.closed).tolist()
+        arcs = np.flatnonzero(~runs.closed).tolist()
 
         if loops:
-            if any(len(e["verts"]) != target for e in loops):
-                rings = self._rebuild_loops(bm, [e["verts"] for e in loops])
-                if rings is None:
-                    notes.append(f"{len(loops)} loop(s) kept their count "
-                                 f"(degenerate — no plane to fit)")
-                    loops = []
-                else:
-                    for entry, ring in zip(loops, rings):
-                        entry["verts"] = ring
+            if np.any(runs.counts[loops] != target):
+                rings = self._rebuild_loops(bm, runs, loops)
+                runs.replace(dict(zip(loops, rings)))
             else:
-                for entry in loops:
-                    self._round_run(entry)
-            if loops:
-                actions.append(f"{len(loops)} loop(s) → {target} verts")
-
-        done = 0
-        for entry in arcs:
-            if self._resample_arc(bm, entry, target):
-                done += 1
+                self._round_runs(runs, loops)
+            actions.append(f"{len(loops)} loop(s) → {target} verts")
+
+        changes = {}
+        for i in arcs:
+            new_run = self._resample_arc(bm, runs, i, target)
+            if new_run is not None:
+                changes[i] = new_run
+        runs.replace(changes)
+        done = len(changes)
         if done:
             actions.append(f"{done} arc(s) → {target} verts"
                            + (" (whole circle)" if self.complete else ""))
@@ -490,41 +753,37 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
                          f"(faces span them in a way that can't be rebuilt "
                          f"safely — try Subdivide)")
 
-    def _resample_arc(self, bm, entry, target):
-        """Resample one arc; with Complete on, `target` counts the full circle."""
-        run = entry["verts"]
+    def _resample_arc(self, bm, runs, i, target):
+        """Resample arc i; with Complete on, `target` counts the full circle.
+
+        Returns the arc's verts afterwards, or None if it was left alone.
+        """
+        run = runs.run(i)
 
         if self.complete:
-            if is_free_run(run, False):
+            if is_free_run(run, False, self._edges):
                 # Nothing else references these verts, so we can lay down the
                 # ideal N-gon rather than a pinned approximation of one.
-                ring = self._rebuild_free_circle(bm, entry, target)
-                if ring is None:
-                    return False
-                entry["verts"], entry["closed"] = ring, True
-                return True
-            arc_target, gap = self._plan_complete(entry, target)
-            entry["gap_count"] = gap
+                ring = self._rebuild_free_circle(bm, runs, i, target)
+                if ring is not None:
+                    runs.closed[i] = True
+                return ring
+            arc_target, runs.gap[i] = self._plan_complete(runs, i, target)
         else:
             arc_target = target
 
         if arc_target == len(run):
-            self._round_run(entry)
-            return True
-        if is_wire_run(run, False):
-            new_run = self._rebuild_wire_arc(bm, entry, arc_target)
-        else:
-            new_run = self._rebuild_faced_arc(bm, entry, arc_target)
-        if new_run is None:
-            return False
-        entry["verts"] = new_run
-        return True
+            self._round_runs(runs, [i])
+            return run
+        if is_wire_run(run, False, self._edges):
+            return self._rebuild_wire_arc(bm, runs, i, arc_target)
+        return self._rebuild_faced_arc(bm, runs, i, arc_target)
 
-    def _plan_complete(self, entry, count):
+    def _plan_complete(self, runs, i, count):
         """(vertices for the arc, vertices for the gap) of a `count`-vert circle."""
-        sweep, _ = sweep_of(entry["fit"], entry["verts"])
+        sweep, n = runs.stats()["sweep"][i], int(runs.counts[i])
         if abs(sweep) < EPS:
-            return len(entry["verts"]), 0
+            return n, 0
         step = math.copysign(2.0 * math.pi / count, sweep)
         share = int(round(sweep / step)) + 1
         share = max(2, min(share, count))
@@ -532,136 +791,167 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
 
     # --------------------------------------------------------- stage: round
 
-    def _run_round(self, entries, actions):
+    def _run_round(self, runs, actions):
         if not self.round_to_circle:
             return
-        for entry in entries:
-            self._round_run(entry)
-        actions.append(f"rounded {len(entries)} run(s)")
+        kept = self._round_runs(runs)
+        actions.append(f"rounded {len(runs)} run(s)"
+                       + (f", {kept} outlier(s) left in place" if kept else ""))
 
-    def _round_run(self, entry):
-        """Project a run's vertices onto its circle, keeping their angles.
+    def _round_runs(self, runs, rows=None):
+        """Project runs' vertices onto their circles, all in one array pass.
 
         Closed loops additionally get evenly redistributed (that is the classic
         re-circle behaviour); an arc keeps each vertex where it is angularly, so
         its ends don't drift away from whatever they connect to.
+
+        Outliers of a robust fit stay where they are, and the rest of the run
+        is projected like an arc — spreading it evenly would drag the verts
+        either side of a notch into it. Returns how many outliers were kept.
+
+        `rows` picks the runs (default: all). The circles are the RunSet's own
+        fit — the one the selection was fitted with, so nothing is refitted —
+        and the coordinates are read once for every run and written back in
+        one pass.
         """
-        fit, run = entry["fit"], [v for v in entry["verts"] if v.is_valid]
-        if len(run) < 3:
-            return
-        if entry["closed"]:
-            centroid, normal, center = self._center_for(run)
-            if normal is None:
-                return
-            positions, _ = resample_ring(
-                centroid, normal, [v.co.copy() for v in run], len(run),
-                radius=self.radius, offset=self.offset, center=center,
-            )
-        else:
-            positions = [point_at_angle(fit["center"], fit["u"], fit["v"],
-                                        fit["radius"], a)
-                         for a in point_angles(fit["center"], fit["u"],
-                                               fit["v"], [v.co for v in run])]
-        for v, p in zip(run, positions):
-            v.co = p
-
-    def _center_for(self, verts):
-        """(centroid, normal, center) — centre may be the least-squares one."""
-        pts = [v.co for v in verts]
-        centroid, normal = fit_plane(pts)
-        if normal is None or normal.length < EPS:
-            return None, None, None
-        center = centroid
-        if self.use_fit_center:
-            fit = circle_of(verts)
-            if fit is not None:
-                center, normal = fit["center"], fit["normal"]
-        return centroid, normal, center
+        rows = (np.arange(len(runs)) if rows is None
+                else np.asarray(rows, dtype=np.int64))
+        counts = runs.counts[rows]
+        first = np.repeat(runs.offsets[rows] - (np.cumsum(counts) - counts),
+                          counts)
+        table = runs.table
+        verts = [table[k] for k in
+                 runs.verts[np.arange(len(first)) + first].tolist()]
+        outlier = runs.outlier[np.arange(len(first)) + first]
+        seg = run_ids(counts)
+
+        # Runs with fewer than three verts left are left alone.
+        valid = np.fromiter((v.is_valid for v in verts), dtype=bool,
+                            count=len(verts))
+        good = np.bincount(seg[valid], minlength=len(rows)) >= 3
+        use = valid & good[seg]
+        if not use.any():
+            return 0
+        verts = [v for v, ok in zip(verts, use.tolist()) if ok]
+        rows, seg = rows[good], np.cumsum(good)[seg[use]] - 1
+        outlier = outlier[use]
+        counts = np.bincount(seg, minlength=len(rows))
+        co = coords_of(verts)
+
+        # Arcs, and runs with outliers: straight out onto the circle.
+        center, u, v = runs.center[rows], runs.u[rows], runs.v[rows]
+        d = co - center[seg]
+        ang = np.arctan2(np.sum(d * v[seg], axis=1), np.sum(d * u[seg], axis=1))
+        r = runs.radius[rows][seg][:, None]
+        positions = center[seg] + r * (np.cos(ang)[:, None] * u[seg]
+                                       + np.sin(ang)[:, None] * v[seg])
+        positions[outlier] = co[outlier]
+
+        # Clean closed loops: evenly spaced, as `resample_ring_array` does.
+        ring = runs.closed[rows] & (np.bincount(seg, weights=outlier,
+                                                minlength=len(rows)) == 0)
+        if ring.any():
+            pick = ring[seg]
+            ring_counts = counts[ring]
+            ring_starts = np.cumsum(ring_counts) - ring_counts
+            loop_center = (runs.center if self.use_fit_center
+                           else runs.centroid)[rows[ring]]
+            frame = {"center": loop_center, "u": u[ring], "v": v[ring]}
+            radius = (np.full(len(ring_counts), self.radius)
+                      if self.radius > 0.0 else None)
+            phase = None if runs.phase is None else runs.phase[rows[ring]]
+            positions[pick] = resample_rings_packed(
+                co[pick], ring_starts, ring_counts, frame, radius=radius,
+                offset=self.offset, phase=phase)
+
+        for vert, p, still in zip(verts, positions.tolist(), outlier.tolist()):
+            if not still:
+                vert.co = p
+        runs.touch(rows)
+        return int(np.count_nonzero(outlier))
 
     # ------------------------------------------------------ stage: complete
 
-    def _run_complete(self, bm, entries, actions):
+    def _run_complete(self, bm, runs, actions):
         if not self.complete:
             return
         made = 0
-        closed = 0
-        for entry in entries:
-            if entry["closed"]:
-                continue
-            new = self._complete_run(bm, entry)
+        changes = {}
+        for i in np.flatnonzero(~runs.closed).tolist():
+            new = self._complete_run(bm, runs, i)
             if new is None:
                 continue
-            entry["verts"] = entry["verts"] + new
-            entry["closed"] = True
+            changes[i] = runs.run(i) + new
+            runs.closed[i] = True
             made += len(new)
-            closed += 1
-        if closed:
-            actions.append(f"closed {closed} arc(s), +{made} vert(s)")
+        runs.replace(changes)
+        if changes:
+            actions.append(f"closed {len(changes)} arc(s), +{made} vert(s)")
 
-    def _complete_run(self, bm, entry):
-        """Wire the missing sweep of an arc, returning the new verts."""
-        run, fit = [v for v in entry["verts"] if v.is_valid], entry["fit"]
+    def _complete_run(self, bm, runs, i):
+        """Wire the missing sweep of arc i, returning the new verts."""
+        run, fit = [v for v in runs.run(i) if v.is_valid], runs.fit(i)
         if len(run) < 3:
             return None
-        _, angles = sweep_of(fit, run)
-        gap = arc_gap_angles(angles, entry.get("gap_count", 0))
+        st = runs.stats()
+        gap = gap_angles(st["start"][i], st["sweep"][i], len(run),
+                         int(runs.gap[i]))
         new = [bm.verts.new(point_at_angle(fit["center"], fit["u"], fit["v"],
                                            fit["radius"], a))
                for a in gap]
         chain = [run[-1]] + new + [run[0]]
         for a, b in zip(chain, chain[1:]):
-            if a is not b and edge_between(a, b) is None:
-                bm.edges.new((a, b))
+            if a is not b:
+                self._edges.ensure(bm, a, b)
         return new
 
     # -------------------------------------------------------- stage: extras
 
-    def _run_extras(self, context, obj, bm, entries, actions):
+    def _run_extras(self, context, obj, bm, runs, actions):
         made = []
         if self.add_center_vertex:
-            for entry in entries:
-                made.append(self._add_center_vertex(bm, entry))
-            actions.append(f"{len(entries)} centre vertex/vertices")
+            for i in range(len(runs)):
+                made.append(self._add_center_vertex(bm, runs, i))
+            actions.append(f"{len(runs)} centre vertex/vertices")
 
         if self.add_support_circle:
             names = []
-            for entry in entries:
-                ob = self._add_support_circle(context, obj, entry)
+            for i in range(len(runs)):
+                ob = self._add_support_circle(context, obj, runs, i)
                 if ob is not None:
                     names.append(ob.name)
             if names:
                 actions.append("added " + ", ".join(names))
 
         if self.snap_cursor:
-            self._snap_cursor(context, obj, entries[0])
+            self._snap_cursor(context, obj, runs.fit(0))
             actions.append("cursor to centre")
         return [v for v in made if v is not None]
 
-    def _add_center_vertex(self, bm, entry):
-        vert = bm.verts.new(entry["fit"]["center"])
-        if self.connect_center and not entry["closed"]:
-            run = [v for v in entry["verts"] if v.is_valid]
+    def _add_center_vertex(self, bm, runs, i):
+        vert = bm.verts.new(runs.center[i].tolist())
+        if self.connect_center and not runs.closed[i]:
+            run = [v for v in runs.run(i) if v.is_valid]
             for end in (run[0], run[-1]):
-                if edge_between(vert, end) is None:
-                    bm.edges.new((vert, end))
+                self._edges.ensure(bm, vert, end)
         return vert
 
-    def _support_segments(self, entry):
+    def _support_segments(self, runs, i):
         """Vertex count for the support circle: explicit, or the run's spacing."""
         if self.support_segments > 0:
             return max(int(self.support_segments), 3)
-        run = [v for v in entry["verts"] if v.is_valid]
-        if entry["closed"]:
+        run = [v for v in runs.run(i) if v.is_valid]
+        if runs.closed[i]:
             return max(len(run), 3)
-        sweep, _ = sweep_of(entry["fit"], run)
+        sweep = runs.stats()["sweep"][i]
         if abs(sweep) < EPS or len(run) < 2:
             return 32
         step = abs(sweep) / (len(run) - 1)
         return max(int(round(2.0 * math.pi / step)), 3)
 
-    def _add_support_circle(self, context, obj, entry):
-        fit = entry["fit"]
-        segments = self._support_segments(entry)
+    def _add_support_circle(self, context, obj, runs, i):
+        fit = runs.fit(i)
+        segments = self._support_segments(runs, i)
 
         mesh = bpy.data.meshes.new(self.support_name)
         tmp = bmesh.new()
@@ -692,8 +982,7 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
             pass                    # selecting while in edit mode is optional
         return ob
 
-    def _snap_cursor(self, context, obj, entry):
-        fit = entry["fit"]
+    def _snap_cursor(self, context, obj, fit):
         cursor = context.scene.cursor
         cursor.location = obj.matrix_world @ fit["center"]
         if not self.cursor_align:
@@ -710,64 +999,101 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
 
     # ------------------------------------------------------------ subdivide
 
-    def _subdivide_run(self, bm, entry):
-        """Cut every edge of a run and put the new verts on the circle."""
-        fit = entry["fit"]
-        run = [v for v in entry["verts"] if v.is_valid]
-        c, u, v = fit["center"], fit["u"], fit["v"]
-
-        pairs = list(zip(run, run[1:]))
-        if entry["closed"]:
-            pairs.append((run[-1], run[0]))
-
-        merged, added = [], 0
-        for a, b in pairs:
-            merged.append(a)
-            e = edge_between(a, b)
-            if e is None:
-                continue
-            inner = _split_edge(e, a, self.cuts)
-            if not inner:
-                continue
-            a_ang = point_angles(c, u, v, [a.co])[0]
-            b_ang = point_angles(c, u, v, [b.co])[0]
-            # Shortest wrap: neighbouring verts are always close in angle, so
-            # this picks the short way round even across the +/-pi seam.
-            delta = (b_ang - a_ang + math.pi) % (2.0 * math.pi) - math.pi
-            steps = len(inner) + 1
-            for k, vert in enumerate(inner):
-                vert.co = point_at_angle(c, u, v, fit["radius"],
-                                         a_ang + delta * (k + 1) / steps)
-            merged += inner
-            added += len(inner)
-        if not entry["closed"]:
-            merged.append(run[-1])
-        return merged, added
+    def _subdivide_runs(self, bm, runs):
+        """Cut every edge of every run and put the new verts on the circle.
+
+        All the cuts are planned first and made by a single `bisect_pairs`
+        call; the new positions then come from one array pass — each edge's two
+        end angles, the shortest way round between them, and the new verts
+        spaced evenly across that. Each run becomes its verts in walk order,
+        old and new interleaved. Returns how many verts were added.
+        """
+        plans = []
+        for i in range(len(runs)):
+            run = [v for v in runs.run(i) if v.is_valid]
+            pairs = list(zip(run, run[1:]))
+            if runs.closed[i]:
+                pairs.append((run[-1], run[0]))
+            plans.append((run, pairs))
+        chains = bisect_pairs(bm, [p for _, pairs in plans for p in pairs],
+                              self.cuts, self._edges)
+        if not chains:
+            return 0
+
+        # One row per cut edge: its ends, its run, its new verts.
+        ends_a, ends_b, rows, made = [], [], [], []
+        changes = {}
+        for i, (run, pairs) in enumerate(plans):
+            merged = []
+            for a, b in pairs:
+                merged.append(a)
+                inner = chains.get((a, b))
+                if inner:
+                    ends_a.append(a)
+                    ends_b.append(b)
+                    rows.append(i)
+                    made.append(inner)
+                    merged += inner
+            if not runs.closed[i]:
+                merged.append(run[-1])
+            changes[i] = merged
+        runs.replace(changes)
+        if not made:
+            return 0
+
+        center, u, v = runs.center[rows], runs.u[rows], runs.v[rows]
+        radius = runs.radius[rows]
+        da, db = coords_of(ends_a) - center, coords_of(ends_b) - center
+        a_ang = np.arctan2(np.sum(da * v, axis=1), np.sum(da * u, axis=1))
+        b_ang = np.arctan2(np.sum(db * v, axis=1), np.sum(db * u, axis=1))
+        # Shortest wrap: neighbouring verts are always close in angle, so this
+        # picks the short way round even across the +/-pi seam.
+        delta = (b_ang - a_ang + math.pi) % (2.0 * math.pi) - math.pi
+
+        sizes = np.array([len(inner) for inner in made])
+        row = np.repeat(np.arange(len(made)), sizes)
+        k = np.arange(len(row)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        ang = a_ang[row] + delta[row] * (k + 1) / (sizes[row] + 1)
+        positions = center[row] + radius[row][:, None] * (
+            np.cos(ang)[:, None] * u[row] + np.sin(ang)[:, None] * v[row])
+        flat = [vert for inner in made for vert in inner]
+        for vert, p in zip(flat, positions.tolist()):
+            vert.co = p
+        return len(flat)
 
     # ------------------------------------------------------- rebuild: loops
 
-    def _rebuild_loops(self, bm, loops):
-        """Rebuild closed loops at the target count, re-bridging their strips.
+    def _rebuild_loops(self, bm, runs, rows):
+        """Rebuild closed loops `rows` of `runs` at the target count,
+        re-bridging their strips.
 
-        Returns one new ring per input loop, or None if a loop was degenerate.
+        Returns one new ring per loop.
         """
         target = max(self.vertex_count, 3)
+        loops = [runs.run(i) for i in rows]
         loop_vset = set(v for loop in loops for v in loop)
 
-        # 1. Gather everything we need *before* mutating the mesh.
+        # 1. Gather everything we need *before* mutating the mesh. The new
+        # rings are laid onto the circles the selection was fitted with, all in
+        # one pass (with Shared Axis, phase-locked along each axis).
+        frame = {"center": (runs.center if self.use_fit_center
+                            else runs.centroid)[rows],
+                 "u": runs.u[rows], "v": runs.v[rows]}
+        radius = (np.full(len(rows), self.radius) if self.radius > 0.0
+                  else None)
+        phase = None if runs.phase is None else runs.phase[rows]
+        rings = list(resample_rings_packed(
+            *pack_runs([coords_of(loop) for loop in loops]), frame,
+            radius=radius, offset=self.offset, count=target, phase=phase,
+        ).reshape(len(rows), target, 3))
         infos = []
         strip_faces = set()
-        for loop in loops:
-            centroid, normal, center = self._center_for(loop)
-            if normal is None:
-                return None
-            positions, _ = resample_ring(
-                centroid, normal, [v.co.copy() for v in loop], target,
-                radius=self.radius, offset=self.offset, center=center,
-            )
+        # Neighbour vert -> the loops (indices into `infos`) it borders.
+        owners_of = defaultdict(list)
+        for k, (loop, positions) in enumerate(zip(loops, rings)):
             loopset = set(loop)
             faces = set()
-            for e in cycle_edges(loop):
+            for e in cycle_edges(loop, self._edges):
                 faces.update(e.link_faces)
             # Neighbour verts on the outward side(s): reachable via non-loop
             # edges and not part of *any* selected loop.
@@ -777,11 +1103,13 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
                     ov = e.other_vert(v)
                     if ov not in loop_vset:
                         nbrs.add(ov)
+            for v in nbrs:
+                owners_of[v].append(k)
             # A single-face n-gon cap: a face made entirely of this loop's verts.
             has_cap = any(set(f.verts) <= loopset for f in faces)
             strip_faces.update(faces)
             infos.append({"loop": loop, "positions": positions,
-                          "nbrs": nbrs, "has_cap": has_cap, "new": None})
+                          "has_cap": has_cap, "new": None})
 
         # Adjacency between selected loops (they share a strip face).
         loop_index = {v: i for i, loop in enumerate(loops) for v in loop}
@@ -793,103 +1121,120 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
                     if i < j:
                         adjacent_pairs.add((i, j))
 
-        # 2. Build the new ring verts (positions above are plain Vectors).
+        # 2. Queue the new rings; they and every face below are made in one
+        # go at the end (see bulk.py), so "new" holds builder ids until then.
+        builder = GeometryBuilder(bm)
         for info in infos:
-            ring = [bm.verts.new(p) for p in info["positions"]]
-            n = len(ring)
-            for i in range(n):
-                # bmesh raises if the edge already exists; it can't here.
-                bm.edges.new((ring[i], ring[(i + 1) % n]))
-            info["new"] = ring
+            info["new"] = builder.add_ring(info["positions"])
 
         # 3. Remove the old face strips (faces only) then the old loop verts.
         bmesh.ops.delete(bm, geom=[f for f in strip_faces if f.is_valid],
                          context='FACES_ONLY')
         bmesh.ops.delete(bm, geom=[v for v in loop_vset if v.is_valid],
                          context='VERTS')
-
-        new_faces = []
+        self._edges.reset()
 
         # 4a. Bridge new rings to the exposed neighbour loops. A neighbour ring
         # that sits between two rebuilt loops is claimed by both, so it must be
         # bridged on each side; hence "every owner that fully claims it", not
-        # just the nearest one.
-        all_nbrs = set(v for info in infos for v in info["nbrs"] if v.is_valid)
-        for bloop in boundary_cycles(all_nbrs):
-            bset = set(bloop)
-            owners = [info for info in infos if bset <= info["nbrs"]]
-            if not owners:
-                best = max(infos, key=lambda info: len(bset & info["nbrs"]))
-                if bset & best["nbrs"]:
-                    owners = [best]
-            for owner in owners:
-                new_faces += self._bridge_rings(bm, owner["new"], bloop)
+        # just the nearest one. Counting each ring's verts per owner through
+        # `owners_of` keeps this linear in the neighbours, however many loops
+        # there are.
+        bridges = []
+        for bloop in boundary_cycles([v for v in owners_of if v.is_valid]):
+            if len(bloop) < 2:
+                continue
+            claims = Counter(k for v in bloop for k in owners_of[v])
+            owners = sorted(k for k, n in claims.items() if n == len(bloop))
+            if not owners and claims:
+                owners = [max(sorted(claims), key=claims.get)]
+            for k in owners:
+                bridges.append((infos[k]["new"], bloop,
+                                stored_coords(infos[k]["positions"]),
+                                coords_of(bloop)))
 
         # 4b. Bridge between adjacent selected loops (same count -> clean quads).
-        for i, j in adjacent_pairs:
-            new_faces += self._bridge_rings(bm, infos[i]["new"], infos[j]["new"])
-
-        # 4c. Rebuild single-face caps on the new rings.
+        for i, j in sorted(adjacent_pairs):
+            bridges.append((infos[i]["new"], infos[j]["new"],
+                            stored_coords(infos[i]["positions"]),
+                            stored_coords(infos[j]["positions"])))
+
+        # Every ring's coordinates are known by now (new rings from the
+        # coordinates their verts will get), so all the lofts are planned in
+        # one batch, in the pool when it's big enough, then queued in order.
+        plans = parallel.map_chunks(
+            plan_bridges, [(a, b) for _, _, a, b in bridges],
+            self.bridge_method.lower())
+        for (ring_new, ring_other, _, _), plan in zip(bridges, plans):
+            self._bridge_rings(bm, ring_new, ring_other, plan, builder=builder)
+
+        # 4c. Rebuild single-face caps on the new rings. (If bridging on that
+        # side already closed one, the builder drops the repeat.)
         if self.fill_caps:
             for info in infos:
-                if not info["has_cap"]:
-                    continue
-                try:
-                    new_faces.append(bm.faces.new(info["new"]))
-                except ValueError:
-                    pass  # cap already closed by bridging on that side
+                if info["has_cap"]:
+                    builder.add_face(info["new"])
 
+        made, new_faces = builder.commit(self._edges)
         self._finish_faces(bm, new_faces)
-        return [info["new"] for info in infos]
+        return [[made[i] for i in info["new"]] for info in infos]
 
-    def _bridge_rings(self, bm, ring_new, ring_other):
-        """Loft `ring_new` to the closed ring `ring_other`, return new faces."""
-        ring_other = [v for v in ring_other if v.is_valid]
+    def _bridge_rings(self, bm, ring_new, ring_other, plan=None, builder=None):
+        """Loft `ring_new` to the closed ring `ring_other`, return new faces.
+
+        `plan` is a ready `plan_bridge` result for the pair, if there is one.
+        With a `builder` the faces are queued on it instead (and the rings may
+        hold its vert ids), so nothing is returned.
+        """
+        ring_other = [v for v in ring_other if isinstance(v, int) or v.is_valid]
         if len(ring_new) < 2 or len(ring_other) < 2:
             return []
-        pos_new = [v.co for v in ring_new]
-        order = align_ring(pos_new, [v.co for v in ring_other])
+        if plan is None:
+            coords = builder.coords if builder is not None else coords_of
+            plan = plan_bridge(coords(ring_new), coords(ring_other),
+                               self.bridge_method.lower())
+        order, specs = plan
         rb = [ring_other[k] for k in order]
-        return self._make_faces(bm, ring_new, rb,
-                                bridge_face_indices(pos_new,
-                                                    [v.co for v in rb]))
+        return self._make_faces(bm, ring_new, rb, specs, builder)
 
     # --------------------------------------------------------- rebuild: arcs
 
-    def _rebuild_free_circle(self, bm, entry, count):
-        """Replace a free-standing wire arc with the full `count`-vert circle."""
-        run, fit = entry["verts"], entry["fit"]
-        sweep, angles = sweep_of(fit, run)
-        winding = 1.0 if sweep >= 0.0 else -1.0
-        positions = circle_positions(fit["center"], fit["normal"], count,
-                                     start_angle=angles[0] + winding * self.offset,
-                                     radius=fit["radius"], winding=winding)
+    def _rebuild_free_circle(self, bm, runs, i, count):
+        """Replace free-standing wire arc i with the full `count`-vert circle."""
+        run, fit, st = runs.run(i), runs.fit(i), runs.stats()
+        winding = 1.0 if st["sweep"][i] >= 0.0 else -1.0
+        positions = circle_positions_array(
+            fit["center"], fit["normal"], count,
+            start_angle=st["start"][i] + winding * self.offset,
+            radius=fit["radius"], winding=winding)
         bmesh.ops.delete(bm, geom=[v for v in run if v.is_valid], context='VERTS')
-        ring = [bm.verts.new(p) for p in positions]
+        self._edges.reset()
+        ring = [bm.verts.new(p) for p in positions.tolist()]
         for i in range(count):
-            bm.edges.new((ring[i], ring[(i + 1) % count]))
+            self._edges.new(bm, ring[i], ring[(i + 1) % count])
         return ring
 
-    def _rebuild_wire_arc(self, bm, entry, target):
-        """Re-space a wire arc at a new vertex count, endpoints pinned."""
-        run, fit = entry["verts"], entry["fit"]
-        positions, _ = resample_arc(fit["center"], fit["normal"],
-                                    [v.co.copy() for v in run], target,
-                                    radius=fit["radius"])
+    def _rebuild_wire_arc(self, bm, runs, i, target):
+        """Re-space wire arc i at a new vertex count, endpoints pinned."""
+        run, fit = runs.run(i), runs.fit(i)
+        positions, _ = resample_arc_array(fit["center"], fit["normal"],
+                                          coords_of(run), target,
+                                          radius=fit["radius"])
         if len(positions) < 2:
             return None
         first, last = run[0], run[-1]
         interior = [v for v in run[1:-1] if v.is_valid]
         if interior:
             bmesh.ops.delete(bm, geom=interior, context='VERTS')
-        new_run = [first] + [bm.verts.new(p) for p in positions[1:-1]] + [last]
+        self._edges.reset()
+        new_run = ([first] + [bm.verts.new(p) for p in positions[1:-1].tolist()]
+                   + [last])
         for a, b in zip(new_run, new_run[1:]):
-            if edge_between(a, b) is None:
-                bm.edges.new((a, b))
+            self._edges.ensure(bm, a, b)
         return new_run
 
-    def _rebuild_faced_arc(self, bm, entry, target):
-        """Change a faced arc's vertex count, keeping the surface closed.
+    def _rebuild_faced_arc(self, bm, runs, i, target):
+        """Change faced arc i's vertex count, keeping the surface closed.
 
         Faces touching the arc fall into two kinds:
 
@@ -904,16 +1249,16 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
         and re-fanned. Returns None when the topology doesn't fit those cases,
         leaving the mesh untouched for the caller to report.
         """
-        run, fit = entry["verts"], entry["fit"]
-        positions, _ = resample_arc(fit["center"], fit["normal"],
-                                    [v.co.copy() for v in run], target,
-                                    radius=fit["radius"])
+        run, fit = runs.run(i), runs.fit(i)
+        positions, _ = resample_arc_array(fit["center"], fit["normal"],
+                                          coords_of(run), target,
+                                          radius=fit["radius"])
         if len(positions) < 2:
             return None
 
         runset = set(run)
         patch, seen = [], set()
-        for e in chain_edges(run):
+        for e in chain_edges(run, self._edges):
             for f in e.link_faces:
                 if f in seen:
                     continue
@@ -949,11 +1294,12 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
         interior = [v for v in run[1:-1] if v.is_valid]
         if interior:
             bmesh.ops.delete(bm, geom=interior, context='VERTS')
+        self._edges.reset()
 
-        new_run = [first] + [bm.verts.new(p) for p in positions[1:-1]] + [last]
+        new_run = ([first] + [bm.verts.new(p) for p in positions[1:-1].tolist()]
+                   + [last])
         for a, b in zip(new_run, new_run[1:]):
-            if edge_between(a, b) is None:
-                bm.edges.new((a, b))
+            self._edges.ensure(bm, a, b)
 
         new_faces = []
         for bchain in boundary_chains([v for v in chain_nbrs if v.is_valid]):
@@ -988,13 +1334,18 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
         if ((run_a[0].co - chain_b[0].co).length_squared >
                 (run_a[0].co - chain_b[-1].co).length_squared):
             chain_b = list(reversed(chain_b))
-        specs = bridge_chain_face_indices([v.co for v in run_a],
-                                          [v.co for v in chain_b])
+        specs = bridge_chain_face_indices(coords_of(run_a), coords_of(chain_b),
+                                          method=self.bridge_method.lower())
         return self._make_faces(bm, run_a, chain_b, specs)
 
     # ------------------------------------------------------- face plumbing
 
-    def _make_faces(self, bm, ring_a, ring_b, specs):
+    def _make_faces(self, bm, ring_a, ring_b, specs, builder=None):
+        if builder is not None:
+            for spec in specs:
+                builder.add_face([ring_a[i] if tag == 'a' else ring_b[i]
+                                  for tag, i in spec])
+            return []
         faces = []
         for spec in specs:
             verts = [ring_a[i] if tag == 'a' else ring_b[i] for tag, i in spec]
@@ -1008,11 +1359,344 @@ Open the redo panel (F9) to choose what to do — on its defaults nothing change
 
     def _finish_faces(self, bm, new_faces):
         """Point the freshly built faces the same way as their neighbours."""
-        unseeded = orient_new_faces(new_faces)
-        if unseeded:
-            comp = [f for f in new_faces if f.is_valid]
-            if comp:
-                bmesh.ops.recalc_face_normals(bm, faces=comp)
+        # `faces.new` made whatever edges it needed without telling the index.
+        self._edges.reset()
+        with self._timer.stage("faces", len(new_faces)):
+            unseeded = orient_new_faces(new_faces)
+            if unseeded:
+                comp = [f for f in new_faces if f.is_valid]
+                if comp:
+                    bmesh.ops.recalc_face_normals(bm, faces=comp)
+
+
+# ------------------------------------------------------- whole-mesh detect
+
+def detect_circular_loops(arrays, tolerance, min_count=6):
+    """Every closed edge loop of a mesh that is a circle within `tolerance`.
+
+    `arrays` is `mesh_arrays(mesh)`. Returns a dict: verts, edges, starts,
+    counts (the passing loops, packed as in `edge_loops_indexed`), their fit
+    arrays, residual, and `scanned` — how many loops were looked at.
+    """
+    verts, edges, starts, counts = edge_loops_indexed(
+        len(arrays["co"]), arrays["edges"], arrays["corner_verts"],
+        arrays["corner_edges"], arrays["face_starts"], arrays["face_sizes"])
+    fits, passed, residual = circular_runs(arrays["co"][verts], starts, counts,
+                                           tolerance, min_count)
+    keep = np.repeat(passed, counts)
+    counts = counts[passed]
+    new_starts = np.zeros_like(counts)
+    np.cumsum(counts[:-1], out=new_starts[1:])
+    return {
+        "verts": verts[keep], "edges": edges[keep],
+        "starts": new_starts, "counts": counts,
+        "fits": {k: a[passed] for k, a in fits.items()},
+        "residual": residual[passed], "scanned": len(passed),
+    }
+
+
+def disjoint_loops(found):
+    """Indices of found loops that share no vertex, best-fitting first.
+
+    Loops can cross (a sphere's rings and meridians are both circles); moving
+    a shared vertex onto two circles at once would tear both, so only the
+    better-fitting one of any crossing pair is kept.
+    """
+    taken = np.zeros(int(found["verts"].max()) + 1 if len(found["verts"])
+                     else 0, dtype=bool)
+    keep = []
+    for i in np.argsort(found["residual"], kind="stable").tolist():
+        s = found["starts"][i]
+        idx = found["verts"][s:s + found["counts"][i]]
+        if taken[idx].any():
+            continue
+        taken[idx] = True
+        keep.append(i)
+    return sorted(keep)
+
+
+def round_loops(co, found):
+    """Even out the loops `disjoint_loops` keeps on their fitted circles.
+
+    `co` is the mesh's (V, 3) coordinates and `found` a `detect_circular_loops`
+    result. Returns (keep, take, positions): the kept loops, the slots of their
+    verts in `found["verts"]` and the new (len(take), 3) coordinates for them.
+    """
+    keep = disjoint_loops(found)
+    if not keep:
+        return keep, np.zeros(0, dtype=np.int64), np.zeros((0, 3))
+    sub = {k: a[keep] for k, a in found["fits"].items()}
+    counts = found["counts"][keep]
+    take = np.concatenate([np.arange(found["starts"][i],
+                                     found["starts"][i] + found["counts"][i])
+                           for i in keep])
+    starts = np.zeros_like(counts)
+    np.cumsum(counts[:-1], out=starts[1:])
+    new = resample_rings_packed(co[found["verts"][take]], starts, counts, sub)
+    return keep, take, new
+
+
+class MESH_OT_recircle_detect(Operator):
+    """Find every edge loop in the mesh that is already (nearly) a circle.
+
+Selects them, or rounds them off to perfect circles in one go
+    """
+    bl_idname = "mesh.recircle_detect"
+    bl_label = "Detect Circles"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    tolerance: FloatProperty(
+        name="Tolerance",
+        description="How far a loop may stray from its fitted circle, as a "
+                    "fraction of the radius",
+        default=0.01, min=0.0, soft_max=0.2, precision=3,
+    )
+    min_verts: IntProperty(
+        name="Min Vertices",
+        description="Ignore loops with fewer vertices than this",
+        default=6, min=3, soft_max=64,
+    )
+    action: EnumProperty(
+        name="Action",
+        items=[
+            ('SELECT', "Select", "Select the circular loops, to Re-circle "
+                                 "them as you like"),
+            ('ROUND', "Round to Circle", "Evenly respace every circular loop "
+                                         "on its fitted circle"),
+        ],
+        default='SELECT',
+    )
+
+    _info_text = ""
+
+    @classmethod
+    def poll(cls, context):
+        return MESH_OT_recircle.poll(context)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+        if self._info_text:
+            row = layout.row()
+            row.alignment = 'CENTER'
+            row.label(text=self._info_text, icon='MESH_CIRCLE')
+        col = layout.column(align=True)
+        col.prop(self, "tolerance")
+        col.prop(self, "min_verts")
+        layout.prop(self, "action")
+
+    def execute(self, context):
+        obj = context.edit_object
+        obj.update_from_editmode()
+        arrays = mesh_arrays(obj.data)
+        found = detect_circular_loops(arrays, self.tolerance, self.min_verts)
+        n_found = len(found["counts"])
+        type(self)._info_text = (f"{n_found} of {found['scanned']} loop(s) "
+                                 f"circular")
+        if not n_found:
+            self.report({'INFO'}, f"Detect Circles: none of {found['scanned']} "
+                                  f"loop(s) is circular within tolerance.")
+            return {'CANCELLED'}
+
+        # Deselect through the operator: a Python pass over a big mesh's
+        # elements would cost more than the whole detection.
+        bpy.ops.mesh.select_all(action='DESELECT')
+        bm = bmesh.from_edit_mesh(obj.data)
+        bm.verts.ensure_lookup_table()
+        bm.edges.ensure_lookup_table()
+
+        done = n_found
+        picked = found["edges"]
+        if self.action == 'ROUND':
+            keep, take, new = round_loops(arrays["co"], found)
+            done = len(keep)
+            idx = found["verts"][take]
+            lookup = bm.verts
+            for i, co in zip(idx.tolist(), new.tolist()):
+                lookup[i].co = co
+            picked = found["edges"][take]
+
+        edges = bm.edges
+        for i in picked.tolist():
+            edges[i].select = True
+        bm.select_history.clear()
+        bmesh.update_edit_mesh(obj.data)
+
+        verb = "rounded" if self.action == 'ROUND' else "selected"
+        self.report({'INFO'}, f"Detect Circles: {verb} {done} of "
+                              f"{found['scanned']} loop(s).")
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------ modal preview
+
+# Mouse travel (pixels) per unit of each scrubbed setting.
+SCRUB_PIXELS = {'COUNT': 12.0, 'OFFSET': 200.0, 'RADIUS': 200.0}
+PREVIEW_KEYS = {'C': 'COUNT', 'O': 'OFFSET', 'R': 'RADIUS'}
+
+
+def _draw_preview(op):
+    op._preview.draw(op._matrix, op.vertex_count, op.offset, op.radius)
+
+
+class MESH_OT_recircle_preview(Operator):
+    """Preview a Re-circle in the viewport before making it.
+
+Drag to scrub the vertex count, offset or radius; click to Re-circle
+    """
+    bl_idname = "mesh.recircle_preview"
+    bl_label = "Re-circle Preview"
+    # No REGISTER/UNDO: the preview changes nothing itself. Confirming calls
+    # `mesh.recircle` with undo on (a call from Python is off by default), so
+    # that call pushes the undo step and is the operator F9 brings back.
+
+    vertex_count: IntProperty(
+        name="Vertex Count",
+        description="Vertex count to rebuild every run at; 0 keeps each run's "
+                    "own count and just rounds it",
+        default=0, min=0, soft_max=256, options={'SKIP_SAVE'},
+    )
+    radius: FloatProperty(
+        name="Radius",
+        description="Circle radius; 0 uses the fitted radius",
+        default=0.0, min=0.0, options={'SKIP_SAVE'},
+    )
+    offset: FloatProperty(
+        name="Offset",
+        description="Rotate the new vertices around the circle (closed loops)",
+        default=0.0, subtype='ANGLE', options={'SKIP_SAVE'},
+    )
+    use_fit_center: BoolProperty(
+        name="Fitted Center",
+        description="Use the least-squares circle centre instead of the plain "
+                    "centroid",
+        default=True,
+    )
+    fit_method: EnumProperty(
+        name="Fit",
+        description="How the circle is fitted to the selected verts",
+        items=FIT_METHOD_ITEMS,
+        default='ALGEBRAIC',
+    )
+    outlier_tolerance: FloatProperty(
+        name="Outlier Tolerance",
+        description="Robust fit: how far a vert may sit off the circle, as a "
+                    "fraction of the radius, and still count towards it",
+        default=0.02, min=0.0001, soft_max=0.2, precision=3,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return MESH_OT_recircle.poll(context)
+
+    def invoke(self, context, event):
+        if context.area is None or context.area.type != 'VIEW_3D':
+            self.report({'ERROR'}, "Re-circle Preview needs a 3D Viewport.")
+            return {'CANCELLED'}
+        obj = context.edit_object
+        bm = bmesh.from_edit_mesh(obj.data)
+        runs, n_bad, fits = fit_selection(bm, None, obj.data.name,
+                                          method=self.fit_method.lower(),
+                                          tolerance=self.outlier_tolerance)
+        bm.verts.ensure_lookup_table()
+        runs = RunSet.from_indices(bm.verts, runs, fits)
+        if not len(runs):
+            self.report({'ERROR'}, no_selection_message(n_bad))
+            return {'CANCELLED'}
+
+        # Everything the preview draws is worked out from these two reads;
+        # the mesh isn't touched until the rebuild on confirm.
+        self._preview = RunPreview(runs, coords_of(runs.all_verts()),
+                                   self.use_fit_center)
+        self._matrix = obj.matrix_world.copy()
+        self._first_count = int(runs.counts[0])
+        self._fit_radius = float(np.median(runs.fit_radius))
+        self._mode = 'COUNT'
+        self._anchor(event)
+        self._handle = bpy.types.SpaceView3D.draw_handler_add(
+            _draw_preview, (self,), 'WINDOW', 'POST_VIEW')
+        context.window_manager.modal_handler_add(self)
+        self._refresh(context)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'MOUSEMOVE':
+            self._scrub(event)
+        elif event.value != 'PRESS':
+            if event.type in {'MIDDLEMOUSE', 'TRACKPADPAN', 'TRACKPADZOOM'}:
+                return {'PASS_THROUGH'}
+            return {'RUNNING_MODAL'}
+        elif event.type in PREVIEW_KEYS:
+            self._mode = PREVIEW_KEYS[event.type]
+            self._anchor(event)
+        elif event.type in {'WHEELUPMOUSE', 'NUMPAD_PLUS', 'UP_ARROW'}:
+            self._step_count(1)
+            self._anchor(event)
+        elif event.type in {'WHEELDOWNMOUSE', 'NUMPAD_MINUS', 'DOWN_ARROW'}:
+            self._step_count(-1)
+            self._anchor(event)
+        elif event.type in {'LEFTMOUSE', 'RET', 'NUMPAD_ENTER'}:
+            self._finish(context)
+            return self._confirm()
+        elif event.type in {'RIGHTMOUSE', 'ESC'}:
+            self._finish(context)
+            return {'CANCELLED'}
+        elif event.type in {'MIDDLEMOUSE', 'TRACKPADPAN', 'TRACKPADZOOM'}:
+            return {'PASS_THROUGH'}
+        self._refresh(context)
+        return {'RUNNING_MODAL'}
+
+    def _anchor(self, event):
+        """Start scrubbing the current setting from the mouse's position."""
+        value = {'COUNT': self.vertex_count, 'OFFSET': self.offset,
+                 'RADIUS': self.radius or self._fit_radius}[self._mode]
+        self._start = (event.mouse_x, value)
+
+    def _scrub(self, event):
+        x0, value = self._start
+        delta = (event.mouse_x - x0) / SCRUB_PIXELS[self._mode]
+        if self._mode == 'COUNT':
+            count = int(round((value or self._first_count) + delta))
+            self.vertex_count = count if count >= 3 else 0
+        elif self._mode == 'OFFSET':
+            self.offset = value + delta
+        else:
+            self.radius = max(value * (1.0 + delta), EPS)
+
+    def _step_count(self, step):
+        count = (self.vertex_count or self._first_count) + step
+        self.vertex_count = count if count >= 3 else 0
+
+    def _refresh(self, context):
+        count = (f"{self.vertex_count}" if self.vertex_count
+                 else "as is (round)")
+        radius = f"{self.radius:.4f}" if self.radius else "fitted"
+        mode = {'COUNT': "Count", 'OFFSET': "Offset",
+                'RADIUS': "Radius"}[self._mode]
+        context.area.header_text_set(
+            f"Re-circle preview — Count {count} · Offset "
+            f"{math.degrees(self.offset):.1f}° · Radius {radius}   "
+            f"[drag: {mode}]  C/O/R: scrub count/offset/radius · wheel: ±1 "
+            f"vert · LMB/Enter: apply · RMB/Esc: cancel")
+        context.area.tag_redraw()
+
+    def _finish(self, context):
+        bpy.types.SpaceView3D.draw_handler_remove(self._handle, 'WINDOW')
+        context.area.header_text_set(None)
+        context.area.tag_redraw()
+
+    def _confirm(self):
+        """Make the previewed rebuild — the one heavy step, run once."""
+        settings = {"radius": self.radius, "offset": self.offset,
+                    "use_fit_center": self.use_fit_center,
+                    "fit_method": self.fit_method,
+                    "outlier_tolerance": self.outlier_tolerance}
+        if self.vertex_count:
+            settings["vertex_count"] = self.vertex_count
+        else:
+            settings["round_to_circle"] = True
+        return bpy.ops.mesh.recircle('EXEC_DEFAULT', True, **settings)
 
 
-classes = (MESH_OT_recircle,)
+classes = (MESH_OT_recircle, MESH_OT_recircle_detect, MESH_OT_recircle_preview)
@@ -0,0 +1,92 @@
+"""Process-pool fan-out for Re-circle's pure-geometry planning.
+
+Rebuilding thousands of loops spends much of its time in per-pair NumPy work —
+lining rings up and lofting them — that needs nothing but coordinates.
+`map_chunks` splits such work into chunks and runs them in worker processes,
+leaving every bmesh edit to the main thread.
+
+Workers are spawned, never forked: Blender is full of threads (depsgraph, GPU,
+Python's own), and a forked child can inherit a lock one of them held and hang
+on it. A spawned worker is a fresh interpreter that knows nothing of Blender or
+the add-on package, so the work must live in a module that imports only NumPy
+(lofting.py); the worker loads that one file by path and gets plain arrays.
+Items go out and results come back pickled.
+
+For selections under `MIN_ITEMS` — or if the pool can't be started — the work
+simply runs in-process. The worker function is the same one the serial path
+calls, applied to the same items in the same order, so the result doesn't
+depend on which path ran. The RECIRCLE_WORKERS environment variable caps the
+worker count (0 or 1 turns the pool off).
+"""
+
+import multiprocessing
+import operator
+import os
+import runpy
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+WORKERS_ENV = "RECIRCLE_WORKERS"
+
+# Below this many items a pool costs more to start than it saves (a spawned
+# worker has to start Python and import NumPy first).
+MIN_ITEMS = 512
+MAX_WORKERS = 8
+# Several chunks per worker evens out loops of very different sizes.
+CHUNKS_PER_WORKER = 4
+
+
+class _ByPath:
+    """Stands in for `fn` when it's sent to a worker.
+
+    Pickles as "run `fn`'s module file, then take `fn` from it" — two standard
+    library calls — so the worker never imports the add-on package.
+    """
+    __slots__ = ("path", "name")
+
+    def __init__(self, path, name=None):
+        self.path = path
+        self.name = name
+
+    def __reduce__(self):
+        if self.name is None:
+            return runpy.run_path, (self.path,)
+        return operator.getitem, (_ByPath(self.path), self.name)
+
+
+def worker_count():
+    """How many worker processes a big job gets (one core stays with Blender)."""
+    count = min(MAX_WORKERS, (os.cpu_count() or 1) - 1)
+    env = os.environ.get(WORKERS_ENV, "").strip()
+    if env.isdigit():
+        count = min(count, int(env))
+    return max(count, 0)
+
+
+def map_chunks(fn, items, *args, min_items=MIN_ITEMS):
+    """`fn(items, *args)`, computed in worker processes when it's worth it.
+
+    `fn` takes a list of items and returns one result per item; it must be a
+    module-level function of a NumPy-only module (see the module docstring),
+    and `items` and `args` plain data. Big jobs are cut into contiguous chunks,
+    mapped over the pool, and stitched back in order. If the pool can't be
+    started or a worker dies, the whole job reruns in-process.
+    """
+    items = list(items)
+    workers = worker_count()
+    if len(items) < min_items or workers < 2:
+        return fn(items, *args)
+
+    remote = _ByPath(sys.modules[fn.__module__].__file__, fn.__name__)
+    size = -(-len(items) // (workers * CHUNKS_PER_WORKER))
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+    try:
+        with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn")) as pool:
+            parts = list(pool.map(remote, chunks,
+                                  *([arg] * len(chunks) for arg in args)))
+    except (OSError, RuntimeError, BrokenProcessPool):
+        return fn(items, *args)
+    return [result for part in parts for result in part]
@@ -0,0 +1,179 @@
+"""Viewport preview of a Re-circle rebuild, for the modal preview operator.
+
+Scrubbing the vertex count in the redo panel re-runs the whole operator — undo,
+refit, delete, rebuild, re-bridge — for every step. The preview only *draws*
+where the verts would go, and everything it draws is cheap math on a handful of
+per-run numbers worked out once up front:
+
+  * each run's circle (centre and in-plane u/v) and its radius — the mean
+    distance of its verts for a closed loop, as `resample_ring_array` measures
+    it, or the fitted one for an arc;
+  * where it starts and how far it sweeps: a loop's first vert angle and its
+    winding, an arc's two pinned end angles (`resample_arc_array`).
+
+From those, the positions for a count / offset / radius are one array
+expression over all runs. `RunPreview` caches in two layers: the angles (which
+depend on count and offset) and the positions (which add the radius), so
+dragging the radius never recomputes an angle and nothing is redone for a
+parameter that didn't change.
+"""
+
+import math
+
+import gpu
+import numpy as np
+from gpu_extras.batch import batch_for_shader
+
+from .geometry import _segment_sum, run_ids
+
+LINE_COLOR = (1.0, 0.55, 0.1, 0.9)
+POINT_COLOR = (1.0, 0.85, 0.3, 1.0)
+LINE_WIDTH = 2.0
+POINT_SIZE = 6.0
+
+
+class RunPreview:
+    """Target positions for every run of a `RunSet`, at any count/offset/radius.
+
+    `points` is the runs' current coordinates, packed as `RunSet.verts`.
+    """
+    __slots__ = ("closed", "counts", "starts", "points", "center", "u", "v",
+                 "ring_radius", "fit_radius", "start", "span", "angles",
+                 "keep", "_layout", "_positions", "_batches")
+
+    def __init__(self, runs, points, use_fit_center=True):
+        n_runs = len(runs)
+        self.closed = runs.closed.copy()
+        self.counts = runs.counts
+        self.starts = runs.offsets[:-1]
+        self.points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        # Closed loops are rebuilt round the centroid unless Fitted Center is
+        # on; arcs always use the fitted centre.
+        loop_center = runs.center if use_fit_center else runs.centroid
+        self.center = np.where(self.closed[:, None], loop_center, runs.center)
+        self.u, self.v = runs.u, runs.v
+        self.fit_radius = runs.fit_radius
+
+        seg = run_ids(self.counts)
+        d = self.points - self.center[seg]
+        x, y = np.sum(d * self.u[seg], axis=1), np.sum(d * self.v[seg], axis=1)
+        ang = np.arctan2(y, x)
+        self.ring_radius = (_segment_sum(seg, np.hypot(x, y), n_runs)
+                            / np.maximum(self.counts, 1))
+
+        # Wrapped step to the next vert; a loop's last vert steps to its first.
+        last = self.starts + self.counts - 1
+        nxt = np.arange(len(ang)) + 1
+        nxt[last] = self.starts
+        step = (ang[nxt] - ang + math.pi) % (2.0 * math.pi) - math.pi
+        open_step = step.copy()
+        open_step[last] = 0.0
+        winding = np.where(_segment_sum(seg, step, n_runs) >= 0.0, 1.0, -1.0)
+        self.start = ang[self.starts]
+        self.span = np.where(self.closed, winding * 2.0 * math.pi,
+                             _segment_sum(seg, open_step, n_runs))
+        # Every vert's own unwrapped angle — Round to Circle keeps them.
+        before = np.cumsum(open_step) - open_step
+        self.angles = self.start[seg] + before - before[self.starts][seg]
+        # Round to Circle leaves a robust fit's outliers where they are and
+        # projects the rest of that run like an arc.
+        self.keep = runs.outlier.copy()
+        self._layout = None
+        self._positions = None
+        self._batches = None
+
+    def __len__(self):
+        return len(self.closed)
+
+    def layout(self, count, offset):
+        """(run of each new vert, its angle, edges as (E, 2) index pairs).
+
+        `count` 0 keeps every run's own count, the way Round to Circle does.
+        """
+        key = (count, offset)
+        if self._layout is not None and self._layout[0] == key:
+            return self._layout[1]
+        if count > 0:
+            n = np.full(len(self), max(count, 3), dtype=np.int64)
+            as_is = np.zeros(len(self), dtype=bool)
+        else:
+            n = self.counts
+            as_is = ~self.closed | (_segment_sum(run_ids(n), self.keep * 1.0,
+                                                 len(self)) > 0.0)
+        seg = run_ids(n)
+        starts = np.zeros_like(n)
+        np.cumsum(n[:-1], out=starts[1:])
+        k = np.arange(len(seg)) - starts[seg]
+        denom = np.where(self.closed, n, np.maximum(n - 1, 1))
+        turn = np.where(self.closed, np.sign(self.span) * offset, 0.0)
+        ang = (self.start + turn)[seg] + self.span[seg] * k / denom[seg]
+        if as_is.any():
+            own = as_is[seg]
+            ang[own] = self.angles[own]
+
+        nxt = np.arange(len(seg)) + 1
+        last = starts + n - 1
+        nxt[last] = starts
+        wrap = np.ones(len(seg), dtype=bool)
+        wrap[last[~self.closed]] = False
+        edges = np.stack([np.flatnonzero(wrap), nxt[wrap]], axis=1)
+        value = (seg, ang, edges, as_is)
+        self._layout = (key, value)
+        self._positions = None
+        return value
+
+    def positions(self, count, offset, radius):
+        """((M, 3) target positions, (E, 2) edges) for these settings.
+
+        `radius` 0 uses each run's own (see the module docstring).
+        """
+        seg, ang, edges, as_is = self.layout(count, offset)
+        if self._positions is not None and self._positions[0] == radius:
+            return self._positions[1], edges
+        if radius > 0.0:
+            r = np.full(len(self), radius)
+        else:
+            r = np.where(self.closed & ~as_is, self.ring_radius,
+                         self.fit_radius)
+        pos = self.center[seg] + r[seg][:, None] * (
+            np.cos(ang)[:, None] * self.u[seg]
+            + np.sin(ang)[:, None] * self.v[seg])
+        if count <= 0 and self.keep.any():
+            pos[self.keep] = self.points[self.keep]
+        self._positions = (radius, pos)
+        self._batches = None
+        return pos, edges
+
+    # ----------------------------------------------------------------- draw
+
+    def draw(self, matrix, count, offset, radius):
+        """Draw the preview in object space `matrix` (a POST_VIEW callback).
+
+        Lines go through the polyline shader: a plain line width is ignored on
+        Metal and Vulkan.
+        """
+        pos, edges = self.positions(count, offset, radius)
+        line_shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+        point_shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+        if self._batches is None:
+            co = pos.astype(np.float32)
+            self._batches = (
+                batch_for_shader(line_shader, 'LINES', {"pos": co},
+                                 indices=edges.astype(np.int32)),
+                batch_for_shader(point_shader, 'POINTS', {"pos": co}),
+            )
+        lines, points = self._batches
+        gpu.state.blend_set('ALPHA')
+        gpu.state.depth_test_set('NONE')
+        gpu.state.point_size_set(POINT_SIZE)
+        with gpu.matrix.push_pop():
+            gpu.matrix.multiply_matrix(matrix)
+            line_shader.uniform_float("viewportSize",
+                                      gpu.state.viewport_get()[2:])
+            line_shader.uniform_float("lineWidth", LINE_WIDTH)
+            line_shader.uniform_float("color", LINE_COLOR)
+            lines.draw(line_shader)
+            point_shader.uniform_float("color", POINT_COLOR)
+            points.draw(point_shader)
+        gpu.state.point_size_set(1.0)
+        gpu.state.blend_set('NONE')
@@ -0,0 +1,93 @@
+"""Opt-in per-stage timing for Re-circle.
+
+Switched on either by the add-on preference ("Profile Stages") or by the
+RECIRCLE_PROFILE environment variable: "1" just records, anything else that
+isn't an "off" value is taken as the path of a JSON trace to write after every
+run (the preference has its own path field). When on, the operator records wall
+time and an element count for each stage, shows them in the redo panel under
+the usual read-out, and writes the trace, so a slow run can be pinned on a
+specific stage.
+
+When off, a `StageTimer` still hands out stage records but never reads the
+clock, so the instrumented code paths are the same either way.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+
+ENV_VAR = "RECIRCLE_PROFILE"
+
+_OFF = ("", "0", "false", "no", "off")
+_ON = ("1", "true", "yes", "on")
+
+
+class StageTimer:
+    """Wall time, element count and call count per named stage.
+
+    A stage entered several times (face orientation runs once per rebuild, say)
+    accumulates into one record.
+    """
+    __slots__ = ("enabled", "stages")
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name, count=0):
+        """Time the block; set `record["count"]` inside it to report elements."""
+        record = {"count": count}
+        if not self.enabled:
+            yield record
+            return
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            seconds = time.perf_counter() - start
+            total = self.stages.setdefault(name, {"seconds": 0.0, "count": 0,
+                                                  "calls": 0})
+            total["seconds"] += seconds
+            total["count"] += int(record["count"])
+            total["calls"] += 1
+
+    def lines(self):
+        """One "name  12.3 ms · 456" line per stage, in the order they ran."""
+        return [f"{name}  {rec['seconds'] * 1000.0:.1f} ms"
+                + (f" · {rec['count']}" if rec["count"] else "")
+                for name, rec in self.stages.items()]
+
+    def trace(self, **info):
+        """The recorded stages (plus `info`) as a JSON-ready dict."""
+        return {
+            **info,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "total_seconds": sum(r["seconds"] for r in self.stages.values()),
+            "stages": [{"name": name, **rec}
+                       for name, rec in self.stages.items()],
+        }
+
+    def dump(self, path, **info):
+        """Write `trace(**info)` to `path`; returns False if it couldn't."""
+        try:
+            with open(path, "w", encoding="utf-8") as fh:
+                json.dump(self.trace(**info), fh, indent=2)
+        except OSError:
+            return False
+        return True
+
+
+def settings(context, package):
+    """(enabled, trace path or "") from the environment and the preferences."""
+    env = os.environ.get(ENV_VAR, "").strip()
+    enabled = env.lower() not in _OFF
+    path = env if enabled and env.lower() not in _ON else ""
+
+    addon = context.preferences.addons.get(package)
+    prefs = getattr(addon, "preferences", None)
+    if prefs is not None and prefs.profile:
+        enabled = True
+        path = path or prefs.profile_path
+    return enabled, path
@@ -0,0 +1,219 @@
+"""The set of runs Re-circle works on, as flat arrays.
+
+Every stage of the operator walks the same list of runs — the selected loops
+and arcs — and their fitted circles. With tens of thousands of runs a dict per
+run holding a vertex list and five `Vector`s is a lot of small objects, and it
+keeps any stage from working on all runs as arrays. `RunSet` stores them
+struct-of-arrays style instead:
+
+  * `verts` — one int array of slots into `table` (the BMVerts), run after run,
+    with run i at `verts[offsets[i]:offsets[i + 1]]`;
+  * `closed` — (N,) bool, and `gap` — (N,) int, the gap vertex count a later
+    Complete to Circle fills an arc's missing sweep with;
+  * `outlier` — a bool per entry of `verts`, set for verts a robust fit left
+    out;
+  * `center`, `normal`, `u`, `v`, `centroid` — (N, 3) float64, and `radius`
+    (after any override) and `fit_radius` — (N,). They're copies, so a stage
+    may adjust the circles (Shared Axis does) without touching the redo cache;
+  * `phase` — None, or (N,) angles a closed loop's first new vert is laid at
+    when it is resampled, to line the verts of coaxial loops up.
+
+`stats()` measures every run against its circle — start angle, sweep,
+residual — in one vectorized pass (`run_stats_packed`), and `summary()` boils
+that down for the panel read-out. The numbers are kept: `replace` and `touch`
+mark the rows whose verts or circles moved, and only those are measured again,
+together, the next time anyone asks.
+
+`table` is append-only: a stage that rebuilds runs hands `replace` the new
+vertex lists and those verts are added to the end, so slots held for other runs
+never move however the mesh is edited. (Vertex *indices* would: deleting verts
+and calling `index_update` renumbers everything.)
+"""
+
+import numpy as np
+from mathutils import Vector
+
+from .geometry import run_ids, run_stats_packed
+
+FIT_ROWS = ("center", "normal", "u", "v", "centroid")
+# Edges of the arc sweep histogram in `summary`, in degrees.
+SWEEP_BINS = (0.0, 90.0, 180.0, 270.0, 360.0)
+
+
+class RunSet:
+    """Runs (ordered BMVert lists, closed or not) and their circles, as arrays."""
+    __slots__ = ("table", "verts", "offsets", "closed", "gap", "outlier",
+                 "center", "normal", "u", "v", "centroid", "radius",
+                 "fit_radius", "phase", "_stats", "_stale")
+
+    def __init__(self, table, counts, closed, fits, radius_override=0.0,
+                 outlier=None):
+        self.table = list(table)
+        counts = np.asarray(counts, dtype=np.int64)
+        self.verts = np.arange(len(self.table), dtype=np.int64)
+        self.offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.offsets[1:])
+        self.closed = np.array(closed, dtype=bool).reshape(-1)
+        self.gap = np.zeros(len(counts), dtype=np.int64)
+        self.outlier = (np.zeros(len(self.table), dtype=bool) if outlier is None
+                        else np.asarray(outlier, dtype=bool))
+        for name in FIT_ROWS:
+            setattr(self, name,
+                    np.array(fits[name], dtype=np.float64).reshape(-1, 3))
+        self.fit_radius = np.array(fits["radius"], dtype=np.float64)
+        self.radius = (np.full(len(counts), float(radius_override))
+                       if radius_override > 0.0 else self.fit_radius.copy())
+        self.phase = None
+        self._stats = None
+        self._stale = np.zeros(len(counts), dtype=bool)
+
+    @classmethod
+    def from_indices(cls, lookup, runs, fits, radius_override=0.0):
+        """From `fit_selection`'s (vertex indices, closed) runs and fit arrays.
+
+        `lookup` maps a vertex index to its BMVert (`bm.verts` with its lookup
+        table ensured). A robust fit's per-run inlier masks become `outlier`.
+        """
+        counts = [len(run) for run, _ in runs]
+        flat = [i for run, _ in runs for i in run]
+        outlier = None
+        if "inliers" in fits and runs:
+            outlier = ~np.concatenate(list(fits["inliers"]))
+        return cls([lookup[i] for i in flat], counts,
+                   [closed for _, closed in runs], fits, radius_override,
+                   outlier)
+
+    def __len__(self):
+        return len(self.closed)
+
+    @property
+    def counts(self):
+        return np.diff(self.offsets)
+
+    def run(self, i):
+        """Run i as a list of BMVerts, in walk order."""
+        table = self.table
+        return [table[k] for k in
+                self.verts[self.offsets[i]:self.offsets[i + 1]].tolist()]
+
+    def all_verts(self):
+        """Every run's verts, one run after another."""
+        table = self.table
+        return [table[k] for k in self.verts.tolist()]
+
+    def outliers(self, i):
+        """The verts of run i that its (robust) fit left out, as a set."""
+        s, e = self.offsets[i], self.offsets[i + 1]
+        table = self.table
+        return {table[k] for k in self.verts[s:e][self.outlier[s:e]].tolist()}
+
+    def fit(self, i):
+        """Row i of the fit as a dict of `Vector`s and floats.
+
+        The keys of `circle_of`: center, normal, u, v, centroid, radius,
+        fit_radius.
+        """
+        out = {name: Vector(getattr(self, name)[i]) for name in FIT_ROWS}
+        out["radius"] = float(self.radius[i])
+        out["fit_radius"] = float(self.fit_radius[i])
+        return out
+
+    # ----------------------------------------------------------------- stats
+
+    def stats(self):
+        """`run_stats_packed` of every run over its still-valid verts.
+
+        Residuals are against the fitted radius. Rows `touch`ed or `replace`d
+        since the last call are measured again in one pass; the rest are reused.
+        """
+        if self._stats is None:
+            self._stats = self._measure(np.arange(len(self)))
+        elif self._stale.any():
+            rows = np.flatnonzero(self._stale)
+            for key, col in self._measure(rows).items():
+                self._stats[key][rows] = col
+        self._stale[:] = False
+        return self._stats
+
+    def touch(self, rows=None):
+        """Note that the verts or circles of `rows` (default: all) moved."""
+        if rows is None:
+            self._stale[:] = True
+        else:
+            self._stale[np.asarray(rows, dtype=np.int64)] = True
+
+    def _measure(self, rows):
+        counts = self.counts[rows]
+        first = np.repeat(self.offsets[rows] - (np.cumsum(counts) - counts),
+                          counts)
+        table = self.table
+        verts = [table[k] for k in
+                 self.verts[first + np.arange(len(first))].tolist()]
+        valid = np.fromiter((v.is_valid for v in verts), dtype=bool,
+                            count=len(verts))
+        co = np.array([v.co[:] for v, ok in zip(verts, valid) if ok],
+                      dtype=np.float64).reshape(-1, 3)
+        fits = {name: getattr(self, name)[rows]
+                for name in ("center", "normal", "u", "v")}
+        fits["radius"] = self.fit_radius[rows]
+        return run_stats_packed(
+            co, np.bincount(run_ids(counts)[valid], minlength=len(rows)), fits,
+            closed=self.closed[rows])
+
+    def summary(self):
+        """Selection-wide figures for the read-out, from `stats`.
+
+        A dict: runs, loops, arcs, verts, outliers; radius_min / max / mean
+        (fitted); residual_mean / max; and sweep_hist, how many arcs sweep up
+        to each `SWEEP_BINS` edge past the first.
+        """
+        st = self.stats()
+        loops = int(np.count_nonzero(self.closed))
+        radius = self.fit_radius
+        arcs = np.degrees(np.abs(st["sweep"][~self.closed]))
+        hist, _ = np.histogram(np.minimum(arcs, SWEEP_BINS[-1]),
+                               bins=SWEEP_BINS)
+        empty = not len(self)
+        return {
+            "runs": len(self), "loops": loops, "arcs": len(self) - loops,
+            "verts": int(st["count"].sum()),
+            "outliers": int(np.count_nonzero(self.outlier)),
+            "radius_min": 0.0 if empty else float(radius.min()),
+            "radius_max": 0.0 if empty else float(radius.max()),
+            "radius_mean": 0.0 if empty else float(radius.mean()),
+            "residual_mean": 0.0 if empty else float(st["residual"].mean()),
+            "residual_max": 0.0 if empty else float(st["residual"].max()),
+            "sweep_hist": hist,
+        }
+
+    # --------------------------------------------------------------- editing
+
+    def replace(self, changes):
+        """Swap in new vertex lists: `changes` maps run index -> BMVerts.
+
+        A vert that was an outlier of its run stays one.
+        """
+        if not changes:
+            return
+        parts, flags = [], []
+        counts = self.counts
+        for i in range(len(self)):
+            s, e = self.offsets[i], self.offsets[i + 1]
+            if i not in changes:
+                parts.append(self.verts[s:e])
+                flags.append(self.outlier[s:e])
+                continue
+            new = list(changes[i])
+            was = self.outliers(i) if self.outlier[s:e].any() else ()
+            start = len(self.table)
+            self.table += new
+            parts.append(np.arange(start, start + len(new), dtype=np.int64))
+            flags.append(np.array([v in was for v in new], dtype=bool)
+                         if was else np.zeros(len(new), dtype=bool))
+            counts[i] = len(new)
+        self.verts = (np.concatenate(parts) if parts
+                      else np.zeros(0, dtype=np.int64))
+        self.outlier = (np.concatenate(flags) if flags
+                        else np.zeros(0, dtype=bool))
+        np.cumsum(counts, out=self.offsets[1:])
+        self.touch(list(changes))
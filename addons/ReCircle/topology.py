@@ -7,41 +7,110 @@ Everything that knows about bmesh but not about operators lives here.
 
 from collections import defaultdict, deque
 
+import numpy as np
+
 
 # --------------------------------------------------------------- basic lookups
 
-def edge_between(a, b):
-    """The edge joining verts `a` and `b`, or None."""
+class EdgeIndex:
+    """(vert, vert) -> edge lookups for one operator run.
+
+    `edge_between` scans `a.link_edges` on every call, which adds up on
+    high-valence verts that get asked about over and over. This scans each
+    vertex once, the first time it comes up, and keeps its edges in a dict keyed
+    on the unordered vert pair. The keys are the verts themselves rather than
+    their indices, which go stale as soon as anything is created or deleted.
+
+    The index only knows about edges that existed when a vertex was scanned, so
+    anything that makes edges behind its back has to say so: `new`/`ensure`
+    record the edges they create, `forget` drops what's known about some verts
+    (e.g. after an edge split), and `reset` drops everything (after a bulk
+    delete or a batch of `faces.new`, which makes edges implicitly). Deleted
+    edges are caught by an `is_valid` check on the way out.
+    """
+    __slots__ = ("_edges", "_scanned")
+
+    def __init__(self):
+        self._edges = {}
+        self._scanned = set()
+
+    def _scan(self, v):
+        for e in v.link_edges:
+            self._edges[frozenset(e.verts)] = e
+        self._scanned.add(v)
+
+    def get(self, a, b):
+        """The edge joining `a` and `b`, or None."""
+        key = frozenset((a, b))
+        e = self._edges.get(key)
+        if e is not None:
+            if e.is_valid:
+                return e
+            del self._edges[key]
+            self.forget((a, b))
+        if a not in self._scanned and b not in self._scanned:
+            self._scan(a)
+            e = self._edges.get(key)
+        return e
+
+    def new(self, bm, a, b):
+        """Create the edge a-b (which must not exist yet) and record it."""
+        e = bm.edges.new((a, b))
+        self._edges[frozenset((a, b))] = e
+        return e
+
+    def ensure(self, bm, a, b):
+        """The edge a-b, created if it isn't there yet."""
+        e = self.get(a, b)
+        return e if e is not None else self.new(bm, a, b)
+
+    def forget(self, verts):
+        """Rescan these verts next time they're asked about."""
+        self._scanned.difference_update(verts)
+
+    def reset(self):
+        """Forget everything."""
+        self._edges.clear()
+        self._scanned.clear()
+
+
+def edge_between(a, b, index=None):
+    """The edge joining verts `a` and `b`, or None.
+
+    Pass an `EdgeIndex` as `index` to answer from it instead of scanning.
+    """
+    if index is not None:
+        return index.get(a, b)
     for e in a.link_edges:
         if e.other_vert(a) is b:
             return e
     return None
 
 
-def cycle_edges(loop):
+def cycle_edges(loop, index=None):
     """Edges of a closed, ordered vertex loop."""
     edges = []
     n = len(loop)
     for i in range(n):
-        e = edge_between(loop[i], loop[(i + 1) % n])
+        e = edge_between(loop[i], loop[(i + 1) % n], index)
         if e is not None:
             edges.append(e)
     return edges
 
 
-def chain_edges(chain):
+def chain_edges(chain, index=None):
     """Edges of an open, ordered vertex chain."""
     edges = []
     for i in range(len(chain) - 1):
-        e = edge_between(chain[i], chain[i + 1])
+        e = edge_between(chain[i], chain[i + 1], index)
         if e is not None:
             edges.append(e)
     return edges
 
 
-def curve_edges(verts, closed):
+def curve_edges(verts, closed, index=None):
     """Edges of an ordered vertex run, closed or open."""
-    return cycle_edges(verts) if closed else chain_edges(verts)
+    return cycle_edges(verts, index) if closed else chain_edges(verts, index)
 
 
 # ------------------------------------------------------- component ordering
@@ -133,27 +202,295 @@ def _cycles_from_adjacency(adj):
     return cycles, n_bad + len(chains)
 
 
-def _selection_adjacency(bm):
-    adj = defaultdict(list)
-    for e in bm.edges:
-        if e.select:
-            a, b = e.verts
-            adj[a].append(b)
-            adj[b].append(a)
-    return adj
+# ------------------------------------------------- array selection engine
+#
+# On a big mesh, building a BMVert adjacency dict for the selection costs more
+# than everything Re-circle does with it. Instead the selected edges become an
+# (E, 2) array of vertex indices, components come from a NumPy union-find, and
+# the walk that orders each run is done on plain ints; BMVerts only appear at
+# the very end.
+
+def selected_edge_indices(bm, mesh=None):
+    """(E, 2) int array of the vertex indices of every selected edge.
+
+    With `mesh` (the object's mesh data, freshly synced from edit mode with
+    `update_from_editmode`) the arrays come straight out of `foreach_get`;
+    otherwise it's one index pass over `bm.edges`. Either way the indices are
+    those of `bm.verts` after `index_update`.
+    """
+    if mesh is not None and len(mesh.vertices) == len(bm.verts):
+        n = len(mesh.edges)
+        ev = np.empty(2 * n, dtype=np.int32)
+        sel = np.empty(n, dtype=bool)
+        mesh.edges.foreach_get("vertices", ev)
+        mesh.edges.foreach_get("select", sel)
+        return ev.reshape(-1, 2)[sel]
+    bm.verts.index_update()
+    pairs = [(a.index, b.index) for a, b in (e.verts for e in bm.edges
+                                             if e.select)]
+    return np.array(pairs, dtype=np.int32).reshape(-1, 2)
+
+
+def vertex_coords(bm, indices, mesh=None):
+    """(N, 3) float64 coordinates of the verts at `indices`.
+
+    Same two sources as `selected_edge_indices`: one `foreach_get` over the
+    synced `mesh`, or a lookup-table pass over `bm.verts`.
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+    if mesh is not None and len(mesh.vertices) == len(bm.verts):
+        co = np.empty(3 * len(mesh.vertices), dtype=np.float64)
+        mesh.vertices.foreach_get("co", co)
+        return co.reshape(-1, 3)[indices]
+    bm.verts.ensure_lookup_table()
+    lookup = bm.verts
+    return np.array([lookup[i].co[:] for i in indices.tolist()],
+                    dtype=np.float64).reshape(-1, 3)
+
+
+def component_labels(edges, n):
+    """Connected-component label of each of `n` nodes, given (E, 2) `edges`.
+
+    Union-find done a whole array at a time: every round hooks the larger root
+    of each edge under the smaller, then pointer-jumps until every node points
+    at its root. Labels are the smallest node index in each component.
+    """
+    parent = np.arange(n)
+    if len(edges) == 0:
+        return parent
+    u, w = edges[:, 0], edges[:, 1]
+    while True:
+        pu, pw = parent[u], parent[w]
+        if np.array_equal(pu, pw):
+            return parent
+        np.minimum.at(parent, np.maximum(pu, pw), np.minimum(pu, pw))
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
 
 
-def selected_curves(bm):
+def ordered_components_indexed(edges):
+    """`ordered_components` for an (E, 2) array of vertex-index pairs.
+
+    Returns (cycles, chains, n_bad) with every run a list of vertex indices.
+    A cycle starts at the first vertex of its earliest edge and heads off along
+    that edge, as the dict version does; a chain starts at its lower-indexed
+    end.
+    """
+    edges = np.asarray(edges).reshape(-1, 2)
+    if len(edges) == 0:
+        return [], [], 0
+    ids, local = np.unique(edges, return_inverse=True)
+    local = local.reshape(-1, 2)
+    n, n_edges = len(ids), len(local)
+
+    degree = np.bincount(local.ravel(), minlength=n)
+    label = component_labels(local, n)
+    roots = np.flatnonzero(label == np.arange(n))
+    branching = np.bincount(label, weights=degree > 2, minlength=n) > 0
+    n_ends = np.bincount(label, weights=degree == 1, minlength=n)
+
+    # Neighbour table: slot 0 is the neighbour along the earlier edge.
+    src = np.concatenate((local[:, 0], local[:, 1]))
+    dst = np.concatenate((local[:, 1], local[:, 0]))
+    order = np.lexsort((np.tile(np.arange(n_edges), 2), src))
+    src, dst = src[order], dst[order]
+    first = np.searchsorted(src, np.arange(n))
+    slot = np.arange(len(src)) - first[src]
+    keep = slot < 2
+    nbr = np.full((n, 2), -1, dtype=np.int64)
+    nbr[src[keep], slot[keep]] = dst[keep]
+
+    first_edge = np.full(n, n_edges)
+    np.minimum.at(first_edge, label[local[:, 0]], np.arange(n_edges))
+    lowest_end = np.full(n, n)
+    ends = np.flatnonzero(degree == 1)
+    np.minimum.at(lowest_end, label[ends], ends)
+
+    nb0, nb1 = nbr[:, 0].tolist(), nbr[:, 1].tolist()
+    sizes = np.bincount(label, minlength=n).tolist()
+    vid = ids.tolist()
+
+    def walk(start, size):
+        ordered, prev, cur = [start], -1, start
+        for _ in range(size - 1):
+            nxt = nb0[cur] if nb0[cur] != prev else nb1[cur]
+            if nxt < 0:
+                return None
+            ordered.append(nxt)
+            prev, cur = cur, nxt
+        return ordered
+
+    cycles, chains, n_bad = [], [], 0
+    for root in sorted(roots.tolist(), key=lambda r: first_edge[r]):
+        if branching[root]:
+            n_bad += 1
+            continue
+        if n_ends[root] == 0:
+            ordered = walk(int(local[first_edge[root], 0]), sizes[root])
+            if ordered is None or ordered[0] not in (nb0[ordered[-1]],
+                                                     nb1[ordered[-1]]):
+                n_bad += 1
+            else:
+                cycles.append([vid[k] for k in ordered])
+        elif n_ends[root] == 2:
+            ordered = walk(int(lowest_end[root]), sizes[root])
+            if ordered is None:
+                n_bad += 1
+            else:
+                chains.append([vid[k] for k in ordered])
+        else:
+            n_bad += 1
+    return cycles, chains, n_bad
+
+
+def selected_curves(bm, mesh=None):
     """Ordered closed loops and open arcs formed by the selected edges.
 
-    Returns (cycles, chains, n_bad).
+    Returns (cycles, chains, n_bad). See `selected_edge_indices` for `mesh`.
     """
-    return ordered_components(_selection_adjacency(bm))
+    cycles, chains, n_bad = ordered_components_indexed(
+        selected_edge_indices(bm, mesh))
+    bm.verts.ensure_lookup_table()
+    lookup = bm.verts
+    return ([[lookup[i] for i in c] for c in cycles],
+            [[lookup[i] for i in c] for c in chains], n_bad)
 
 
 def selected_cycles(bm):
     """Ordered closed loops formed by the currently selected edges."""
-    return _cycles_from_adjacency(_selection_adjacency(bm))
+    cycles, chains, n_bad = selected_curves(bm)
+    return cycles, n_bad + len(chains)
+
+
+# ------------------------------------------------------ whole-mesh loops
+
+def mesh_arrays(mesh):
+    """A Mesh's coordinates and topology as flat arrays, via `foreach_get`.
+
+    Keys: co (V, 3) float64; edges (E, 2); corner_verts, corner_edges (L,);
+    face_starts, face_sizes (F,). In edit mode, sync the mesh first
+    (`update_from_editmode`); the indices then match `bm.verts`/`bm.edges`.
+    """
+    def grab(seq, attr, dtype, width=1):
+        out = np.empty(len(seq) * width, dtype=dtype)
+        seq.foreach_get(attr, out)
+        return out.reshape(-1, width) if width > 1 else out
+
+    return {
+        "co": grab(mesh.vertices, "co", np.float64, 3),
+        "edges": grab(mesh.edges, "vertices", np.int32, 2).astype(np.int64),
+        "corner_verts": grab(mesh.loops, "vertex_index", np.int64),
+        "corner_edges": grab(mesh.loops, "edge_index", np.int64),
+        "face_starts": grab(mesh.polygons, "loop_start", np.int64),
+        "face_sizes": grab(mesh.polygons, "loop_total", np.int64),
+    }
+
+
+def edge_loops_indexed(n_verts, edges, corner_verts, corner_edges,
+                       face_starts, face_sizes):
+    """Every closed edge loop in a mesh, from its index arrays.
+
+    An edge loop carries on "straight across" each vertex: through a vertex
+    with four edges and four faces it continues along the one edge that shares
+    no face with the edge it came in on; along a boundary it continues on the
+    vertex's only other boundary edge; along a wire it continues through
+    two-edge vertices. Poles and other junctions end a loop, so only loops that
+    close on themselves without revisiting a vertex are returned.
+
+    All of that is array arithmetic: the "opposite" edge is the sum of the
+    vertex's edge indices minus the incoming edge and its two face-neighbours.
+    The resulting edge-to-edge links form a graph of degree <= 2, whose cycles
+    come from `ordered_components_indexed`.
+
+    Returns (verts, loop_edges, starts, counts): loop i is
+    verts[starts[i]:starts[i] + counts[i]] in order, and loop_edges at the same
+    positions holds the edge *into* each of those verts.
+    """
+    ev = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    cv = np.asarray(corner_verts, dtype=np.int64)
+    ce = np.asarray(corner_edges, dtype=np.int64)
+    face_starts = np.asarray(face_starts, dtype=np.int64)
+    face_sizes = np.asarray(face_sizes, dtype=np.int64)
+    n_edges = len(ev)
+    empty = np.zeros(0, dtype=np.int64)
+    if n_edges == 0:
+        return empty, empty, empty, empty
+
+    # Incidence i = 2 * edge + side: the edge's end at vertex ev[edge, side].
+    inc_vert = ev.ravel()
+    inc_edge = np.repeat(np.arange(n_edges), 2)
+    degree = np.bincount(inc_vert, minlength=n_verts)
+    edge_sum = np.bincount(inc_vert, weights=inc_edge, minlength=n_verts)
+    edge_faces = np.bincount(ce, minlength=n_edges)
+    vert_faces = np.bincount(cv, minlength=n_verts)
+
+    def incidence(v, e):
+        return 2 * e + (ev[e, 1] == v)
+
+    # Around each face corner the incoming and outgoing edges are neighbours
+    # at that corner's vertex.
+    prev = np.arange(len(cv)) - 1
+    prev[face_starts] = face_starts + face_sizes - 1
+    e_out, e_in = ce, ce[prev]
+    hit = np.concatenate((incidence(cv, e_out), incidence(cv, e_in)))
+    nbr_sum = np.bincount(hit, weights=np.concatenate((e_in, e_out)),
+                          minlength=2 * n_edges)
+    nbr_count = np.bincount(hit, minlength=2 * n_edges)
+
+    onward = np.full(2 * n_edges, -1, dtype=np.int64)
+    grid = ((degree[inc_vert] == 4) & (vert_faces[inc_vert] == 4)
+            & (edge_faces[inc_edge] == 2) & (nbr_count == 2))
+    onward[grid] = np.rint(edge_sum[inc_vert] - inc_edge - nbr_sum)[grid]
+
+    boundary = edge_faces == 1
+    b_sum = np.bincount(inc_vert, weights=np.where(boundary[inc_edge],
+                                                   inc_edge, 0),
+                        minlength=n_verts)
+    b_count = np.bincount(inc_vert, weights=boundary[inc_edge],
+                          minlength=n_verts)
+    along = boundary[inc_edge] & (b_count[inc_vert] == 2)
+    onward[along] = np.rint(b_sum[inc_vert] - inc_edge)[along]
+
+    wire = (edge_faces == 0)[inc_edge] & (degree[inc_vert] == 2)
+    onward[wire] = np.rint(edge_sum[inc_vert] - inc_edge)[wire]
+
+    # Keep only links both edges agree on.
+    src = np.flatnonzero(onward >= 0)
+    dst = onward[src]
+    mutual = onward[incidence(inc_vert[src], dst)] == inc_edge[src]
+    links = np.stack((inc_edge[src][mutual], dst[mutual]), axis=1)
+    links = links[links[:, 0] < links[:, 1]]
+
+    cycles, _, _ = ordered_components_indexed(links)
+    if not cycles:
+        return empty, empty, empty, empty
+    counts = np.array([len(c) for c in cycles], dtype=np.int64)
+    starts = np.zeros_like(counts)
+    np.cumsum(counts[:-1], out=starts[1:])
+    loop_e = np.concatenate(cycles).astype(np.int64)
+
+    # The vertex after edge k is the one it shares with edge k + 1.
+    nxt = np.arange(len(loop_e)) + 1
+    ends = starts + counts - 1
+    nxt[ends] = starts
+    a, b = ev[loop_e], ev[loop_e[nxt]]
+    shared_first = (a[:, 0] == b[:, 0]) | (a[:, 0] == b[:, 1])
+    verts = np.where(shared_first, a[:, 0], a[:, 1])
+
+    # Drop loops that pass through a vertex twice.
+    seg = np.repeat(np.arange(len(counts)), counts)
+    order = np.lexsort((verts, seg))
+    twice = (np.diff(verts[order]) == 0) & (np.diff(seg[order]) == 0)
+    bad = np.zeros(len(counts), dtype=bool)
+    bad[seg[order][1:][twice]] = True
+    keep = ~bad[seg]
+    counts = counts[~bad]
+    starts = np.zeros_like(counts)
+    np.cumsum(counts[:-1], out=starts[1:])
+    return verts[keep], loop_e[keep], starts, counts
 
 
 def boundary_cycles(verts):
@@ -193,16 +530,15 @@ def boundary_chains(verts):
 
 # ------------------------------------------------------------ face orientation
 
-def _edge_dir(face, a, b):
-    """+1 if `face` traverses a->b, -1 if b->a, 0 if a,b aren't a face edge."""
-    vs = face.verts[:]
-    n = len(vs)
+def _directed_edges(verts):
+    """{(a, b): +1, (b, a): -1} for every edge a->b of a face's vertex cycle."""
+    n = len(verts)
+    out = {}
     for k in range(n):
-        if vs[k] is a and vs[(k + 1) % n] is b:
-            return 1
-        if vs[k] is b and vs[(k + 1) % n] is a:
-            return -1
-    return 0
+        a, b = verts[k], verts[(k + 1) % n]
+        out[(a, b)] = 1
+        out[(b, a)] = -1
+    return out
 
 
 def orient_new_faces(new_faces):
@@ -217,77 +553,83 @@ def orient_new_faces(new_faces):
     a face rewrites the radial cycle of its edges, so flipping mid-iteration of
     an `edge.link_faces` walk corrupts that iterator into an infinite loop; we
     decide everything against an up-front winding snapshot instead.
+
+    The snapshot is a directed-edge map per face ((a, b) -> +1/-1) plus, for
+    the new faces, a table from each directed edge to the faces that run along
+    it, so the flood fill works on integer face indices and every "which way
+    does this face cross that edge" question is a dict lookup — linear in the
+    size of the strip rather than quadratic in face size.
     """
-    new_set = set(new_faces)
+    faces = list(dict.fromkeys(new_faces))
+    index = {f: i for i, f in enumerate(faces)}
     # Snapshot winding so edge-direction lookups stay stable while we plan flips.
-    order = {f: f.verts[:] for f in new_set}
-
-    def edir(f, a, b):
-        vs = order[f]
+    cycles = [f.verts[:] for f in faces]
+    winding = [_directed_edges(vs) for vs in cycles]
+    runs_along = defaultdict(list)     # directed edge (a, b) -> faces a->b
+    for i, vs in enumerate(cycles):
         n = len(vs)
         for k in range(n):
-            if vs[k] is a and vs[(k + 1) % n] is b:
-                return 1
-            if vs[k] is b and vs[(k + 1) % n] is a:
-                return -1
-        return 0
-
-    flip = {}          # face -> should it be flipped (relative to its component)
-    visited = set()
+            runs_along[(vs[k], vs[(k + 1) % n])].append(i)
+    existing = {}                      # pre-existing face -> its edge map
+
+    flip = [False] * len(faces)        # relative to the face's component
+    visited = [False] * len(faces)
     unseeded = []
 
-    for start in new_set:
-        if start in visited:
+    for start in range(len(faces)):
+        if visited[start]:
             continue
-        visited.add(start)
-        flip[start] = False
+        visited[start] = True
         comp = [start]
         queue = deque([start])
         while queue:
-            f = queue.popleft()
-            for e in f.edges:
-                a, b = e.verts
-                for g in list(e.link_faces):
-                    if g is f or g not in new_set or g in visited:
-                        continue
-                    visited.add(g)
-                    # Two faces are consistent iff they traverse the shared edge
-                    # in opposite directions, accounting for f's planned flip.
-                    f_eff = edir(f, a, b) * (-1 if flip[f] else 1)
-                    flip[g] = (edir(g, a, b) == f_eff)
-                    comp.append(g)
-                    queue.append(g)
+            i = queue.popleft()
+            vs = cycles[i]
+            n = len(vs)
+            for k in range(n):
+                a, b = vs[k], vs[(k + 1) % n]
+                # Two faces are consistent iff they traverse the shared edge in
+                # opposite directions, accounting for this face's planned flip.
+                for same, others in ((True, runs_along[(a, b)]),
+                                     (False, runs_along[(b, a)])):
+                    for j in others:
+                        if visited[j]:
+                            continue
+                        visited[j] = True
+                        flip[j] = flip[i] != same
+                        comp.append(j)
+                        queue.append(j)
 
         # Anchor the whole component to any adjacent pre-existing face.
         anchor_flip = None
-        for f in comp:
+        for i in comp:
             if anchor_flip is not None:
                 break
-            for e in f.edges:
+            for e in faces[i].edges:
                 a, b = e.verts
-                found = False
                 for g in e.link_faces:
-                    if g in new_set or not g.is_valid:
+                    if g in index or not g.is_valid:
                         continue
-                    g_dir = _edge_dir(g, a, b)
+                    if g not in existing:
+                        existing[g] = _directed_edges(g.verts[:])
+                    g_dir = existing[g].get((a, b), 0)
                     if g_dir == 0:
                         continue
-                    f_eff = edir(f, a, b) * (-1 if flip[f] else 1)
+                    f_eff = winding[i].get((a, b), 0) * (-1 if flip[i] else 1)
                     # Same direction across the edge means the component is
                     # wound backwards relative to the existing surface.
                     anchor_flip = (f_eff == g_dir)
-                    found = True
                     break
-                if found:
+                if anchor_flip is not None:
                     break
         if anchor_flip is None:
-            unseeded.extend(comp)
+            unseeded.extend(faces[i] for i in comp)
         elif anchor_flip:
-            for f in comp:
-                flip[f] = not flip[f]
+            for i in comp:
+                flip[i] = not flip[i]
 
     # Apply all flips now that no bmesh iterator is live.
-    for f, do in flip.items():
+    for f, do in zip(faces, flip):
         if do and f.is_valid:
             f.normal_flip()
     return unseeded
@@ -1,7 +1,300 @@
 import bpy
+from bpy_extras.node_shader_utils import PrincipledBSDFWrapper
+import hashlib
+import json
+import numpy as np
 import os
 import subprocess
 
+# Bump when the hash below changes, so old manifests stop matching.
+HASH_VERSION = 3
+# World-space values are rounded to this many decimals before hashing, so the
+# float noise of apply-transforms doesn't count as a change.
+HASH_DECIMALS = 5
+MANIFEST_SUFFIX = ".export_manifest.json"
+INDEX_SUFFIX = ".export_index.json"
+INDEX_VERSION = 2
+# Attribute data type -> (foreach_get field, components, buffer dtype)
+ATTRIBUTE_FIELDS = {
+    'FLOAT': ("value", 1, np.float32),
+    'INT': ("value", 1, np.int32),
+    'INT8': ("value", 1, np.int32),
+    'BOOLEAN': ("value", 1, bool),
+    'FLOAT2': ("vector", 2, np.float32),
+    'INT32_2D': ("value", 2, np.int32),
+    'FLOAT_VECTOR': ("vector", 3, np.float32),
+    'FLOAT_COLOR': ("color", 4, np.float32),
+    'BYTE_COLOR': ("color", 4, np.float32),
+    'QUATERNION': ("value", 4, np.float32),
+}
+# What the FBX exporter reads from a material, through the same Principled
+# BSDF wrapper it uses: plain values, then the textures plugged into them
+MATERIAL_VALUES = ("base_color", "specular", "specular_tint", "roughness", "metallic",
+                   "alpha", "emission_color", "emission_strength", "normalmap_strength")
+MATERIAL_TEXTURES = ("base_color_texture", "specular_texture", "specular_tint_texture",
+                     "roughness_texture", "metallic_texture", "alpha_texture",
+                     "emission_color_texture", "emission_strength_texture", "normalmap_texture")
+
+
+def manifest_path(directory_path):
+    """The sidecar manifest that sits next to the export directory"""
+    return os.path.normpath(directory_path) + MANIFEST_SUFFIX
+
+
+def load_manifest(directory_path):
+    try:
+        with open(manifest_path(directory_path), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != HASH_VERSION:
+        return {}
+    return manifest.get("files", {})
+
+
+def save_manifest(directory_path, files):
+    path = manifest_path(directory_path)
+    try:
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"version": HASH_VERSION, "files": files}, f, indent=1, sort_keys=True)
+        os.replace(path + ".tmp", path)
+    except OSError as e:
+        print(f"Couldn't write export manifest {path}: {e}")
+
+
+def manifest_key(directory_path, file_path):
+    return os.path.relpath(file_path, directory_path).replace(os.sep, "/")
+
+
+def file_stamp(file_path):
+    """Size and modification time, to tell whether the file was touched since"""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+class FileIndex:
+    """Where every .fbx under the export directory is, found with one walk.
+
+    Finds what os.walk did: names must match exactly, symlinked directories
+    aren't descended into, and the first file of a name found top-down wins.
+
+    With use_cache the index is kept in a file next to the export directory and
+    reused while none of the directories' modification times has changed -
+    adding, removing or renaming a file always bumps its directory's.
+    """
+
+    def __init__(self, directory_path, use_cache=False):
+        self.directory_path = directory_path
+        self.paths = {}
+        # Read-only flags seen while walking; a cached index has none, as
+        # checking a file out doesn't touch its directory's mtime
+        self.writable = {}
+        cache_path = os.path.normpath(directory_path) + INDEX_SUFFIX
+        if use_cache and self.load(cache_path):
+            return
+        dirs = self.scan()
+        if use_cache:
+            self.save(cache_path, dirs)
+
+    def scan(self):
+        """Walk the tree top-down; returns every directory's mtime"""
+        dirs = {}
+        stack = [self.directory_path]
+        while stack:
+            root = stack.pop()
+            try:
+                dirs[root] = os.stat(root).st_mtime_ns
+                with os.scandir(root) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        # Like os.walk, don't follow links to directories
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith(".fbx") and entry.name not in self.paths:
+                        self.paths[entry.name] = entry.path
+                        self.writable[entry.path] = os.access(entry.path, os.W_OK)
+                except OSError:
+                    continue
+            stack.extend(reversed(subdirs))
+        return dirs
+
+    def load(self, cache_path):
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                cache = json.load(f)
+            if cache.get("version") != INDEX_VERSION:
+                return False
+            for rel, mtime in cache["dirs"].items():
+                if os.stat(os.path.join(self.directory_path, rel)).st_mtime_ns != mtime:
+                    return False
+            self.paths = {name: os.path.join(self.directory_path, rel)
+                          for name, rel in cache["files"].items()}
+        except (OSError, ValueError, KeyError, AttributeError):
+            return False
+        print(f"Using cached file index: {cache_path}")
+        return True
+
+    def save(self, cache_path, dirs):
+        rel = lambda path: os.path.relpath(path, self.directory_path)
+        try:
+            with open(cache_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION,
+                           "dirs": {rel(d): mtime for d, mtime in dirs.items()},
+                           "files": {name: rel(path) for name, path in self.paths.items()}}, f)
+            os.replace(cache_path + ".tmp", cache_path)
+        except OSError as e:
+            print(f"Couldn't write file index {cache_path}: {e}")
+
+    def find(self, file_name):
+        """Path of the existing file of this name, or None"""
+        return self.paths.get(file_name)
+
+    def is_writable(self, file_path):
+        writable = self.writable.get(file_path)
+        if writable is None:
+            return os.access(file_path, os.W_OK)
+        return writable
+
+
+def export_hierarchy(obj):
+    """The object and its descendants in the view layer, parents first"""
+    objects = []
+    stack = [obj]
+    while stack:
+        ob = stack.pop()
+        if ob.name not in bpy.context.view_layer.objects:
+            continue
+        objects.append(ob)
+        stack.extend(sorted(ob.children, key=lambda c: c.name, reverse=True))
+    return objects
+
+
+def _feed(digest, values):
+    values = np.asarray(values)
+    if values.dtype.kind == 'f':
+        # + 0.0 turns -0.0 into 0.0, which would hash differently
+        values = np.round(values.astype(np.float64), HASH_DECIMALS) + 0.0
+    digest.update(np.ascontiguousarray(values).tobytes())
+
+
+def _feed_mesh(digest, mesh, matrix):
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    _feed(digest, co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3])
+    for items, field, width in ((mesh.edges, "vertices", 2),
+                                (mesh.loops, "vertex_index", 1),
+                                (mesh.polygons, "loop_total", 1)):
+        values = np.empty(len(items) * width, dtype=np.int32)
+        items.foreach_get(field, values)
+        _feed(digest, values)
+    # UVs, colors, material indices, sharp edges/faces, custom normals...
+    for attr in sorted(mesh.attributes, key=lambda a: a.name):
+        spec = ATTRIBUTE_FIELDS.get(attr.data_type)
+        if spec is None or attr.name == "position" or attr.name.startswith("."):
+            continue
+        field, width, dtype = spec
+        digest.update(f"{attr.name}|{attr.domain}|{attr.data_type}".encode())
+        values = np.empty(len(attr.data) * width, dtype=dtype)
+        attr.data.foreach_get(field, values)
+        _feed(digest, values)
+
+
+def _feed_deform(digest, ob, mesh, matrix):
+    """Vertex group weights and shape keys, which the FBX carries as skin
+    weights and blend shapes but mesh.attributes doesn't hold"""
+    digest.update("|groups:{}".format("|".join(g.name for g in ob.vertex_groups)).encode())
+    if ob.vertex_groups:
+        counts = np.empty(len(mesh.vertices), dtype=np.int32)
+        groups, weights = [], []
+        for i, vert in enumerate(mesh.vertices):
+            counts[i] = len(vert.groups)
+            for g in vert.groups:
+                groups.append(g.group)
+                weights.append(g.weight)
+        _feed(digest, counts)
+        _feed(digest, np.array(groups, dtype=np.int32))
+        _feed(digest, np.array(weights, dtype=np.float64))
+    shape_keys = ob.data.shape_keys
+    if shape_keys is None:
+        return
+    for key in shape_keys.key_blocks:
+        digest.update(f"|key:{key.name}|{key.relative_key.name}|{key.mute}".encode())
+        co = np.empty(len(key.data) * 3, dtype=np.float32)
+        key.data.foreach_get("co", co)
+        _feed(digest, [key.value, key.slider_min, key.slider_max])
+        # In world space like the mesh, so applying transforms changes nothing
+        _feed(digest, co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3])
+
+
+def _feed_material(digest, material):
+    # Textures are written as file references, so their paths are what counts
+    wrap = PrincipledBSDFWrapper(material, is_readonly=True)
+    for name in MATERIAL_VALUES:
+        value = getattr(wrap, name, None)
+        if value is not None:
+            _feed(digest, np.atleast_1d(np.asarray(value, dtype=np.float64)))
+    for name in MATERIAL_TEXTURES:
+        texture = getattr(wrap, name, None)
+        image = texture.image if texture is not None else None
+        if image is None:
+            digest.update(f"|{name}:".encode())
+            continue
+        digest.update(f"|{name}:{image.filepath}|{texture.texcoords}".encode())
+        _feed(digest, [*texture.translation, *texture.rotation, *texture.scale])
+
+
+def export_hash(context, obj):
+    """Stable hash of everything that goes into an object's FBX.
+
+    Covers every object in the export hierarchy: evaluated mesh (modifiers
+    applied) in world space relative to the root's location, which is what
+    the export writes out, vertex group weights, shape keys, transforms,
+    bones, materials (the Principled BSDF values and texture paths the FBX
+    carries), the modifier stack and the export settings.
+
+    The export applies transforms, so take the hash for the manifest after
+    write_object - hashed before, an object with rotation or scale would
+    never match again.
+    """
+    digest = hashlib.sha256()
+    scene = context.scene
+    digest.update(f"v{HASH_VERSION}|{scene.apply_transform}|{scene.vertex_color_space}".encode())
+    depsgraph = context.evaluated_depsgraph_get()
+    origin = np.array(obj.matrix_world.translation)
+    for ob in export_hierarchy(obj):
+        matrix = np.array(ob.matrix_world, dtype=np.float64)
+        matrix[:3, 3] -= origin
+        digest.update(f"|{ob.name}|{ob.type}|{ob.parent.name if ob.parent else ''}".encode())
+        _feed(digest, matrix)
+        for slot in ob.material_slots:
+            digest.update(f"|mat:{slot.material.name if slot.material else ''}|{slot.link}".encode())
+            if slot.material is not None:
+                _feed_material(digest, slot.material)
+        for mod in ob.modifiers:
+            digest.update(f"|mod:{mod.name}|{mod.type}|{mod.show_viewport}|{mod.show_render}".encode())
+        if ob.type == 'MESH':
+            ob_eval = ob.evaluated_get(depsgraph)
+            # All layers, as the FBX export asks for, or weights can go missing
+            mesh = ob_eval.to_mesh(preserve_all_data_layers=True, depsgraph=depsgraph)
+            try:
+                _feed_mesh(digest, mesh, matrix)
+                _feed_deform(digest, ob, mesh, matrix)
+            finally:
+                ob_eval.to_mesh_clear()
+        elif ob.type == 'ARMATURE':
+            for bone in ob.data.bones:
+                digest.update(f"|bone:{bone.name}|{bone.parent.name if bone.parent else ''}".encode())
+                _feed(digest, matrix @ np.array(bone.matrix_local, dtype=np.float64))
+    return digest.hexdigest()
+
 class ExportOperator(bpy.types.Operator):
     bl_idname = "object.export_operator"
     bl_label = "🚀 Export"
@@ -45,8 +338,10 @@ class ExportOperator(bpy.types.Operator):
                 colors_type=context.scene.vertex_color_space
             )
             print("Export successful")
+            return True
         except Exception as e:
             print(f"Export failed: {str(e)}")
+            return False
         finally:
             obj.location = original_location
 
@@ -76,33 +371,42 @@ class ExportOperator(bpy.types.Operator):
         
         # Check if the file exists in the main directory
         if os.path.exists(file_path):
-            if not os.access(file_path, os.W_OK):
-                self.report({'ERROR'}, f"⚠️ File exists, but is read-only: {file_path}. Did you forget to check it out?")
-                return False
-            self.report({'INFO'}, f"✔️ Updating existing file: {file_path}")
-            self.write_object(context, obj, file_path)
-        else:
-            # File does not exist - Check subdirectories
-            found = False
-            for root, dirs, files in os.walk(directory_path):
-                for file in files:
-                    if file == file_name:
-                        subdirectory_file_path = os.path.join(root, file)
-                        if not os.access(subdirectory_file_path, os.W_OK):
-                            self.report({'ERROR'}, f"⚠️ File exists, but is read-only: {subdirectory_file_path}. Did you forget to check it out?")
-                            return False
-                        self.report({'INFO'}, f"✔️ Updating existing file in subdirectory: {subdirectory_file_path}")
-                        self.write_object(context, obj, subdirectory_file_path)
-                        found = True
-                        break
-                if found:
-                    break
-            
-            if not found:
-                # If no existing file found, show confirmation dialog
-                self.finalObj = obj
-                bpy.ops.object.confirm_create_file('INVOKE_DEFAULT', file_path=file_path, obj_name=obj.name)
+            return self.update_file(context, obj, directory_path, file_path, os.access(file_path, os.W_OK),
+                                    f"✔️ Updating existing file: {file_path}")
+
+        # File does not exist - Look it up in the subdirectories
+        existing_path = self.file_index.find(file_name)
+        if existing_path is not None:
+            return self.update_file(context, obj, directory_path, existing_path,
+                                    self.file_index.is_writable(existing_path),
+                                    f"✔️ Updating existing file in subdirectory: {existing_path}")
         
+        # If no existing file found, show confirmation dialog
+        self.finalObj = obj
+        bpy.ops.object.confirm_create_file('INVOKE_DEFAULT', file_path=file_path, obj_name=obj.name)
+        return True
+
+    def update_file(self, context, obj, directory_path, file_path, writable, message):
+        """Write an existing file, unless incremental export finds it up to date
+
+        An up-to-date file is skipped even if it's read-only; only one that
+        needs writing has to be checked out.
+        """
+        incremental = context.scene.incremental_export
+        key = manifest_key(directory_path, file_path)
+        if incremental:
+            entry = self.manifest.get(key, {})
+            if entry.get("stamp") == file_stamp(file_path) and entry.get("hash") == export_hash(context, obj):
+                print(f"⏭️ Unchanged, skipping: {file_path}")
+                self.skipped_count += 1
+                return False
+        if not writable:
+            self.report({'ERROR'}, f"⚠️ File exists, but is read-only: {file_path}. Did you forget to check it out?")
+            return False
+        self.report({'INFO'}, message)
+        if self.write_object(context, obj, file_path) and incremental:
+            # Hashed as the export left it, transforms applied
+            self.manifest[key] = {"hash": export_hash(context, obj), "stamp": file_stamp(file_path)}
         return True
 
     def execute(self, context):
@@ -133,11 +437,23 @@ class ExportOperator(bpy.types.Operator):
         
         # Export each object
         export_count = 0
+        self.skipped_count = 0
+        directory_path = context.scene.directory_path
+        if directory_path.startswith('//'):
+            directory_path = bpy.path.abspath(directory_path)
+        incremental = context.scene.incremental_export and bool(directory_path)
+        self.manifest = load_manifest(directory_path) if incremental else {}
+        # Find every existing file once, instead of walking the tree per object
+        self.file_index = FileIndex(directory_path, context.scene.cache_file_index) if directory_path else None
         for obj in objects_to_export:
             if self.export_single_object(context, obj):
                 export_count += 1
+        if incremental:
+            save_manifest(directory_path, self.manifest)
         
-        if export_count > 0:
+        if self.skipped_count > 0:
+            self.report({'INFO'}, f"✔️ Exported {export_count} object(s), ⏭️ skipped {self.skipped_count} unchanged")
+        elif export_count > 0:
             self.report({'INFO'}, f"✔️ Exported {export_count} object(s)")
         
         return {'FINISHED'}
@@ -198,8 +514,18 @@ class ConfirmCreateFileOperator(bpy.types.Operator):
                 self.report({'INFO'}, f"✔️ Creating new file: {self.file_path}")
             except Exception as e:
                 self.report({'ERROR'}, f"Export failed: {str(e)}")
+                return {'FINISHED'}
             finally:
                 obj.location = original_location
+            if context.scene.incremental_export:
+                # Record it as the export left it, so the next incremental export can skip it
+                directory_path = context.scene.directory_path
+                if directory_path.startswith('//'):
+                    directory_path = bpy.path.abspath(directory_path)
+                files = load_manifest(directory_path)
+                files[manifest_key(directory_path, self.file_path)] = {
+                    "hash": export_hash(context, obj), "stamp": file_stamp(self.file_path)}
+                save_manifest(directory_path, files)
         else:
             self.report({'ERROR'}, "Object not found.")
         return {'FINISHED'}
@@ -295,6 +621,8 @@ class ExportPanel(bpy.types.Panel):
             box.prop(context.scene, "use_topmost_parent", text="Use topmost parent as root")
             box.prop(context.scene, "apply_transform", text="Apply Transform")
             box.prop(context.scene, "vertex_color_space", text="Vertex Colors")
+            box.prop(context.scene, "incremental_export", text="Skip unchanged objects")
+            box.prop(context.scene, "cache_file_index", text="Cache file index")
 
 # List of all classes to register
 classes = (
@@ -335,6 +663,18 @@ def register():
         ],
         default='SRGB'
     )
+    bpy.types.Scene.incremental_export = bpy.props.BoolProperty(
+        name="Skip Unchanged",
+        description="Only re-export objects whose mesh, transforms, materials, modifiers or export "
+                    "settings changed since the last export (tracked in a manifest next to the export directory)",
+        default=False
+    )
+    bpy.types.Scene.cache_file_index = bpy.props.BoolProperty(
+        name="Cache File Index",
+        description="Keep the list of existing files found in the export directory in a file next to it, "
+                    "and reuse it while no folder in the tree has changed",
+        default=False
+    )
 
 def unregister():
     for cls in reversed(classes):
@@ -344,3 +684,5 @@ def unregister():
     del bpy.types.Scene.use_topmost_parent
     del bpy.types.Scene.apply_transform
     del bpy.types.Scene.vertex_color_space
+    del bpy.types.Scene.incremental_export
+    del bpy.types.Scene.cache_file_index
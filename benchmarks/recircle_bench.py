@@ -0,0 +1,498 @@
+"""Benchmarks for ReCircle on synthetic meshes.
+
+Generates cylinders, tori and noisy arcs at a range of scales (10 to 100k loops,
+8 to 4096 verts per loop) and times the hot paths of the add-on, writing the
+results to JSON so two commits can be compared.
+
+Full run, including the bmesh-bound benchmarks (`orient_new_faces`) and whole
+`mesh.recircle` calls on real edit meshes:
+
+    blender --background --factory-startup --python benchmarks/recircle_bench.py -- \\
+        --out bench.json
+
+The pure-NumPy/`mathutils` part (fits, resampling, lofting, ordering) also runs
+under a plain Python that has the `mathutils` wheel installed:
+
+    python benchmarks/recircle_bench.py --out bench.json
+
+Options (after the `--` under Blender):
+
+    --out PATH          where to write the JSON (default: recircle_bench.json)
+    --quick             a tenth of the point budget per benchmark
+    --max-points N      skip any case with more than N points in total
+    --repeat N          timed repeats per case; the best is reported (default 3)
+    --only NAME[,NAME]  only these benchmarks
+    --compare PATH      print each case's time against a previous JSON
+
+The add-on is loaded straight from addons/ReCircle in this checkout, so the
+numbers belong to the working tree, not to whatever version is installed.
+"""
+
+import argparse
+import gc
+import importlib
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+import types
+
+import numpy as np
+
+try:
+    import bpy
+    import bmesh
+except ImportError:
+    bpy = bmesh = None
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.join(HERE, os.pardir, "addons", "ReCircle")
+PACKAGE = "recircle_bench_src"
+
+LOOPS = (10, 100, 1_000, 10_000, 100_000)
+VERTS = (8, 64, 512, 4096)
+SHAPES = ("cylinder", "torus", "arcs")
+SEED = 1234
+
+
+def load_recircle(with_operators):
+    """Import ReCircle's modules from the checkout without its `__init__`.
+
+    The package `__init__` registers menus and needs bpy; a bare package module
+    pointing at the source directory is enough for the relative imports.
+    """
+    pkg = types.ModuleType(PACKAGE)
+    pkg.__path__ = [os.path.abspath(ADDON_DIR)]
+    sys.modules[PACKAGE] = pkg
+    names = ["geometry", "topology"] + (["operators"] if with_operators else [])
+    return types.SimpleNamespace(**{
+        name: importlib.import_module(f"{PACKAGE}.{name}") for name in names})
+
+
+# ---------------------------------------------------------------- generators
+
+def _frames(normals):
+    """An orthonormal (u, v) in-plane pair per unit normal."""
+    helper = np.where(np.abs(normals[:, 2:3]) < 0.9, [[0.0, 0.0, 1.0]],
+                      [[1.0, 0.0, 0.0]])
+    u = np.cross(normals, helper)
+    u /= np.linalg.norm(u, axis=1, keepdims=True)
+    return u, np.cross(normals, u)
+
+
+def _rings(centers, normals, radii, verts, sweep, noise, rng):
+    """(L * verts, 3) points on L circles, each `sweep` radians long."""
+    u, v = _frames(normals)
+    closed = sweep >= 2.0 * math.pi
+    steps = verts if closed else verts - 1
+    phase = rng.uniform(0.0, 2.0 * math.pi, len(centers))[:, None]
+    ang = phase + sweep * np.arange(verts)[None, :] / steps
+    r = radii[:, None] * (1.0 + noise * rng.standard_normal(ang.shape))
+    pts = (centers[:, None, :]
+           + r[..., None] * (np.cos(ang)[..., None] * u[:, None, :]
+                             + np.sin(ang)[..., None] * v[:, None, :]))
+    return pts.reshape(-1, 3)
+
+
+def make_shape(shape, loops, verts, rng):
+    """Synthetic mesh data for one case.
+
+    Returns a dict with `co` (P, 3), packed runs (`starts`, `counts`), whether
+    the runs are `closed`, the run `edges` (E, 2) and, for cylinders and tori,
+    the quad `faces` (F, 4) joining consecutive rings.
+    """
+    if shape == "cylinder":
+        centers = np.zeros((loops, 3))
+        centers[:, 2] = np.linspace(0.0, 0.1 * loops, loops)
+        normals = np.tile([0.0, 0.0, 1.0], (loops, 1))
+        radii = np.ones(loops)
+        sweep, noise, wrap = 2.0 * math.pi, 0.01, False
+    elif shape == "torus":
+        # Minor circles around a major ring: every loop in its own plane.
+        theta = 2.0 * math.pi * np.arange(loops) / loops
+        centers = np.stack([np.cos(theta), np.sin(theta), 0 * theta], axis=1)
+        centers *= max(1.0, 0.05 * loops)
+        normals = np.stack([-np.sin(theta), np.cos(theta), 0 * theta], axis=1)
+        radii = np.full(loops, 0.25)
+        sweep, noise, wrap = 2.0 * math.pi, 0.01, True
+    elif shape == "arcs":
+        centers = rng.uniform(-10.0, 10.0, (loops, 3)) * max(1.0, loops ** 0.5)
+        normals = rng.standard_normal((loops, 3))
+        normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+        radii = rng.uniform(0.5, 2.0, loops)
+        sweep, noise, wrap = math.radians(rng.uniform(60.0, 270.0)), 0.02, None
+    else:
+        raise ValueError(f"unknown shape {shape!r}")
+
+    co = _rings(centers, normals, radii, verts, sweep, noise, rng)
+    closed = wrap is not None
+    counts = np.full(loops, verts, dtype=np.int64)
+    starts = np.arange(loops, dtype=np.int64) * verts
+
+    k = np.arange(verts)
+    nxt = (k + 1) % verts if closed else k[1:]
+    cur = k if closed else k[:-1]
+    edges = (starts[:, None, None]
+             + np.stack([np.broadcast_to(cur, nxt.shape), nxt], axis=-1))
+    edges = edges.reshape(-1, 2)
+
+    faces = None
+    if closed and loops > 1:
+        rows = np.arange(loops if wrap else loops - 1)
+        a, b = starts[rows][:, None], starts[(rows + 1) % loops][:, None]
+        kn = (k + 1) % verts
+        faces = np.stack([a + k, a + kn, b + kn, b + k], axis=-1).reshape(-1, 4)
+    return {"co": co, "starts": starts, "counts": counts, "closed": closed,
+            "edges": edges, "faces": faces}
+
+
+# ---------------------------------------------------------------- benchmarks
+# Each benchmark is (name, point budget, needs, prepare). `prepare(rc, data)`
+# does the untimed set-up and returns the callable to time, or None when the
+# case doesn't apply. A fresh set-up per repeat comes from returning a
+# (setup, run) pair instead; run(setup()) is what gets timed.
+
+def _runs(data):
+    co = data["co"]
+    return [co[s:s + c] for s, c in zip(data["starts"], data["counts"])]
+
+
+def _vectors(rc, data):
+    Vector = rc.geometry.Vector
+    return [[Vector(p) for p in run.tolist()] for run in _runs(data)]
+
+
+def prep_fit_circle(rc, data):
+    runs = _vectors(rc, data)
+    fit_circle = rc.geometry.fit_circle
+    return lambda: [fit_circle(run) for run in runs]
+
+
+def prep_fit_circles_packed(rc, data):
+    co, starts, counts = data["co"], data["starts"], data["counts"]
+    fit = rc.geometry.fit_circles_packed
+    return lambda: fit(co, starts, counts)
+
+
+def prep_fit_circles_geometric(rc, data):
+    co, starts, counts = data["co"], data["starts"], data["counts"]
+    fit = rc.geometry.fit_circles_packed
+    return lambda: fit(co, starts, counts, method="geometric")
+
+
+def prep_resample_ring(rc, data):
+    if not data["closed"]:
+        return None
+    g = rc.geometry
+    runs = _vectors(rc, data)
+    fits = [g.fit_circle(run) for run in runs]
+    count = int(data["counts"][0]) * 3 // 2
+    return lambda: [g.resample_ring(fit[0], fit[1], run, count)
+                    for run, fit in zip(runs, fits)]
+
+
+def prep_resample_arc(rc, data):
+    if data["closed"]:
+        return None
+    g = rc.geometry
+    runs = _vectors(rc, data)
+    fits = [g.fit_circle(run) for run in runs]
+    count = int(data["counts"][0]) * 3 // 2
+    return lambda: [g.resample_arc(fit[0], fit[1], run, count)
+                    for run, fit in zip(runs, fits)]
+
+
+def prep_resample_rings_packed(rc, data):
+    if not data["closed"]:
+        return None
+    g = rc.geometry
+    co, starts, counts = data["co"], data["starts"], data["counts"]
+    fits = g.fit_circles_packed(co, starts, counts)
+    return lambda: g.resample_rings_packed(co, starts, counts, fits)
+
+
+def _bridge(method):
+    def prepare(rc, data):
+        if not data["closed"] or len(data["counts"]) < 2:
+            return None
+        g = rc.geometry
+        runs = _runs(data)
+        # Each ring against its neighbour resampled to half again as many verts:
+        # the unequal case is the one that does real work.
+        pairs = []
+        for ra, rb in zip(runs[:-1:2], runs[1::2]):
+            fit = g.fit_circles_batched([rb])
+            pos_b, _ = g.resample_ring_array(fit["centroid"][0],
+                                             fit["normal"][0], rb,
+                                             len(rb) * 3 // 2)
+            pairs.append((ra, pos_b))
+        return lambda: [g.bridge_face_indices(a, b, method=method)
+                        for a, b in pairs]
+    return prepare
+
+
+def _check_components(result, data):
+    """Fail loudly unless a walk found every run of the case, and nothing else."""
+    cycles, chains, n_bad = result
+    loops = len(data["counts"])
+    want = (loops, 0) if data["closed"] else (0, loops)
+    got = (len(cycles), len(chains))
+    if got != want or n_bad:
+        raise AssertionError(f"expected {want[0]} cycles, {want[1]} chains; got "
+                             f"{got[0]} cycles, {got[1]} chains, {n_bad} bad")
+
+
+def prep_ordered_components(rc, data):
+    # The walk compares vertices by identity, as it does BMVerts; bare ints
+    # past the small-int cache aren't identical to themselves from another row.
+    verts = [object() for _ in range(len(data["co"]))]
+    adj = {}
+    for a, b in data["edges"].tolist():
+        adj.setdefault(verts[a], set()).add(verts[b])
+        adj.setdefault(verts[b], set()).add(verts[a])
+    _check_components(rc.topology.ordered_components(adj), data)
+    return lambda: rc.topology.ordered_components(adj)
+
+
+def prep_ordered_components_indexed(rc, data):
+    edges = data["edges"]
+    _check_components(rc.topology.ordered_components_indexed(edges), data)
+    return lambda: rc.topology.ordered_components_indexed(edges)
+
+
+def _bmesh_of(data, flip_half=False, rng=None):
+    """A bmesh of the case's quads; optionally with half the faces reversed."""
+    bm = bmesh.new()
+    verts = [bm.verts.new(p) for p in data["co"].tolist()]
+    flip = (rng.random(len(data["faces"])) < 0.5 if flip_half
+            else np.zeros(len(data["faces"]), dtype=bool))
+    faces = []
+    for quad, rev in zip(data["faces"].tolist(), flip.tolist()):
+        faces.append(bm.faces.new([verts[i] for i in
+                                   (reversed(quad) if rev else quad)]))
+    return bm, faces
+
+
+def prep_orient_new_faces(rc, data):
+    if data["faces"] is None:
+        return None
+    rng = np.random.default_rng(SEED)
+
+    def setup():
+        bm, faces = _bmesh_of(data, flip_half=True, rng=rng)
+        return bm, faces
+
+    def run(state):
+        bm, faces = state
+        # The first row stands in for pre-existing geometry the strip anchors to.
+        rc.topology.orient_new_faces(faces[int(data["counts"][0]):])
+        bm.free()
+    return setup, run
+
+
+def _recircle(**props):
+    def prepare(rc, data):
+        if props.get("vertex_count") == "x1.5":
+            kwargs = dict(props, vertex_count=int(data["counts"][0]) * 3 // 2)
+        else:
+            kwargs = props
+
+        def setup():
+            return _edit_object(data)
+
+        def run(obj):
+            result = bpy.ops.mesh.recircle(**kwargs)
+            if result != {'FINISHED'}:
+                raise RuntimeError(f"mesh.recircle returned {result}")
+            _drop_object(obj)
+        return setup, run
+    return prepare
+
+
+def _edit_object(data):
+    """A fresh mesh object in Edit Mode with exactly the case's runs selected."""
+    mesh = bpy.data.meshes.new("recircle_bench")
+    faces = data["faces"].tolist() if data["faces"] is not None else []
+    edges = [] if faces else data["edges"].tolist()
+    mesh.from_pydata(data["co"].tolist(), edges, faces)
+    mesh.update()
+
+    # Select the run edges only — on a surface the rungs between rings stay
+    # unselected, as they would after Alt-clicking each loop.
+    run_keys = {tuple(sorted(e)) for e in data["edges"].tolist()}
+    pairs = np.zeros(len(mesh.edges) * 2, dtype=np.int64)
+    mesh.edges.foreach_get("vertices", pairs)
+    sel = np.array([tuple(sorted(p)) in run_keys
+                    for p in pairs.reshape(-1, 2).tolist()])
+    mesh.edges.foreach_set("select", sel)
+    mesh.vertices.foreach_set("select", np.ones(len(mesh.vertices), dtype=bool))
+    mesh.polygons.foreach_set("select", np.zeros(len(mesh.polygons), dtype=bool))
+
+    obj = bpy.data.objects.new("recircle_bench", mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    obj.select_set(True)
+    bpy.context.tool_settings.mesh_select_mode = (False, True, False)
+    bpy.ops.object.mode_set(mode='EDIT')
+    return obj
+
+
+def _drop_object(obj):
+    bpy.ops.object.mode_set(mode='OBJECT')
+    mesh = obj.data
+    bpy.data.objects.remove(obj)
+    bpy.data.meshes.remove(mesh)
+
+
+BENCHMARKS = (
+    ("fit_circle", 200_000, "py", prep_fit_circle),
+    ("fit_circles_packed", 4_000_000, "py", prep_fit_circles_packed),
+    ("fit_circles_packed.geometric", 4_000_000, "py",
+     prep_fit_circles_geometric),
+    ("resample_ring", 200_000, "py", prep_resample_ring),
+    ("resample_arc", 200_000, "py", prep_resample_arc),
+    ("resample_rings_packed", 4_000_000, "py", prep_resample_rings_packed),
+    ("bridge_face_indices.greedy", 500_000, "py", _bridge("greedy")),
+    ("bridge_face_indices.optimal", 100_000, "py", _bridge("optimal")),
+    ("ordered_components", 1_000_000, "py", prep_ordered_components),
+    ("ordered_components_indexed", 4_000_000, "py",
+     prep_ordered_components_indexed),
+    ("orient_new_faces", 200_000, "bmesh", prep_orient_new_faces),
+    ("recircle.round", 500_000, "blender",
+     _recircle(round_to_circle=True)),
+    ("recircle.resample", 200_000, "blender",
+     _recircle(vertex_count="x1.5")),
+)
+
+
+# ------------------------------------------------------------------- runner
+
+def time_case(prepared, repeat):
+    """Best and median wall time of `repeat` runs of a prepared benchmark."""
+    if isinstance(prepared, tuple):
+        setup, run = prepared
+    else:
+        setup, run = None, (lambda _state: prepared())
+    times = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        gc.collect()
+        start = time.perf_counter()
+        run(state)
+        times.append(time.perf_counter() - start)
+    return min(times), float(np.median(times))
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                             capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_all(args):
+    in_blender = bpy is not None and bpy.app.binary_path != ""
+    rc = load_recircle(with_operators=in_blender)
+    registered = []
+    if in_blender:
+        for cls in rc.operators.classes:
+            bpy.utils.register_class(cls)
+            registered.append(cls)
+
+    only = set(args.only.split(",")) if args.only else None
+    scale = 0.1 if args.quick else 1.0
+    available = {"py"} | ({"bmesh", "blender"} if in_blender else set())
+    results = []
+    try:
+        for shape in SHAPES:
+            for loops in LOOPS:
+                for verts in VERTS:
+                    points = loops * verts
+                    if args.max_points and points > args.max_points:
+                        continue
+                    todo = [b for b in BENCHMARKS
+                            if b[2] in available
+                            and points <= b[1] * scale
+                            and (only is None or b[0] in only)]
+                    if not todo:
+                        continue
+                    data = make_shape(shape, loops, verts,
+                                      np.random.default_rng(SEED))
+                    for name, _budget, _needs, prepare in todo:
+                        prepared = prepare(rc, data)
+                        if prepared is None:
+                            continue
+                        best, median = time_case(prepared, args.repeat)
+                        results.append({
+                            "benchmark": name, "shape": shape, "loops": loops,
+                            "verts": verts, "points": points,
+                            "seconds": best, "median_seconds": median,
+                            "repeat": args.repeat,
+                        })
+                        print(f"{name:30s} {shape:9s} {loops:>7d} x {verts:<5d}"
+                              f" {best * 1000.0:10.2f} ms", flush=True)
+    finally:
+        for cls in reversed(registered):
+            bpy.utils.unregister_class(cls)
+
+    return {
+        "commit": _git_commit(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "blender": bpy.app.version_string if in_blender else None,
+        "quick": args.quick,
+        "results": results,
+    }
+
+
+def compare(report, baseline_path):
+    """Print each case against the same case in an earlier report."""
+    with open(baseline_path, encoding="utf-8") as fh:
+        baseline = json.load(fh)
+    key = lambda r: (r["benchmark"], r["shape"], r["loops"], r["verts"])
+    before = {key(r): r["seconds"] for r in baseline["results"]}
+    print(f"\nagainst {baseline_path} ({baseline.get('commit') or '?'}):")
+    for r in report["results"]:
+        old = before.get(key(r))
+        if old is None or old <= 0.0:
+            continue
+        print(f"{r['benchmark']:30s} {r['shape']:9s} {r['loops']:>7d} x "
+              f"{r['verts']:<5d} {old * 1000.0:10.2f} -> "
+              f"{r['seconds'] * 1000.0:10.2f} ms  x{old / r['seconds']:.2f}")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="recircle_bench", description="ReCircle synthetic benchmarks.")
+    parser.add_argument("--out", default="recircle_bench.json")
+    parser.add_argument("--quick", action="store_true")
+    parser.add_argument("--max-points", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", default="")
+    parser.add_argument("--compare", default="")
+    return parser.parse_args(argv)
+
+
+def main():
+    if bpy is not None:
+        # Blender keeps its own arguments; ours come after a lone "--".
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    else:
+        argv = sys.argv[1:]
+    args = parse_args(argv)
+    report = run_all(args)
+    with open(args.out, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"wrote {len(report['results'])} result(s) to {args.out}")
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
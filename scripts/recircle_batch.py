@@ -0,0 +1,368 @@
+"""Re-circle a whole asset library from the command line.
+
+Opens every .blend file given (directories are searched for them), finds the
+edge loops of each mesh that are already nearly circles — the same detection
+as Detect Circles — and either rounds them off on their fitted circles or
+rebuilds them at a new vertex count with `mesh.recircle`, then saves the file
+and records what it did:
+
+    blender --background --factory-startup --python scripts/recircle_batch.py -- \\
+        assets/ --workers 8 --report recircle_report.json
+
+Files are shared out between N Blender processes (`--workers`, default: one per
+CPU core), each started from the same Blender binary and handed its own list;
+the biggest files are dealt out first so the workers finish together. Each
+worker appends one JSON line per file as it goes, so a worker that crashes
+only loses the file it was on, which is reported as an error.
+
+Options (after the `--`):
+
+    PATH [PATH ...]      .blend files, or directories to search for them
+    --recursive          also search the directories' subdirectories
+    --objects NAME[,..]  only these objects (default: every local mesh object)
+    --count N            rebuild the circular loops at N verts (default 0:
+                         round them off, keeping their vertex counts)
+    --fit METHOD         fit for the rebuild: algebraic, geometric or robust
+    --tolerance T        how far a loop may stray from its circle, as a
+                         fraction of the radius (default 0.01)
+    --min-verts N        ignore loops with fewer verts (default 6)
+    --dry-run            detect and report, but change and save nothing
+    --workers N          Blender processes to run (default: CPU count)
+    --report PATH        where to write the JSON report (default:
+                         recircle_report.json)
+
+Rounding works on the mesh data directly; a rebuild needs edit mode, which
+works headless too. Meshes with shape keys are skipped (writing vertex
+positions would leave the keys behind), as is anything linked from a library.
+The add-on is loaded straight from addons/ReCircle in this checkout, as the
+benchmarks do, so no install and no UI are needed.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import types
+
+import numpy as np
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+HERE = os.path.abspath(__file__)
+ADDON_DIR = os.path.join(os.path.dirname(HERE), os.pardir, "addons", "ReCircle")
+PACKAGE = "recircle_batch_src"
+
+
+def load_recircle():
+    """Import ReCircle's modules from the checkout without its `__init__`.
+
+    The package `__init__` registers menus; a bare package module pointing at
+    the source directory is enough for the relative imports.
+    """
+    pkg = types.ModuleType(PACKAGE)
+    pkg.__path__ = [os.path.abspath(ADDON_DIR)]
+    sys.modules[PACKAGE] = pkg
+    return types.SimpleNamespace(**{
+        name: importlib.import_module(f"{PACKAGE}.{name}")
+        for name in ("geometry", "topology", "operators")})
+
+
+def find_blends(paths, recursive):
+    """Every .blend file named by `paths`, sorted, without duplicates."""
+    found = set()
+    for path in paths:
+        if os.path.isfile(path):
+            found.add(os.path.abspath(path))
+            continue
+        for root, dirs, files in os.walk(path):
+            found.update(os.path.abspath(os.path.join(root, name))
+                         for name in files if name.lower().endswith(".blend"))
+            if not recursive:
+                dirs.clear()
+    return sorted(found)
+
+
+def share_out(files, workers):
+    """Split `files` into `workers` lists of about equal total size."""
+    lists = [[] for _ in range(workers)]
+    load = [0] * workers
+    for path in sorted(files, key=os.path.getsize, reverse=True):
+        i = load.index(min(load))
+        lists[i].append(path)
+        load[i] += os.path.getsize(path)
+    return [chunk for chunk in lists if chunk]
+
+
+# ------------------------------------------------------------- one file
+
+def target_objects(names):
+    """(object, problem) for every mesh object to process.
+
+    `problem` is None, or why the object is left alone. A mesh used by several
+    objects is processed once, through the first of them.
+    """
+    if names:
+        objects = [bpy.data.objects.get(name) for name in names]
+    else:
+        objects = [ob for ob in bpy.data.objects if ob.type == 'MESH']
+    seen = set()
+    out = []
+    for name, ob in zip(names or [None] * len(objects), objects):
+        if ob is None:
+            out.append((name, "no such object"))
+        elif ob.type != 'MESH':
+            out.append((ob, "not a mesh"))
+        elif ob.library or ob.data.library:
+            out.append((ob, "linked from a library"))
+        elif ob.data.shape_keys:
+            out.append((ob, "has shape keys"))
+        elif ob.data.name not in seen:
+            seen.add(ob.data.name)
+            out.append((ob, None))
+    return out
+
+
+def round_object(rc, ob, found, dry_run):
+    """Round the found loops in place; returns how many were rounded."""
+    mesh = ob.data
+    if dry_run:
+        return len(rc.operators.disjoint_loops(found))
+    co = rc.topology.mesh_arrays(mesh)["co"]
+    keep, take, new = rc.operators.round_loops(co, found)
+    co[found["verts"][take]] = new
+    mesh.vertices.foreach_set("co", co.astype(np.float32).ravel())
+    mesh.update()
+    return len(keep)
+
+
+def rebuild_object(rc, ob, found, args):
+    """Select the found loops and run `mesh.recircle` on them in edit mode.
+
+    Returns how many loops were rebuilt. Crossing loops are thinned out as for
+    rounding: rebuilding a vert into two circles at once would tear both.
+    """
+    keep = rc.operators.disjoint_loops(found)
+    if args.dry_run or not keep:
+        return len(keep)
+    view_layer = bpy.context.view_layer
+    if view_layer.objects.get(ob.name) is None:
+        raise RuntimeError("not in the view layer")
+    mesh = ob.data
+    take = np.concatenate([np.arange(found["starts"][i],
+                                     found["starts"][i] + found["counts"][i])
+                           for i in keep])
+    vsel = np.zeros(len(mesh.vertices), dtype=bool)
+    esel = np.zeros(len(mesh.edges), dtype=bool)
+    vsel[found["verts"][take]] = True
+    esel[found["edges"][take]] = True
+    mesh.vertices.foreach_set("select", vsel)
+    mesh.edges.foreach_set("select", esel)
+    mesh.polygons.foreach_set("select", np.zeros(len(mesh.polygons), bool))
+
+    tool = bpy.context.scene.tool_settings
+    select_mode = tuple(tool.mesh_select_mode)
+    # Edge select mode, so entering edit mode doesn't also pick up every edge
+    # between two selected verts (the rungs between neighbouring loops).
+    tool.mesh_select_mode = (False, True, False)
+    for other in view_layer.objects.selected:
+        other.select_set(False)
+    view_layer.objects.active = ob
+    ob.select_set(True)
+    bpy.ops.object.mode_set(mode='EDIT')
+    try:
+        result = bpy.ops.mesh.recircle('EXEC_DEFAULT', vertex_count=args.count,
+                                       fit_method=args.fit.upper())
+    finally:
+        bpy.ops.object.mode_set(mode='OBJECT')
+        tool.mesh_select_mode = select_mode
+    return len(keep) if 'FINISHED' in result else 0
+
+
+def process_file(rc, path, args):
+    """Open, Re-circle and save one file; returns its report entry."""
+    start = time.perf_counter()
+    entry = {"file": path, "status": "unchanged", "saved": False,
+             "objects": []}
+    try:
+        bpy.ops.wm.open_mainfile(filepath=path, load_ui=False)
+        changed = 0
+        for ob, problem in target_objects(args.objects):
+            if problem is not None:
+                entry["objects"].append({
+                    "object": ob if isinstance(ob, str) else ob.name,
+                    "skipped": problem})
+                continue
+            arrays = rc.topology.mesh_arrays(ob.data)
+            found = rc.operators.detect_circular_loops(
+                arrays, args.tolerance, args.min_verts)
+            record = {"object": ob.name, "mesh": ob.data.name,
+                      "scanned": found["scanned"],
+                      "circular": len(found["counts"]), "changed": 0}
+            if len(found["counts"]):
+                try:
+                    if args.count > 0:
+                        record["changed"] = rebuild_object(rc, ob, found, args)
+                    else:
+                        record["changed"] = round_object(rc, ob, found,
+                                                         args.dry_run)
+                except RuntimeError as exc:
+                    record["skipped"] = str(exc)
+            changed += record["changed"]
+            entry["objects"].append(record)
+        if changed:
+            entry["status"] = "would change" if args.dry_run else "changed"
+            if not args.dry_run:
+                bpy.ops.wm.save_mainfile()
+                entry["saved"] = True
+    except Exception as exc:        # one bad file mustn't stop the batch
+        entry["status"] = "error"
+        entry["error"] = f"{type(exc).__name__}: {exc}"
+    entry["seconds"] = time.perf_counter() - start
+    return entry
+
+
+def summary(entry):
+    """One line per file for the console."""
+    loops = sum(o.get("changed", 0) for o in entry["objects"])
+    tail = entry.get("error") or (f"{loops} loop(s) in "
+                                  f"{len(entry['objects'])} object(s)")
+    return (f"{entry['status']:>12s}  {entry['seconds']:7.2f} s  "
+            f"{entry['file']}  ({tail})")
+
+
+# ------------------------------------------------------------- the batch
+
+def run_worker(args, files, out_path):
+    """Process `files` in this Blender, appending a JSON line per file."""
+    rc = load_recircle()
+    for cls in rc.operators.classes:
+        bpy.utils.register_class(cls)
+    try:
+        for path in files:
+            entry = process_file(rc, path, args)
+            print(summary(entry), flush=True)
+            with open(out_path, "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(entry) + "\n")
+    finally:
+        for cls in reversed(rc.operators.classes):
+            bpy.utils.unregister_class(cls)
+
+
+def _read_lines(path):
+    entries = []
+    try:
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    entries.append(json.loads(line))
+    except (OSError, ValueError):
+        pass
+    return entries
+
+
+def run_batch(args, files):
+    """Share `files` out to worker Blenders and gather their entries."""
+    workers = max(1, min(args.workers or os.cpu_count() or 1, len(files)))
+    chunks = share_out(files, workers)
+    options = ["--tolerance", repr(args.tolerance),
+               "--min-verts", str(args.min_verts),
+               "--count", str(args.count), "--fit", args.fit]
+    if args.objects:
+        options += ["--objects", ",".join(args.objects)]
+    if args.dry_run:
+        options.append("--dry-run")
+
+    with tempfile.TemporaryDirectory(prefix="recircle_batch_") as tmp:
+        jobs = []
+        for i, chunk in enumerate(chunks):
+            out_path = os.path.join(tmp, f"worker{i}.jsonl")
+            cmd = [bpy.app.binary_path, "--background", "--factory-startup",
+                   "--python", HERE, "--", *options,
+                   "--worker-out", out_path, *chunk]
+            jobs.append((chunk, out_path, subprocess.Popen(cmd)))
+        entries = []
+        for chunk, out_path, proc in jobs:
+            code = proc.wait()
+            done = _read_lines(out_path)
+            entries += done
+            finished = {e["file"] for e in done}
+            for path in chunk:
+                if path not in finished:
+                    entries.append({
+                        "file": path, "status": "error", "saved": False,
+                        "objects": [], "seconds": 0.0,
+                        "error": f"worker exited with code {code} before "
+                                 f"finishing this file"})
+    order = {path: i for i, path in enumerate(files)}
+    entries.sort(key=lambda e: order[e["file"]])
+    return entries
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="recircle_batch",
+        description="Re-circle the circular edge loops of many .blend files.")
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--recursive", action="store_true")
+    parser.add_argument("--objects", default="",
+                        type=lambda s: [n for n in s.split(",") if n])
+    parser.add_argument("--count", type=int, default=0)
+    parser.add_argument("--fit", default="geometric",
+                        choices=("algebraic", "geometric", "robust"))
+    parser.add_argument("--tolerance", type=float, default=0.01)
+    parser.add_argument("--min-verts", type=int, default=6)
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--report", default="recircle_report.json")
+    parser.add_argument("--worker-out", default="", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.count:
+        args.count = max(args.count, 3)
+    return args
+
+
+def main():
+    if bpy is None:
+        sys.exit("recircle_batch: run this under Blender — "
+                 "blender --background --python recircle_batch.py -- ...")
+    # Blender keeps its own arguments; ours come after a lone "--".
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    args = parse_args(argv)
+    if args.worker_out:
+        run_worker(args, args.paths, args.worker_out)
+        return
+
+    files = find_blends(args.paths, args.recursive)
+    if not files:
+        sys.exit("recircle_batch: no .blend files found")
+    start = time.perf_counter()
+    entries = run_batch(args, files)
+    report = {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "blender": bpy.app.version_string,
+        "settings": {"count": args.count, "fit": args.fit,
+                     "tolerance": args.tolerance,
+                     "min_verts": args.min_verts, "dry_run": args.dry_run,
+                     "objects": args.objects},
+        "seconds": time.perf_counter() - start,
+        "files": entries,
+    }
+    with open(args.report, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    by_status = {}
+    for entry in entries:
+        by_status[entry["status"]] = by_status.get(entry["status"], 0) + 1
+    print(f"{len(entries)} file(s): "
+          + ", ".join(f"{n} {status}" for status, n in sorted(by_status.items()))
+          + f" — report in {args.report}")
+
+
+if __name__ == "__main__":
+    main()